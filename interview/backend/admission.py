@@ -0,0 +1,222 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from functools import wraps
+from flask import g, jsonify, make_response
+from config import Config
+from metrics import admission_in_flight, admission_queue_depth, admission_rejected
+
+
+class Admission:
+    """
+    Concurrency limit with a bounded FIFO wait queue for one class of routes.
+
+    At most `concurrency` requests hold a slot; up to `max_queue` more wait
+    for one, for at most `timeout` seconds. Anything beyond that is rejected
+    immediately, so a slow LLM backs requests up here instead of tying up
+    every server thread. A released slot is handed straight to the oldest
+    waiter. Both threads (`acquire`) and coroutines (`acquire_async`) can
+    wait, so one class can be shared by the sync and async apps.
+    """
+
+    def __init__(self, name, concurrency, max_queue, timeout):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._in_flight = 0
+        self._admitted = 0
+        self._queued_total = 0
+        self._rejected = 0
+        self._timed_out = 0
+        # Moving average of how long a slot is held, for Retry-After
+        self._avg_service_seconds = 1.0
+
+    def _try_enter(self, waiter):
+        # Under the lock: take a free slot (True), queue `waiter` (None) or reject (False)
+        if self._in_flight < self.concurrency:
+            self._in_flight += 1
+            self._admitted += 1
+            self._publish()
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            admission_rejected.inc(route_class=self.name, reason='queue_full')
+            return False
+        self._waiters.append(waiter)
+        self._queued_total += 1
+        self._publish()
+        return None
+
+    def _give_up(self, waiter, timed_out=True):
+        # Under the lock, after a wait ended without a slot. If the slot was
+        # handed over in the meantime the waiter keeps it (True).
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return True
+        if timed_out:
+            self._timed_out += 1
+            admission_rejected.inc(route_class=self.name, reason='timeout')
+        self._publish()
+        return False
+
+    def acquire(self):
+        """Blocks until a slot is free. Returns False when the request should be rejected."""
+        waiter = threading.Event()
+        with self._lock:
+            entered = self._try_enter(waiter)
+        if entered is not None:
+            return entered
+        if waiter.wait(self.timeout):
+            return True
+        with self._lock:
+            return self._give_up(waiter)
+
+    async def acquire_async(self):
+        """Awaits a free slot. Returns False when the request should be rejected."""
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        with self._lock:
+            entered = self._try_enter(waiter)
+        if entered is not None:
+            return entered
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter[1]), self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                return self._give_up(waiter)
+        except asyncio.CancelledError:
+            # Client went away while waiting; don't leave a slot with a dead waiter
+            with self._lock:
+                granted = self._give_up(waiter, timed_out=False)
+            if granted:
+                self.release(0.0)
+            raise
+
+    def release(self, held_seconds):
+        with self._lock:
+            self._avg_service_seconds = 0.8 * self._avg_service_seconds + 0.2 * held_seconds
+            if self._waiters:
+                # The slot passes to the oldest waiter; in-flight count is unchanged
+                waiter = self._waiters.popleft()
+                self._admitted += 1
+            else:
+                waiter = None
+                self._in_flight -= 1
+            self._publish()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        elif waiter is not None:
+            loop, future = waiter
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def retry_after(self):
+        """Seconds a rejected client should wait: the time to drain the current queue, at least 1."""
+        with self._lock:
+            backlog = len(self._waiters) + self._in_flight
+            seconds = self._avg_service_seconds * backlog / max(self.concurrency, 1)
+        return max(1, math.ceil(seconds))
+
+    def _publish(self):
+        admission_in_flight.set(self._in_flight, route_class=self.name)
+        admission_queue_depth.set(len(self._waiters), route_class=self.name)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'concurrency': self.concurrency,
+                'maxQueue': self.max_queue,
+                'timeoutSeconds': self.timeout,
+                'inFlight': self._in_flight,
+                'queued': len(self._waiters),
+                'admitted': self._admitted,
+                'queuedTotal': self._queued_total,
+                'rejected': self._rejected,
+                'timedOut': self._timed_out,
+                'avgServiceSeconds': round(self._avg_service_seconds, 3)
+            }
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(True)
+
+
+admissions = {
+    name: Admission(name, limits['concurrency'], limits['queue'], limits['timeout'])
+    for name, limits in Config.ADMISSION_LIMITS.items()
+}
+
+
+def busy_response(admission):
+    # Overload body for a rejected request; `admission` may also be a JobQueue
+    return {
+        'error': 'Server is busy, please retry shortly.',
+        'routeClass': admission.name,
+        'retryAfter': admission.retry_after()
+    }
+
+
+def admit(route_class):
+    """
+    Flask view decorator: runs the view only once its route class admits the
+    request, otherwise answers 429 with Retry-After. A streamed response keeps
+    its slot until the stream is closed, and until any work the view passed
+    to `hold_slot` is done.
+    """
+    admission = admissions[route_class]
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if not admission.acquire():
+                body = busy_response(admission)
+                return jsonify(body), 429, {'Retry-After': str(body['retryAfter'])}
+            start = time.perf_counter()
+            g.admission_holds = []
+            try:
+                response = make_response(view(*args, **kwargs))
+            except Exception:
+                admission.release(time.perf_counter() - start)
+                raise
+            release = _release_when_done(admission, start, g.admission_holds)
+            if response.is_streamed:
+                response.call_on_close(release)
+            else:
+                release()
+            return response
+        return wrapped
+    return decorator
+
+
+def hold_slot(future):
+    """
+    From a view under `admit`: the request keeps its slot until `future` (a
+    concurrent.futures.Future) is done too, e.g. background work that carries
+    on after the client of a streamed response went away.
+    """
+    g.admission_holds.append(future)
+
+
+def _release_when_done(admission, start, futures):
+    # Returns a callable for the end of the response; the slot is released
+    # once it has been called and every future is done
+    remaining = [len(futures) + 1]
+    lock = threading.Lock()
+
+    def done(_=None):
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            admission.release(time.perf_counter() - start)
+
+    for future in futures:
+        future.add_done_callback(done)
+    return done
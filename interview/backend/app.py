@@ -1,16 +1,33 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from werkzeug.security import check_password_hash, generate_password_hash
-from werkzeug.utils import secure_filename
 import os
 import json
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bson import ObjectId
 from bson.errors import InvalidId
 from datetime import datetime
-from score import summary_match
-from parse import extract_text_from_pdf, parse_resume
+from score import match_experts
+from score_store import MatchScoreStore
+from flows import candidate_score_flow, resume_parse_flow, run_flow, top_experts_flow
+from llm_cache import llm_cache
+from llm_gateway import gateway
+from llm_scheduler import run_with_priority, scheduler
+from jobs import JobQueue, QueueFullError
+from config import Config
+from resume_store import ResumeStore
+from db_indexes import ensure_indexes, verify_indexes
+from read_cache import ReadThroughCache
+from singleflight import SingleFlight
+from versions import DataVersions, GLOBAL_KEY, conditional
+from serialization import BSONJSONProvider, compress_response, dumps_text
+from admission import admissions, admit, busy_response, hold_slot
+from metrics import MongoCommandMetrics, http_request_seconds, http_requests_in_flight, registry
+from parse import extract_text_from_pdf, parse_resume, RESUME_PARSE_MODES
 from dotenv import load_dotenv
 import os
 
@@ -18,7 +35,10 @@ import os
 load_dotenv()
 uri = os.getenv("MONGO_URI")
 app = Flask(__name__)
-CORS(app)
+# Responses may contain Mongo documents as-is: ObjectId and datetime are
+# serialized by the provider, so handlers don't convert them
+app.json = BSONJSONProvider(app)
+CORS(app, expose_headers=['X-Next-Cursor', 'ETag'])
 
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf'}
@@ -27,14 +47,128 @@ if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = Config.MAX_UPLOAD_BYTES
 
-client = MongoClient(uri)
-db = client['SIH']
+parse_jobs = JobQueue(
+    'resume-parse',
+    max_workers=Config.PARSE_WORKERS,
+    max_pending=Config.PARSE_QUEUE_MAX,
+    retention_seconds=Config.PARSE_JOB_RETENTION_SECONDS
+)
+
+client = MongoClient(uri, event_listeners=[MongoCommandMetrics()])
+db = client[Config.DB_NAME]
 users_collection = db['User']
 resume_collection = db['UserResume']
 job_openings_collection = db['JobOpening']
 application_collection = db['application']
 employee_collection = db['Employee']
+resume_file_collection = db['ResumeFile']
+match_score_collection = db['MatchScore']
+data_version_collection = db['DataVersion']
+
+resume_store = ResumeStore(resume_file_collection, UPLOAD_FOLDER)
+match_score_store = MatchScoreStore(match_score_collection)
+
+# Blocking implementations of the steps in flows.py; async_app.py has the
+# awaited ones
+flow_steps = {
+    'load_resume': resume_store.get,
+    'extract_text': extract_text_from_pdf,
+    'save_text': resume_store.save_text,
+    'parse_resume': parse_resume,
+    'save_parsed': resume_store.save_parsed,
+    'load_scores': match_score_store.load,
+    'match_experts': match_experts,
+    'save_score': match_score_store.save,
+}
+
+# Validators for the polled read routes. Keys: "jobs" (the job list, including
+# applicant counts and job details shown elsewhere), "job:<id>",
+# "resume:<email>" and "applications:<userId>"; every write below bumps the
+# keys it affects.
+data_versions = DataVersions(data_version_collection)
+
+# Read-through caches for rarely changing data. Job writes below invalidate
+# job_cache; anything that writes to the Employee collection must call
+# invalidate_experts().
+job_cache = ReadThroughCache('jobs', maxsize=Config.JOB_CACHE_SIZE, ttl_seconds=Config.READ_CACHE_TTL_SECONDS)
+expert_cache = ReadThroughCache('experts', maxsize=1, ttl_seconds=Config.READ_CACHE_TTL_SECONDS)
+
+# Identical LLM-bound work already in progress (the same upload being parsed,
+# the same candidate being scored for a job) is joined instead of repeated.
+# Shared with async_app.py.
+parse_flights = SingleFlight('resume-parse')
+score_flights = SingleFlight('candidate-score')
+top_expert_flights = SingleFlight('top-experts')
+
+# Per-route latency and in-flight counts. Routes are labelled by their rule
+# (e.g. /api/job-openings/<job_id>) so label cardinality stays bounded.
+@app.before_request
+def start_request_metrics():
+    g.metrics_start = time.perf_counter()
+    g.metrics_route = request.url_rule.rule if request.url_rule else 'unmatched'
+    http_requests_in_flight.inc(method=request.method, route=g.metrics_route)
+
+@app.after_request
+def record_response_status(response):
+    g.metrics_status = response.status_code
+    return response
+
+@app.after_request
+def compress(response):
+    return compress_response(response, request.accept_encodings)
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    if 'metrics_start' not in g or g.get('metrics_streamed'):
+        return
+    record_request_metrics(request.method, g.metrics_route, g.metrics_start, g.get('metrics_status', 500))
+
+def record_request_metrics(method, route, start, status):
+    http_requests_in_flight.dec(method=method, route=route)
+    http_request_seconds.observe(time.perf_counter() - start, method=method, route=route, status=status)
+
+def stream_metrics():
+    # For a streamed view: teardown runs once the response object is
+    # returned, so the view's generator records the request when it ends
+    # by calling the returned function instead
+    g.metrics_streamed = True
+    method, route, start = request.method, g.metrics_route, g.metrics_start
+    return lambda status=200: record_request_metrics(method, route, start, status)
+
+
+def load_job(job_id):
+    # Cached job document; treat as read-only
+    return job_cache.get(job_id, lambda: job_openings_collection.find_one({'_id': ObjectId(job_id)}))
+
+def load_experts():
+    # Cached expert roster; treat as read-only
+    return expert_cache.get('all', lambda: list(employee_collection.find()))
+
+def invalidate_experts():
+    expert_cache.invalidate()
+
+# Whether the unique (userId, jobId) index on applications was seen at
+# startup. apply_for_job relies on it to reject repeat applications and
+# checks for one itself when it was not.
+unique_applications = False
+
+if Config.ENSURE_INDEXES and ensure_indexes(db):
+    try:
+        missing_indexes = verify_indexes(db)
+        for collection_name, index_name in missing_indexes:
+            print(f"Warning: index {index_name} on {collection_name} is missing")
+        unique_applications = ('application', 'userId_1_jobId_1') not in missing_indexes
+    except PyMongoError as e:
+        print(f"Warning: could not verify indexes: {str(e)}")
+
+
+# Job fields embedded as `jobDetails` in a user's application list
+JOB_DETAIL_FIELDS = ['title', 'company', 'shortDescription', 'pay', 'level']
+
+# Resume fields shown for each applicant in the recruiter's candidate list
+CANDIDATE_RESUME_FIELDS = ['email', 'position', 'phone', 'linkedin', 'github']
 
 
 def allowed_file(filename):
@@ -100,24 +234,74 @@ def parse_resume_route():
     if not allowed_file(resume.filename):
         return jsonify({'success': False, 'message': 'Invalid file type. Only PDF, DOC, and DOCX files are allowed.'}), 400
 
-    filename = secure_filename(f"temp_{os.urandom(8).hex()}_{resume.filename}")
-    resume_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    resume.save(resume_path)
+    mode = request.args.get('mode')
+    if mode and mode not in RESUME_PARSE_MODES:
+        return jsonify({'success': False, 'message': f"Invalid mode. Use one of: {', '.join(RESUME_PARSE_MODES)}."}), 400
+
+    # The upload is parsed straight from memory; nothing is written to disk
+    pdf_bytes = resume.read()
+
+    # Submit/poll mode: hand the file to the worker pool and return a job id
+    if request.args.get('async') == '1':
+        try:
+            job_id = parse_jobs.submit(run_resume_parse, pdf_bytes, mode)
+        except QueueFullError:
+            # Same overload response as admission control, so clients back off alike
+            body = busy_response(parse_jobs)
+            return jsonify({'success': False, **body}), 429, {'Retry-After': str(body['retryAfter'])}
+        return jsonify({
+            'success': True,
+            'jobId': job_id,
+            'statusUrl': f"/api/parse-resume/jobs/{job_id}"
+        }), 202
 
+    return parse_resume_inline(pdf_bytes, mode)
+
+@admit('llm')
+def parse_resume_inline(pdf_bytes, mode):
+    # Parses within the request; limited like the other LLM-bound routes
     try:
-        text = extract_text_from_pdf(resume_path)
-        if not text:
-            raise ValueError("No text extracted from the document")
-        parsed_data = parse_resume(text)
-        os.remove(resume_path)
+        parsed_data = run_resume_parse(pdf_bytes, mode, timings={})
         return jsonify({'success': True, 'parsed_data': parsed_data})
 
     except Exception as e:
-        if os.path.exists(resume_path):
-            os.remove(resume_path)
         print(f"Error during resume parsing: {str(e)}")
         return jsonify({'success': False, 'message': 'Error parsing resume.', 'error': str(e)}), 500
 
+def run_resume_parse(pdf_bytes, mode, timings):
+    # Extracts and parses an uploaded PDF, reusing the stored text and parsed
+    # JSON when the same file has been seen before. Uploads of a file that is
+    # already being parsed in the same mode wait for that parse.
+    mode = mode or Config.RESUME_PARSE_MODE
+    sha256 = resume_store.fingerprint(pdf_bytes)
+    parsed_data, timings['shared'] = parse_flights.do(
+        (sha256, mode), run_flow, resume_parse_flow(pdf_bytes, sha256, mode, timings), flow_steps
+    )
+    return parsed_data
+
+@app.route('/api/parse-resume/jobs/<job_id>', methods=['GET'])
+def get_parse_job(job_id):
+    job = parse_jobs.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found.'}), 404
+
+    response_data = {
+        'success': job['status'] != 'failed',
+        'jobId': job['id'],
+        'status': job['status'],
+        'timings': job['timings']
+    }
+    if job['status'] == 'done':
+        response_data['parsed_data'] = job['result']
+    elif job['status'] == 'failed':
+        response_data['message'] = 'Error parsing resume.'
+        response_data['error'] = job['error']
+    return jsonify(response_data), 200
+
+@app.route('/api/parse-resume/jobs', methods=['GET'])
+def get_parse_job_stats():
+    return jsonify(parse_jobs.stats()), 200
+
 @app.route('/api/submit-interview', methods=['POST'])
 def submit_interview():
     try:
@@ -137,13 +321,11 @@ def submit_interview():
         educations = json.loads(request.form.get('educations', '[]'))
         certifications = json.loads(request.form.get('certifications', '[]'))
 
-        # Resume file handling
+        # Resume file handling: stored once per distinct file content
         resume = request.files.get('resume')
         filename = None
         if resume and allowed_file(resume.filename):
-            filename = secure_filename(f"{name}_{resume.filename}")
-            resume_path = os.path.join(UPLOAD_FOLDER, filename)
-            resume.save(resume_path)
+            filename = resume_store.save_blob(resume.read())
 
         interview_data = {
             'name': name,
@@ -162,10 +344,10 @@ def submit_interview():
         }
 
         result = resume_collection.insert_one(interview_data)
+        data_versions.bump(f"resume:{email}")
         user_id = str(result.inserted_id)
 
         user_data = resume_collection.find_one({'_id': result.inserted_id})
-        user_data['_id'] = str(user_data['_id'])  # Convert ObjectId to string
 
         return jsonify({
             'success': True, 
@@ -195,7 +377,6 @@ def get_user_data(user_id):
         user_data = users_collection.find_one({'_id': user_object_id})
 
         if user_data:
-            user_data['_id'] = str(user_data['_id'])
             user_data.pop('password', None)
 
             # Fetch additional data from resume_collection
@@ -215,14 +396,30 @@ def get_user_data(user_id):
         return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
 
 @app.route('/api/job-openings', methods=['GET'])
+@conditional(data_versions, lambda: ['jobs'])
 def get_job_openings():
     try:
-        job_openings = list(job_openings_collection.find())
-        for job in job_openings:
-            job['_id'] = str(job['_id'])
-            applicant_count = application_collection.count_documents({'jobId': str(job['_id'])})
-            job['applicantCount'] = applicant_count
-        return jsonify(job_openings), 200
+        # Optional pagination (?page=&limit=) and field projection (?fields=title,company)
+        limit = request.args.get('limit', type=int)
+        page = max(1, min(request.args.get('page', 1, type=int), Config.JOB_OPENINGS_MAX_PAGE))
+        fields = [f for f in request.args.get('fields', '').split(',') if f]
+
+        cursor = job_openings_collection.find({}, {field: 1 for field in fields} or None).sort('_id', 1)
+        if limit is not None:
+            limit = max(1, min(limit, Config.JOB_OPENINGS_MAX_LIMIT))
+            cursor = cursor.skip((page - 1) * limit).limit(limit)
+        jobs = list(cursor)
+
+        # One aggregation counts the applications of every job on the page,
+        # matching on the jobId index instead of a lookup per job
+        counts = {doc['_id']: doc['count'] for doc in application_collection.aggregate([
+            {'$match': {'jobId': {'$in': [str(job['_id']) for job in jobs]}}},
+            {'$group': {'_id': '$jobId', 'count': {'$sum': 1}}}
+        ])}
+        for job in jobs:
+            job['applicantCount'] = counts.get(str(job['_id']), 0)
+
+        return jsonify(jobs), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -231,7 +428,9 @@ def create_job_opening():
     try:
         job_data = request.json
         result = job_openings_collection.insert_one(job_data)
-        job_data['_id'] = str(result.inserted_id)
+        job_id = str(result.inserted_id)
+        job_cache.invalidate(job_id)
+        data_versions.bump('jobs', f"job:{job_id}")
         return jsonify(job_data), 201
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -244,6 +443,8 @@ def update_job_opening(job_id):
             {'_id': ObjectId(job_id)},
             {'$set': job_data}
         )
+        job_cache.invalidate(job_id)
+        data_versions.bump('jobs', f"job:{job_id}")
         if result.modified_count:
             return jsonify({'message': 'Job opening updated successfully'}), 200
         else:
@@ -252,11 +453,13 @@ def update_job_opening(job_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/job-openings/<job_id>', methods=['GET'])
+@conditional(data_versions, lambda job_id: [f"job:{job_id}"])
 def get_job_opening(job_id):
     try:
+        # Not through job_cache: the body must be at least as new as the ETag
+        # just computed, and the cache can lag writes made outside the API
         job = job_openings_collection.find_one({'_id': ObjectId(job_id)})
         if job:
-            job['_id'] = str(job['_id'])
             return jsonify(job), 200
         else:
             return jsonify({'error': 'Job not found'}), 404
@@ -267,15 +470,29 @@ def get_job_opening(job_id):
 def get_job_candidates(job_id):
     try:
         candidates = list(application_collection.find({'jobId': job_id}))
+
+        # Batched lookups: one query for all applicant names, one for their resumes
+        user_ids = [ObjectId(c['userId']) for c in candidates if ObjectId.is_valid(c.get('userId'))]
+        names = {
+            str(user['_id']): user.get('name')
+            for user in users_collection.find({'_id': {'$in': user_ids}}, {'name': 1})
+        }
+
+        # Only the fields the candidate list shows, unless ?include=resume asks
+        # for the full documents; otherwise they load on demand via /api/user-resume
+        projection = None
+        if request.args.get('include') != 'resume':
+            projection = {field: 1 for field in CANDIDATE_RESUME_FIELDS}
+        emails = list({c['email'] for c in candidates if c.get('email')})
+        resumes = {}
+        for resume in resume_collection.find({'email': {'$in': emails}}, projection):
+            resumes.setdefault(resume['email'], resume)
+
         for candidate in candidates:
-            candidate['_id'] = str(candidate['_id'])
-            user = users_collection.find_one({'_id': ObjectId(candidate['userId'])})
-            if user:
-                candidate['name'] = user.get('name')
-            resume = resume_collection.find_one({'email': candidate['email']})
-            if resume:
-                candidate['resumeData'] = resume
-                candidate['resumeData']['_id'] = str(candidate['resumeData']['_id'])
+            if candidate.get('userId') in names:
+                candidate['name'] = names[candidate['userId']]
+            if candidate.get('email') in resumes:
+                candidate['resumeData'] = resumes[candidate['email']]
         return jsonify(candidates), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -291,6 +508,7 @@ def select_candidate(job_id):
             {'$set': {'status': 'selected'}}
         )
         if result.modified_count:
+            bump_application(job_id, applicant_email)
             return jsonify({'message': 'Candidate selected successfully'}), 200
         else:
             return jsonify({'message': 'No application found with that email for this job'}), 404
@@ -308,16 +526,26 @@ def reject_candidate(job_id):
             {'$set': {'status': 'rejected'}}
         )
         if result.modified_count:
+            bump_application(job_id, applicant_email)
             return jsonify({'message': 'Candidate rejected successfully'}), 200
         else:
             return jsonify({'message': 'No application found with that email for this job'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+def bump_application(job_id, email):
+    # A status change shows in the applicant's application list
+    application = application_collection.find_one({'jobId': job_id, 'email': email}, {'userId': 1})
+    if application:
+        data_versions.bump(f"applications:{application['userId']}")
    
 @app.route('/api/job-openings/<job_id>', methods=['DELETE'])
 def delete_job_opening(job_id):
     try:
         result = job_openings_collection.delete_one({'_id': ObjectId(job_id)})
+        job_cache.invalidate(job_id)
+        data_versions.bump('jobs', f"job:{job_id}")
+        match_score_store.delete_job(job_id)
         if result.deleted_count:
             return jsonify({'message': 'Job opening deleted successfully'}), 200
         else:
@@ -333,12 +561,10 @@ def apply_for_job(job_id):
         if not user_id or not applicant_email:
             return jsonify({'error': 'User ID and email are required'}), 400
 
-        # Check if the user has already applied
-        existing_application = application_collection.find_one({'userId': user_id, 'jobId': job_id})
-        if existing_application:
+        if not unique_applications and application_collection.find_one({'userId': user_id, 'jobId': job_id}):
             return jsonify({'message': 'You have already applied for this job'}), 400
 
-        # Add the application
+        # Add the application; the unique (userId, jobId) index rejects repeats
         new_application = {
             'userId': user_id,
             'jobId': job_id,
@@ -346,7 +572,12 @@ def apply_for_job(job_id):
             'status': 'applied',
             'appliedAt': datetime.utcnow()
         }
-        result = application_collection.insert_one(new_application)
+        try:
+            result = application_collection.insert_one(new_application)
+        except DuplicateKeyError:
+            return jsonify({'message': 'You have already applied for this job'}), 400
+        # The job's applicant count and the user's application list both change
+        data_versions.bump('jobs', f"applications:{user_id}")
 
         if result.inserted_id:
             return jsonify({'message': 'Application submitted successfully', 'applicationId': str(result.inserted_id)}), 200
@@ -357,31 +588,51 @@ def apply_for_job(job_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/user-applications/<user_id>', methods=['GET'])
+@conditional(data_versions, lambda user_id: [f"applications:{user_id}", 'jobs'])
 def get_user_applications(user_id):
     try:
-        # Fetch user applications
-        user_applications = list(application_collection.find({'userId': user_id}))
-        
-        # Fetch job details for each application
-        for app in user_applications:
-            app['_id'] = str(app['_id'])
-            job = job_openings_collection.find_one({'_id': ObjectId(app['jobId'])})
+        # Cursor-based paging: ?after=<last application id>&limit=<page size>.
+        # When more applications remain, the X-Next-Cursor header holds the
+        # id to pass as `after` for the next page.
+        limit = request.args.get('limit', Config.APPLICATIONS_PAGE_SIZE, type=int)
+        limit = max(1, min(limit, Config.APPLICATIONS_PAGE_SIZE))
+        query = {'userId': user_id}
+        after = request.args.get('after')
+        if after:
+            if not ObjectId.is_valid(after):
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query['_id'] = {'$gt': ObjectId(after)}
+
+        user_applications = list(application_collection.find(query).sort('_id', 1).limit(limit + 1))
+        has_more = len(user_applications) > limit
+        user_applications = user_applications[:limit]
+
+        # Fetch job details for the whole page in one query
+        job_ids = [ObjectId(a['jobId']) for a in user_applications if ObjectId.is_valid(a.get('jobId'))]
+        jobs = {
+            str(job['_id']): job
+            for job in job_openings_collection.find(
+                {'_id': {'$in': job_ids}},
+                {field: 1 for field in JOB_DETAIL_FIELDS}
+            )
+        }
+
+        for application in user_applications:
+            job = jobs.get(application.get('jobId'))
             if job:
-                app['jobDetails'] = {
-                    'title': job.get('title'),
-                    'company': job.get('company'),
-                    'shortDescription': job.get('shortDescription'),
-                    'pay': job.get('pay'),
-                    'level': job.get('level')
-                }
+                application['jobDetails'] = {field: job.get(field) for field in JOB_DETAIL_FIELDS}
             else:
-                app['jobDetails'] = None
+                application['jobDetails'] = None
 
-        return jsonify(user_applications), 200
+        response = jsonify(user_applications)
+        if has_more:
+            response.headers['X-Next-Cursor'] = str(user_applications[-1]['_id'])
+        return response, 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/user-resume', methods=['GET'])
+@conditional(data_versions, lambda: [f"resume:{request.args['email']}"] if request.args.get('email') else None)
 def get_user_resume():
     email = request.args.get('email')
     if not email:
@@ -390,7 +641,6 @@ def get_user_resume():
     try:
         user_resume = resume_collection.find_one({'email': email})
         if user_resume:
-            user_resume['_id'] = str(user_resume['_id'])
             return jsonify(user_resume), 200
         else:
             return jsonify({'error': 'User resume not found'}), 404
@@ -398,13 +648,14 @@ def get_user_resume():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/score-candidate/<job_id>/<candidate_email>', methods=['GET'])
+@admit('llm')
 def score_candidate(job_id, candidate_email):
     try:
         # Log the incoming request
         print(f"Received request for job_id: {job_id}, candidate_email: {candidate_email}")
 
         # Fetch job details
-        job = job_openings_collection.find_one({'_id': ObjectId(job_id)})
+        job = load_job(job_id)
         if not job:
             print(f"Job not found for id: {job_id}")
             return jsonify({'error': 'Job not found'}), 404
@@ -419,39 +670,11 @@ def score_candidate(job_id, candidate_email):
         
         print(f"Candidate resume found for: {candidate_resume['name']}")
 
-        # Use the full description from the job posting
-        job_description = job['fullDescription']
-        
         # Get all experts from the Employee collection
-        experts = list(employee_collection.find())
+        experts = load_experts()
         print(f"Found {len(experts)} experts")
 
-        # Calculate match result for each expert
-        expert_results = []
-        for expert in experts:
-            try:
-                match_result = summary_match(candidate_resume, job_description, expert)
-                scores = parse_scores(match_result)
-                expert_results.append({
-                    'name': expert['name'],
-                    'position': expert['position'],
-                    'score': scores.get('Overall Score', 0)
-                })
-            except Exception as e:
-                print(f"Error calculating match for expert {expert['name']}: {str(e)}")
-
-        # Sort experts by score and get top 5
-        top_experts = sorted(expert_results, key=lambda x: x['score'], reverse=True)[:5]
-
-        final_match_result = summary_match(candidate_resume, job_description, None)
-        final_scores = parse_scores(final_match_result)
-        
-        response_data = {
-            'matchResult': final_scores,
-            'candidateName': candidate_resume['name'],
-            'jobTitle': job['title'],
-            'topExperts': top_experts
-        }
+        response_data = score_candidate_once(job_id, job, candidate_resume, experts)
         print("Successfully calculated scores and experts")
         return jsonify(response_data), 200
 
@@ -460,23 +683,84 @@ def score_candidate(job_id, candidate_email):
         print(traceback.format_exc())
         return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
 
-def parse_scores(match_result):
-    # Helper function to parse scores from the match_result string
-    scores = {}
-    for line in match_result.split('\n'):
-        if ':' in line:
-            key, value = line.split(':')
-            try:
-                scores[key.strip()] = float(value.strip().split('/')[0])
-            except ValueError:
-                print(f"Error parsing score: {line}")
-    return scores
+def score_candidate_once(job_id, job, candidate_resume, experts):
+    # Requests for a job and candidate that is already being scored (a panel
+    # opening the same candidate, a client retry, bulk scoring) share that run
+    response_data, _ = score_flights.do(
+        (job_id, candidate_resume['email']), compute_candidate_score, job_id, job, candidate_resume, experts
+    )
+    return response_data
+
+def compute_candidate_score(job_id, job, candidate_resume, experts):
+    # The overall match plus the top experts; stored scores are reused when inputs are unchanged
+    return run_flow(candidate_score_flow(job_id, job, candidate_resume, experts), flow_steps)
+
+@app.route('/api/job-openings/<job_id>/score-candidates', methods=['POST'])
+@admit('bulk')
+def score_all_candidates(job_id):
+    # Scores every applicant of a job and streams one NDJSON line per candidate
+    # as it finishes. Scores are persisted as they complete and queued and
+    # running work carries on if the client disconnects, holding the bulk
+    # admission slot until it is done. Re-running the request resumes:
+    # finished candidates are served from the score store without LLM calls.
+    try:
+        job = load_job(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+
+        emails = list(dict.fromkeys(
+            a['email'] for a in application_collection.find({'jobId': job_id}, {'email': 1}) if a.get('email')
+        ))
+        resumes = {}
+        for resume in resume_collection.find({'email': {'$in': emails}}):
+            resumes.setdefault(resume['email'], resume)
+        experts = load_experts()
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+    executor = ThreadPoolExecutor(max_workers=Config.BULK_SCORE_CONCURRENCY, thread_name_prefix="bulk-score")
+    futures = {
+        # Bulk LLM calls yield to interactive parsing and scoring
+        executor.submit(run_with_priority, 'bulk', score_candidate_once, job_id, job, resumes[email], experts): email
+        for email in emails if email in resumes
+    }
+    # Queued candidates still run after this; the pool's threads exit once they are done
+    executor.shutdown(wait=False)
+    for future in futures:
+        hold_slot(future)
+
+    finish_metrics = stream_metrics()
+
+    def generate():
+        try:
+            for email in emails:
+                if email not in resumes:
+                    yield dumps_text({'email': email, 'status': 'error', 'error': 'Candidate resume not found'}) + '\n'
+
+            scored = 0
+            for future in as_completed(futures):
+                email = futures[future]
+                try:
+                    line = {'email': email, 'status': 'done', **future.result()}
+                    scored += 1
+                except Exception as e:
+                    print(f"Error scoring {email} for job {job_id}: {str(e)}")
+                    line = {'email': email, 'status': 'error', 'error': str(e)}
+                yield dumps_text(line) + '\n'
+
+            yield dumps_text({'status': 'complete', 'jobId': job_id, 'candidates': len(emails), 'scored': scored}) + '\n'
+        finally:
+            # Latency covers the whole stream, up to the last line or a disconnect
+            finish_metrics()
+
+    return Response(generate(), mimetype='application/x-ndjson')
 
 @app.route('/api/top-experts/<job_id>/<candidate_email>', methods=['GET'])
+@admit('llm')
 def get_top_experts(job_id, candidate_email):
     try:
         # Fetch job details
-        job = job_openings_collection.find_one({'_id': ObjectId(job_id)})
+        job = load_job(job_id)
         if not job:
             return jsonify({'error': 'Job not found'}), 404
 
@@ -485,31 +769,57 @@ def get_top_experts(job_id, candidate_email):
         if not candidate_resume:
             return jsonify({'error': 'Candidate resume not found'}), 404
 
-        # Fetch all experts
-        experts = list(employee_collection.find())
-
-        # Calculate scores for each expert
-        expert_scores = []
-        for expert in experts:
-            expert_profile = f"Name: {expert['name']}, Position: {expert['position']}, Skills: {', '.join(expert['skills'])}"
-            match_result = summary_match(candidate_resume['skills'], job['fullDescription'], expert_profile)
-            
-            # Parse the overall score from the match_result
-            overall_score = float(match_result.split('Overall Score: ')[1].split('/')[0])
-            
-            expert_scores.append({
-                'name': expert['name'],
-                'score': overall_score,
-                'position': expert['position']
-            })
-
-        top_experts = nlargest(5, expert_scores, key=lambda x: x['score'])
-
+        # Fetch all experts; concurrent requests for the same candidate share one run
+        experts = load_experts()
+        top_experts, _ = top_expert_flights.do(
+            (job_id, candidate_email), compute_top_experts, job_id, job, candidate_resume, experts
+        )
         return jsonify(top_experts), 200
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def compute_top_experts(job_id, job, candidate_resume, experts):
+    # Shortlisted experts scored concurrently, reusing stored scores
+    return run_flow(top_experts_flow(job_id, job, candidate_resume, experts), flow_steps)
+
+@app.route('/api/llm-cache/stats', methods=['GET'])
+def get_llm_cache_stats():
+    return jsonify(llm_cache.stats()), 200
+
+@app.route('/api/read-cache/stats', methods=['GET'])
+def get_read_cache_stats():
+    return jsonify({cache.name: cache.stats() for cache in (job_cache, expert_cache)}), 200
+
+@app.route('/api/read-cache/invalidate', methods=['POST'])
+def invalidate_read_cache():
+    # For out-of-band writes, e.g. importing employees straight into Mongo
+    job_cache.invalidate()
+    invalidate_experts()
+    # Clients' cached copies of the read routes are revalidated too
+    data_versions.bump(GLOBAL_KEY)
+    return jsonify({'message': 'Caches invalidated'}), 200
+
+@app.route('/api/llm-gateway/stats', methods=['GET'])
+def get_llm_gateway_stats():
+    return jsonify(gateway.stats()), 200
+
+@app.route('/api/llm-scheduler/stats', methods=['GET'])
+def get_llm_scheduler_stats():
+    return jsonify(scheduler.stats()), 200
+
+@app.route('/api/singleflight/stats', methods=['GET'])
+def get_singleflight_stats():
+    return jsonify({flights.name: flights.stats() for flights in (parse_flights, score_flights, top_expert_flights)}), 200
+
+@app.route('/api/admission/stats', methods=['GET'])
+def get_admission_stats():
+    return jsonify({name: admission.stats() for name, admission in admissions.items()}), 200
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    return Response(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Async serving mode for the LLM-bound routes.
+
+/api/parse-resume, /api/score-candidate and /api/top-experts are served by a
+Quart app that uses AsyncMongoClient and awaits LLM calls, so a request
+waiting on Groq holds no thread and one process can keep hundreds of calls
+in flight. Every other route is passed to the Flask app in app.py unchanged;
+it runs in a thread pool as before and shares its caches, parse job queue
+and metrics with the async routes.
+
+LLM-bound work already in flight is shared across both apps: a request here
+joins an identical parse or scoring run started by a Flask request, and the
+reverse.
+
+Run with:
+    hypercorn async_app:application --bind localhost:5000
+or:
+    python async_app.py
+"""
+import asyncio
+import time
+import traceback
+from functools import wraps
+from bson import ObjectId
+from hypercorn.middleware import AsyncioWSGIMiddleware
+from pymongo import AsyncMongoClient
+from quart import Quart, g, request, jsonify
+from quart_cors import cors
+from werkzeug.exceptions import HTTPException
+from app import (
+    app as flask_app, uri, allowed_file, job_cache, expert_cache, parse_jobs, run_resume_parse,
+    parse_flights, score_flights, top_expert_flights
+)
+from admission import admissions, busy_response
+from config import Config
+from flows import arun_flow, candidate_score_flow, resume_parse_flow, top_experts_flow
+from jobs import QueueFullError
+from metrics import MongoCommandMetrics, http_request_seconds, http_requests_in_flight
+from parse import aparse_resume, extract_text_from_pdf, RESUME_PARSE_MODES
+from resume_store import AsyncResumeStore
+from score import amatch_experts
+from score_store import AsyncMatchScoreStore
+from serialization import BSONJSONProvider
+
+async_api = cors(Quart(__name__, static_folder=None))
+async_api.json = BSONJSONProvider(async_api)
+async_api.config['MAX_CONTENT_LENGTH'] = Config.MAX_UPLOAD_BYTES
+
+client = AsyncMongoClient(uri, event_listeners=[MongoCommandMetrics()])
+db = client[Config.DB_NAME]
+resume_collection = db['UserResume']
+job_openings_collection = db['JobOpening']
+employee_collection = db['Employee']
+
+resume_store = AsyncResumeStore(db['ResumeFile'])
+match_score_store = AsyncMatchScoreStore(db['MatchScore'])
+
+# Awaited implementations of the steps in flows.py; PyMuPDF runs in a worker thread
+flow_steps = {
+    'load_resume': resume_store.get,
+    'extract_text': lambda pdf_bytes: asyncio.to_thread(extract_text_from_pdf, pdf_bytes),
+    'save_text': resume_store.save_text,
+    'parse_resume': aparse_resume,
+    'save_parsed': resume_store.save_parsed,
+    'load_scores': match_score_store.load,
+    'match_experts': amatch_experts,
+    'save_score': match_score_store.save,
+}
+
+
+@async_api.after_serving
+async def close_mongo():
+    await client.close()
+
+@async_api.before_request
+async def start_request_metrics():
+    g.metrics_start = time.perf_counter()
+    g.metrics_route = request.url_rule.rule if request.url_rule else 'unmatched'
+    http_requests_in_flight.inc(method=request.method, route=g.metrics_route)
+
+@async_api.after_request
+async def record_response_status(response):
+    g.metrics_status = response.status_code
+    return response
+
+@async_api.teardown_request
+async def finish_request_metrics(exc):
+    if 'metrics_start' not in g:
+        return
+    http_requests_in_flight.dec(method=request.method, route=g.metrics_route)
+    http_request_seconds.observe(
+        time.perf_counter() - g.metrics_start,
+        method=request.method, route=g.metrics_route, status=g.get('metrics_status', 500)
+    )
+
+
+def admit_async(route_class):
+    # Async counterpart of admission.admit: waiting requests hold no thread
+    admission = admissions[route_class]
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapped(*args, **kwargs):
+            if not await admission.acquire_async():
+                body = busy_response(admission)
+                return jsonify(body), 429, {'Retry-After': str(body['retryAfter'])}
+            start = time.perf_counter()
+            try:
+                return await view(*args, **kwargs)
+            finally:
+                admission.release(time.perf_counter() - start)
+        return wrapped
+    return decorator
+
+async def load_job(job_id):
+    # Shares app.py's job cache, so job writes made through Flask invalidate it
+    return await job_cache.aget(job_id, lambda: job_openings_collection.find_one({'_id': ObjectId(job_id)}))
+
+async def load_experts():
+    return await expert_cache.aget('all', lambda: employee_collection.find().to_list())
+
+@async_api.route('/api/parse-resume', methods=['POST'])
+async def parse_resume_route():
+    files = await request.files
+    if 'resume' not in files:
+        return jsonify({'success': False, 'message': 'No resume file provided.'}), 400
+
+    resume = files['resume']
+    if resume.filename == '':
+        return jsonify({'success': False, 'message': 'No selected file.'}), 400
+
+    if not allowed_file(resume.filename):
+        return jsonify({'success': False, 'message': 'Invalid file type. Only PDF, DOC, and DOCX files are allowed.'}), 400
+
+    mode = request.args.get('mode')
+    if mode and mode not in RESUME_PARSE_MODES:
+        return jsonify({'success': False, 'message': f"Invalid mode. Use one of: {', '.join(RESUME_PARSE_MODES)}."}), 400
+
+    pdf_bytes = resume.read()
+
+    # Submit/poll mode uses the same worker pool and job status routes as the Flask app
+    if request.args.get('async') == '1':
+        try:
+            job_id = parse_jobs.submit(run_resume_parse, pdf_bytes, mode)
+        except QueueFullError:
+            # Same overload response as admission control, so clients back off alike
+            body = busy_response(parse_jobs)
+            return jsonify({'success': False, **body}), 429, {'Retry-After': str(body['retryAfter'])}
+        return jsonify({
+            'success': True,
+            'jobId': job_id,
+            'statusUrl': f"/api/parse-resume/jobs/{job_id}"
+        }), 202
+
+    return await parse_resume_inline(pdf_bytes, mode)
+
+@admit_async('llm-async')
+async def parse_resume_inline(pdf_bytes, mode):
+    try:
+        parsed_data = await run_resume_parse_async(pdf_bytes, mode)
+        return jsonify({'success': True, 'parsed_data': parsed_data})
+
+    except Exception as e:
+        print(f"Error during resume parsing: {str(e)}")
+        return jsonify({'success': False, 'message': 'Error parsing resume.', 'error': str(e)}), 500
+
+async def run_resume_parse_async(pdf_bytes, mode):
+    # Same flow as app.run_resume_parse, joining parses in flight on either app
+    mode = mode or Config.RESUME_PARSE_MODE
+    sha256 = resume_store.fingerprint(pdf_bytes)
+    parsed_data, _ = await parse_flights.do_async(
+        (sha256, mode), arun_flow, resume_parse_flow(pdf_bytes, sha256, mode, {}), flow_steps
+    )
+    return parsed_data
+
+@async_api.route('/api/score-candidate/<job_id>/<candidate_email>', methods=['GET'])
+@admit_async('llm-async')
+async def score_candidate(job_id, candidate_email):
+    try:
+        job = await load_job(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+
+        candidate_resume = await resume_collection.find_one({'email': candidate_email})
+        if not candidate_resume:
+            return jsonify({'error': 'Candidate resume not found'}), 404
+
+        experts = await load_experts()
+        response_data, _ = await score_flights.do_async(
+            (job_id, candidate_email), compute_candidate_score, job_id, job, candidate_resume, experts
+        )
+        return jsonify(response_data), 200
+
+    except Exception as e:
+        print(f"Error in score_candidate: {str(e)}")
+        print(traceback.format_exc())
+        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+
+async def compute_candidate_score(job_id, job, candidate_resume, experts):
+    return await arun_flow(candidate_score_flow(job_id, job, candidate_resume, experts), flow_steps)
+
+@async_api.route('/api/top-experts/<job_id>/<candidate_email>', methods=['GET'])
+@admit_async('llm-async')
+async def get_top_experts(job_id, candidate_email):
+    try:
+        job = await load_job(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+
+        candidate_resume = await resume_collection.find_one({'email': candidate_email})
+        if not candidate_resume:
+            return jsonify({'error': 'Candidate resume not found'}), 404
+
+        top_experts, _ = await top_expert_flights.do_async(
+            (job_id, candidate_email), compute_top_experts, job_id, job, candidate_resume, await load_experts()
+        )
+        return jsonify(top_experts), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+async def compute_top_experts(job_id, job, candidate_resume, experts):
+    return await arun_flow(top_experts_flow(job_id, job, candidate_resume, experts), flow_steps)
+
+
+# The middleware buffers bodies and caps them at 64 KiB unless told otherwise
+flask_asgi = AsyncioWSGIMiddleware(flask_app, max_body_size=Config.MAX_UPLOAD_BYTES)
+_async_routes = async_api.url_map.bind('')
+
+def serves_async(path, method):
+    try:
+        _async_routes.match(path, method=method)
+        return True
+    except HTTPException:
+        return False
+
+async def application(scope, receive, send):
+    """ASGI entry point: the async routes go to Quart, everything else to Flask."""
+    if scope['type'] == 'http' and not serves_async(scope['path'], scope['method']):
+        await flask_asgi(scope, receive, send)
+    else:
+        await async_api(scope, receive, send)
+
+
+if __name__ == '__main__':
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config as HypercornConfig
+
+    hypercorn_config = HypercornConfig()
+    hypercorn_config.bind = ['localhost:5000']
+    asyncio.run(serve(application, hypercorn_config))
@@ -0,0 +1,152 @@
+"""A stand-in for ChatGroq with simulated latency and canned responses, for offline benchmarks."""
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Any, List, Optional
+import groq
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from llm_scheduler import TokenBucket
+from tokens import count_tokens
+
+PARSE_RESPONSE = json.dumps({
+    "Name": "Priya Sharma",
+    "Email": "priya.sharma@example.com",
+    "Phone": "+91 98765 43210",
+    "Position": "Backend Engineer",
+    "LinkedIn URL": "linkedin.com/in/priyasharma",
+    "GitHub URL": "github.com/priyas",
+    "Skills": ["Python", "Go", "SQL", "Flask", "MongoDB", "Redis", "Kafka", "AWS", "Docker"],
+    "Experiences": [
+        {"Company": "Finlytics", "Duration": "Jan 2022 - Present", "Responsibilities": [
+            "Built a payments reconciliation service processing 2M transactions/day with Flask and Kafka.",
+            "Cut p95 API latency from 900ms to 180ms by adding Redis caching and query indexes."]},
+        {"Company": "CodeNest", "Duration": "Jul 2020 - Dec 2021", "Responsibilities": [
+            "Developed REST APIs for a learning platform used by 50k students."]}
+    ],
+    "Education": [{"Degree": "B.Tech in Computer Science", "Institution": "IIT Roorkee", "Year": "2020"}],
+    "Projects": [{"Name": "QueryLens", "Details": ["SQL query plan visualiser built with React and Go."]}],
+    "Certifications": ["AWS Certified Developer - Associate"],
+    "Cover Letter": ""
+}, indent=2)
+
+SUMMARY_RESPONSE = json.dumps({
+    "Summary": "Backend engineer with four years of Python services experience.",
+    "Strengths": ["Distributed systems", "Performance tuning"],
+    "Recommendation": "Proceed to technical interview"
+}, indent=2)
+
+
+def score_response(rng):
+    scores = [rng.randint(40, 95) for _ in range(3)]
+    return json.dumps({
+        "Matching Similarity Score": scores[0],
+        "Relevancy Score": scores[1],
+        "Profile Score": scores[2],
+        "Overall Score": round(sum(scores) / 3),
+        "Recommendation": "Schedule the interview with this expert.",
+        "Summary": "The candidate's backend and data skills align with the role and the expert's domain."
+    })
+
+
+class FakeQuota:
+    """
+    Provider-side quotas of `rpm` requests and `tpm` prompt plus response
+    tokens per minute, replenished continuously as Groq's rate limit reset
+    headers describe. A call over either limit is refused with a 429 whose
+    Retry-After says when it would fit.
+    """
+
+    def __init__(self, rpm=None, tpm=None):
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self.accepted = 0
+        self.rejected = 0
+
+    def charge(self, model, tokens):
+        with self._lock:
+            now = time.monotonic()
+            waits = {}
+            for kind, bucket, amount in (('requests', self._requests, 1), ('tokens', self._tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    waits[kind] = bucket.wait_time(amount)
+            kind = max(waits, key=waits.get, default=None)
+            if kind is not None and waits[kind] > 0:
+                self.rejected += 1
+                raise rate_limit_error(model, kind, waits[kind])
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= tokens
+            self.accepted += 1
+
+
+def rate_limit_error(model, kind, retry_after):
+    # Shaped like the error the Groq SDK raises for a 429
+    response = httpx.Response(
+        429,
+        headers={'retry-after': f"{retry_after:.2f}"},
+        request=httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions')
+    )
+    return groq.RateLimitError(
+        f"Rate limit reached for model `{model}` on {kind} per minute", response=response, body=None
+    )
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model that sleeps for `latency` +/- `jitter` seconds (uniformly) and
+    returns a canned response shaped for the prompt it was given: parsed
+    resume JSON, match scores, or a candidate summary. With `rpm` and/or `tpm`
+    set it also enforces provider quotas and answers 429 when they run out.
+    """
+
+    model_name: str = "fake"
+    latency: float = 1.0
+    jitter: float = 0.2
+    seed: Optional[int] = None
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
+    rng: Any = None
+    quota: Any = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.rng = random.Random(self.seed)
+        if self.rpm is not None or self.tpm is not None:
+            self.quota = FakeQuota(self.rpm, self.tpm)
+
+    @property
+    def _llm_type(self):
+        return "fake-chat"
+
+    def respond(self, prompt):
+        if "resume parser" in prompt:
+            return PARSE_RESPONSE
+        if "matching score" in prompt or "assessment of a candidate" in prompt:
+            return score_response(self.rng)
+        return SUMMARY_RESPONSE
+
+    def _prepare(self, messages):
+        # Returns (response text, simulated latency); raises when over quota
+        prompt = "\n".join(str(message.content) for message in messages)
+        content = self.respond(prompt)
+        if self.quota is not None:
+            self.quota.charge(self.model_name, count_tokens(prompt) + count_tokens(content))
+        return content, max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        content, delay = self._prepare(messages)
+        time.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        content, delay = self._prepare(messages)
+        await asyncio.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
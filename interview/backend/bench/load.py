@@ -0,0 +1,299 @@
+"""
+Offline load benchmark: seeds a throwaway database with realistic volumes,
+replaces ChatGroq with a fake that has configurable latency, drives the main
+endpoints concurrently through the Flask app in-process and reports latency
+percentiles and throughput per endpoint as JSON.
+
+Usage (from the backend directory):
+    python -m bench.load                                   # local mongod, default sizes
+    python -m bench.load --in-memory                       # mongomock instead of mongod
+    python -m bench.load --requests 4000 --concurrency 32 --out run.json
+    python -m bench.load --compare baseline.json           # print changes against an earlier run
+
+The app's database is replaced by --db (default SIH_bench), which is dropped
+and reseeded on every run. Query timings under --in-memory say little about a
+real mongod; use one to measure database-bound routes.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ENDPOINTS = ('job-openings', 'job-candidates', 'parse-resume', 'score-candidate')
+DEFAULT_MIX = 'job-openings=4,job-candidates=3,parse-resume=1,score-candidate=2'
+
+FIRST_NAMES = ['Priya', 'Arjun', 'Neha', 'Rahul', 'Ananya', 'Vikram', 'Sneha', 'Karan', 'Meera', 'Rohan',
+               'Aisha', 'Dev', 'Kavya', 'Nikhil', 'Pooja', 'Siddharth', 'Tanvi', 'Varun', 'Isha', 'Aditya']
+LAST_NAMES = ['Sharma', 'Mehta', 'Verma', 'Iyer', 'Kulkarni', 'Reddy', 'Nair', 'Gupta', 'Singh', 'Das']
+SKILLS = ['Python', 'Go', 'Java', 'C++', 'SQL', 'Flask', 'Django', 'FastAPI', 'React', 'MongoDB', 'PostgreSQL',
+          'Redis', 'Kafka', 'AWS', 'Docker', 'Kubernetes', 'PyTorch', 'TensorFlow', 'OpenCV', 'CUDA',
+          'Computer Vision', 'Deep Learning', 'Distributed Systems', 'Real-time Systems', 'Signal Processing',
+          'Embedded C', 'Linux', 'Networking', 'Cryptography', 'Figma', 'User Research', 'Remote Sensing']
+TITLES = ['Software Engineer', 'ML Engineer', 'Embedded Systems Engineer', 'Data Engineer', 'Security Analyst',
+          'Computer Vision Scientist', 'Backend Engineer', 'UX Designer', 'Radar Signal Engineer']
+COMPANIES = ['Finlytics', 'CodeNest', 'VisionWorks Labs', 'GovTech Studio', 'PixelCraft', 'DRDO', 'ISRO', 'BEL']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017', help='local mongod to seed and query')
+    parser.add_argument('--in-memory', action='store_true', help='use mongomock instead of a mongod')
+    parser.add_argument('--db', default='SIH_bench', help='database to drop and seed (never the app database)')
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--resumes', type=int, default=5000)
+    parser.add_argument('--applications', type=int, default=20000)
+    parser.add_argument('--employees', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=1000, help='total requests across all endpoints')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='endpoint weights, e.g. ' + DEFAULT_MIX)
+    parser.add_argument('--llm-latency', type=float, default=0.8, help='mean fake LLM latency in seconds')
+    parser.add_argument('--llm-jitter', type=float, default=0.3, help='uniform +/- jitter in seconds')
+    parser.add_argument('--parse-mode', default='focused', help='?mode= for /api/parse-resume')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='write the report JSON here as well as to stdout')
+    parser.add_argument('--compare', help='earlier report JSON to compare against')
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    # Must run before config/app are imported: both read the environment at import time
+    if args.db == 'SIH':
+        sys.exit("Refusing to seed the app database; pick another --db")
+    os.environ['MONGO_URI'] = args.mongo_uri
+    os.environ['DB_NAME'] = args.db
+    # Every LLM call should pay the simulated latency
+    os.environ['LLM_CACHE_ENABLED'] = '0'
+    # The fake provider has no quotas here; bench.scheduler measures rate limiting
+    os.environ['LLM_SCHEDULER_ENABLED'] = '0'
+    if args.in_memory:
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+
+
+def make_profile(rng, index, domain):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return {
+        'name': name,
+        'email': f"{name.lower().replace(' ', '.')}.{index}@{domain}",
+        'phone': f"9{rng.randint(100000000, 999999999)}",
+        'position': rng.choice(TITLES),
+        'linkedin': f"linkedin.com/in/user{index}",
+        'github': f"github.com/user{index}",
+        'skills': rng.sample(SKILLS, rng.randint(5, 12)),
+        'experiences': [
+            {'company': rng.choice(COMPANIES), 'duration': f"{2024 - n * 2 - 2} - {2024 - n * 2}", 'responsibilities': [
+                f"Delivered {rng.choice(SKILLS)} and {rng.choice(SKILLS)} work for a team of {rng.randint(3, 20)}.",
+                f"Improved {rng.choice(['latency', 'throughput', 'accuracy', 'reliability'])} by {rng.randint(5, 60)}%."]}
+            for n in range(rng.randint(1, 3))
+        ],
+        'projects': [{'name': f"Project {index}", 'details': [f"Built with {', '.join(rng.sample(SKILLS, 3))}."]}],
+        'educations': [{'degree': 'B.Tech in Computer Science', 'institution': 'IIT Delhi', 'year': str(rng.randint(2005, 2023))}],
+        'certifications': []
+    }
+
+
+def seed(db, args, rng):
+    """Drops and refills the benchmark database. Returns the ids the request plan draws from."""
+    from bson import ObjectId
+    for name in db.list_collection_names():
+        db.drop_collection(name)
+
+    jobs = [{
+        'title': rng.choice(TITLES),
+        'company': 'DRDO',
+        'shortDescription': f"Opening {i} for defence software systems.",
+        'fullDescription': (
+            f"As a {rng.choice(TITLES)} at DRDO you will design and maintain systems using "
+            f"{', '.join(rng.sample(SKILLS, 6))} for defence applications."
+        ),
+        'pay': f"{rng.randint(8, 30)} LPA",
+        'level': rng.choice(['Junior', 'Mid', 'Senior'])
+    } for i in range(args.jobs)]
+    job_ids = [str(i) for i in db['JobOpening'].insert_many(jobs).inserted_ids]
+
+    resumes = [make_profile(rng, i, 'example.com') for i in range(args.resumes)]
+    db['UserResume'].insert_many(resumes)
+    users = [{'_id': ObjectId(), 'name': r['name'], 'email': r['email'], 'role': 'candidate'} for r in resumes]
+    db['User'].insert_many(users)
+
+    db['Employee'].insert_many([make_profile(rng, i, 'drdo.example') for i in range(args.employees)])
+
+    pairs = set()
+    while len(pairs) < min(args.applications, args.jobs * args.resumes):
+        pairs.add((rng.randrange(args.jobs), rng.randrange(args.resumes)))
+    applications = [{
+        'userId': str(users[r]['_id']),
+        'jobId': job_ids[j],
+        'email': resumes[r]['email'],
+        'status': 'applied'
+    } for j, r in sorted(pairs)]
+    db['application'].insert_many(applications)
+
+    return {
+        'jobIds': job_ids,
+        'applications': [(a['jobId'], a['email']) for a in applications]
+    }
+
+
+def make_pdfs(count, rng):
+    """Distinct resume PDFs, so uploads are not served from the resume store."""
+    import fitz
+    from bench.samples import RESUME_TEXTS
+    pdfs = []
+    for i in range(count):
+        doc = fitz.open()
+        page = doc.new_page()
+        text = rng.choice(RESUME_TEXTS).strip() + f"\nReference: bench-{i}-{rng.random()}"
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=8)
+        pdfs.append(doc.tobytes())
+        doc.close()
+    return pdfs
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ENDPOINTS:
+            sys.exit(f"Unknown endpoint in --mix: {name}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def build_plan(args, ids, rng):
+    """The request sequence: (endpoint, method, path, pdf bytes or None)."""
+    weights = parse_mix(args.mix)
+    names = rng.choices(list(weights), weights=list(weights.values()), k=args.requests)
+    pdfs = iter(make_pdfs(names.count('parse-resume'), rng))
+    pages = max(1, len(ids['jobIds']) // 20)
+    plan = []
+    for name in names:
+        if name == 'job-openings':
+            plan.append((name, 'GET', f"/api/job-openings?page={rng.randint(1, pages)}&limit=20", None))
+        elif name == 'job-candidates':
+            plan.append((name, 'GET', f"/api/job-openings/{rng.choice(ids['jobIds'])}/candidates", None))
+        elif name == 'parse-resume':
+            plan.append((name, 'POST', f"/api/parse-resume?mode={args.parse_mode}", next(pdfs)))
+        else:
+            job_id, email = rng.choice(ids['applications'])
+            plan.append((name, 'GET', f"/api/score-candidate/{job_id}/{email}", None))
+    return plan
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(app, plan, concurrency):
+    import io
+
+    def send(item):
+        name, method, path, pdf = item
+        client = app.test_client()
+        start = time.perf_counter()
+        if pdf is None:
+            response = client.open(path, method=method)
+        else:
+            response = client.post(path, data={'resume': (io.BytesIO(pdf), 'resume.pdf')},
+                                   content_type='multipart/form-data')
+        response.get_data()
+        return name, response.status_code, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench-load") as executor:
+        results = list(executor.map(send, plan))
+    return results, time.perf_counter() - start
+
+
+def summarize(results, wall_seconds):
+    report = {}
+    for name in ENDPOINTS:
+        latencies = sorted(1000 * seconds for endpoint, _, seconds in results if endpoint == name)
+        if not latencies:
+            continue
+        statuses = [status for endpoint, status, _ in results if endpoint == name]
+        report[name] = {
+            'requests': len(latencies),
+            'errors': sum(1 for status in statuses if status >= 400),
+            'p50Ms': round(percentile(latencies, 50), 1),
+            'p95Ms': round(percentile(latencies, 95), 1),
+            'p99Ms': round(percentile(latencies, 99), 1),
+            'meanMs': round(sum(latencies) / len(latencies), 1),
+            'throughput': round(len(latencies) / wall_seconds, 2)
+        }
+    report['total'] = {
+        'requests': len(results),
+        'errors': sum(1 for _, status, _ in results if status >= 400),
+        'wallSeconds': round(wall_seconds, 2),
+        'throughput': round(len(results) / wall_seconds, 2)
+    }
+    return report
+
+
+def compare(report, baseline):
+    print("\nChange against baseline (positive latency change = slower):", file=sys.stderr)
+    for name, current in report['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        changes = []
+        for key in ('p50Ms', 'p95Ms', 'p99Ms', 'throughput'):
+            if key in current and previous.get(key):
+                changes.append(f"{key} {100 * (current[key] - previous[key]) / previous[key]:+.1f}%")
+        print(f"  {name:<16} {', '.join(changes)}", file=sys.stderr)
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+    rng = random.Random(args.seed)
+
+    import app as appmod
+    from bench.fake_llm import FakeChatModel
+    from db_indexes import ensure_indexes
+
+    appmod.gateway.set_llm_factory(lambda model: FakeChatModel(
+        model_name=model, latency=args.llm_latency, jitter=args.llm_jitter, seed=args.seed
+    ))
+
+    print(f"Seeding {args.db}...", file=sys.stderr)
+    ids = seed(appmod.db, args, rng)
+    ensure_indexes(appmod.db)
+    appmod.job_cache.invalidate()
+    appmod.invalidate_experts()
+    plan = build_plan(args, ids, rng)
+
+    print(f"Sending {len(plan)} requests with concurrency {args.concurrency}...", file=sys.stderr)
+    # The app logs every request with print; keep the report readable
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        results, wall_seconds = run(appmod.app, plan, args.concurrency)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    report = {
+        'config': {key: value for key, value in vars(args).items() if key not in ('out', 'compare')},
+        'endpoints': summarize(results, wall_seconds)
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
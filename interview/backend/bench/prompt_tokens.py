@@ -0,0 +1,74 @@
+"""
+Compares input tokens (and optionally latency) of the full and compact prompts
+for each LLM call site over the fixed samples in bench/samples.py.
+
+Usage (from the backend directory):
+    python -m bench.prompt_tokens           # token counts only, no LLM calls
+    python -m bench.prompt_tokens --live    # also time real calls (cache disabled)
+"""
+import statistics
+import sys
+import time
+from config import Config
+from llm import summary_inputs
+from llm_gateway import gateway
+from parse import parse_inputs
+from prompts import PROMPT_MODES, chain_name
+from score import match_inputs
+from tokens import prompt_sections
+from bench.samples import CANDIDATE_PROFILES, EXPERT_PROFILES, JOB_DESCRIPTION, RESUME_TEXTS
+
+
+def sample_inputs(call_site, prompt_mode):
+    if call_site == 'parse_resume':
+        return [parse_inputs(text, prompt_mode) for text in RESUME_TEXTS]
+    if call_site == 'summary_match':
+        return [
+            match_inputs(candidate, JOB_DESCRIPTION, expert, prompt_mode)
+            for candidate in CANDIDATE_PROFILES
+            for expert in EXPERT_PROFILES + [None]
+        ]
+    return [summary_inputs(candidate, prompt_mode) for candidate in CANDIDATE_PROFILES]
+
+
+def measure(call_site, prompt_mode, live):
+    name = chain_name(call_site, prompt_mode)
+    template = gateway.get_prompt(name).template
+    totals, sections, latencies = [], {}, []
+    for inputs in sample_inputs(call_site, prompt_mode):
+        counts = prompt_sections(template, inputs)
+        totals.append(sum(counts.values()))
+        for section, tokens in counts.items():
+            sections.setdefault(section, []).append(tokens)
+        if live:
+            start = time.perf_counter()
+            gateway.invoke(name, inputs)
+            latencies.append(time.perf_counter() - start)
+    return {
+        'tokens': statistics.mean(totals),
+        'sections': {section: statistics.mean(values) for section, values in sections.items()},
+        'latency': statistics.mean(latencies) if latencies else None
+    }
+
+
+def main():
+    live = '--live' in sys.argv
+    if live:
+        Config.LLM_CACHE_ENABLED = False
+
+    for call_site in ('parse_resume', 'summary_match', 'generate_summary'):
+        results = {mode: measure(call_site, mode, live) for mode in PROMPT_MODES}
+        full_tokens = results['full']['tokens']
+        print(f"\n{call_site}")
+        for mode, result in results.items():
+            change = 100 * (result['tokens'] - full_tokens) / full_tokens
+            line = f"  {mode:<8} avg input tokens {result['tokens']:8.0f} ({change:+.1f}%)"
+            if result['latency'] is not None:
+                line += f"  avg latency {result['latency'] * 1000:8.0f} ms"
+            print(line)
+            breakdown = ', '.join(f"{s}={t:.0f}" for s, t in sorted(result['sections'].items(), key=lambda i: -i[1]))
+            print(f"           sections: {breakdown}")
+
+
+if __name__ == "__main__":
+    main()
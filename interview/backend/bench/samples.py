@@ -0,0 +1,182 @@
+"""Fixed sample resumes, experts and a job description used by the benchmarks."""
+
+RESUME_TEXTS = [
+    """
+    Priya Sharma
+    priya.sharma@example.com | +91 98765 43210 | linkedin.com/in/priyasharma | github.com/priyas
+
+    Professional Summary
+    Backend engineer with 4 years of experience building data-heavy web services in Python.
+
+    Technical Skills
+    Languages: Python, Go, SQL
+    Frameworks: Flask, FastAPI, Django
+    Data: MongoDB, PostgreSQL, Redis, Kafka
+    Cloud: AWS (EC2, S3, Lambda), Docker, Kubernetes
+
+    Experience
+    Software Engineer II | Finlytics | Jan 2022 - Present
+    • Built a payments reconciliation service processing 2M transactions/day with Flask and Kafka.
+    • Cut p95 API latency from 900ms to 180ms by adding Redis caching and query indexes.
+    Software Engineer | CodeNest | Jul 2020 - Dec 2021
+    • Developed REST APIs for a learning platform used by 50k students.
+    • Migrated reporting jobs from cron scripts to Airflow.
+
+    Education
+    B.Tech in Computer Science | IIT Roorkee | 2016 - 2020
+
+    Projects
+    QueryLens - a SQL query plan visualiser built with React and Go.
+    TinyKV - a Raft-based key value store written for a distributed systems course.
+
+    Certifications
+    AWS Certified Developer - Associate
+    """,
+    """
+    Arjun Mehta
+    Email: arjun.mehta@example.org
+    Phone: 9123456780
+    https://github.com/arjunm
+
+    Objective
+    Machine learning engineer looking to apply computer vision research to defence systems.
+
+    Skills
+    Python, PyTorch, TensorFlow, OpenCV, CUDA, ONNX, Docker, Git
+
+    Work Experience
+    ML Engineer | VisionWorks Labs | Jun 2021 - Present
+    - Trained object detection models for aerial imagery (YOLOv8, DETR), improving mAP by 12%.
+    - Deployed quantised models to Jetson edge devices with TensorRT.
+    Research Intern | IISc Bangalore | Jan 2021 - May 2021
+    - Studied domain adaptation for synthetic-to-real satellite images.
+
+    Education
+    M.Tech in Artificial Intelligence | IIIT Hyderabad | 2019 - 2021
+    B.E. in Electronics | Pune University | 2015 - 2019
+
+    Projects
+    Drone-based crop health monitoring using multispectral imaging.
+    """,
+    """
+    Neha Verma
+    neha.verma@example.net | (022) 555-0199 | Mumbai, India
+
+    Profile
+    UX designer with 3 years of experience designing dashboards and mobile apps for government services.
+
+    Key Skills
+    Figma; Sketch; Adobe XD; User Research; Usability Testing; Design Systems; HTML/CSS
+
+    Professional Experience
+    UX Designer | GovTech Studio | 2022 - Present
+    • Redesigned a citizen grievance portal, reducing task completion time by 35%.
+    • Built and maintained a shared design system used by 6 product teams.
+    Junior Designer | PixelCraft | 2021 - 2022
+    • Produced wireframes and prototypes for e-commerce clients.
+
+    Education
+    B.Des in Interaction Design | NID Ahmedabad | 2017 - 2021
+
+    Certifications
+    Google UX Design Professional Certificate
+    """,
+]
+
+CANDIDATE_PROFILES = [
+    {
+        'name': 'Priya Sharma',
+        'email': 'priya.sharma@example.com',
+        'phone': '+91 98765 43210',
+        'position': 'Backend Engineer',
+        'linkedin': 'linkedin.com/in/priyasharma',
+        'github': 'github.com/priyas',
+        'skills': ['Python', 'Go', 'SQL', 'Flask', 'FastAPI', 'MongoDB', 'PostgreSQL', 'Redis', 'Kafka', 'AWS', 'Docker'],
+        'experiences': [
+            {'company': 'Finlytics', 'duration': 'Jan 2022 - Present', 'responsibilities': [
+                'Built a payments reconciliation service processing 2M transactions/day with Flask and Kafka.',
+                'Cut p95 API latency from 900ms to 180ms by adding Redis caching and query indexes.']},
+            {'company': 'CodeNest', 'duration': 'Jul 2020 - Dec 2021', 'responsibilities': [
+                'Developed REST APIs for a learning platform used by 50k students.',
+                'Migrated reporting jobs from cron scripts to Airflow.']},
+        ],
+        'projects': [
+            {'name': 'QueryLens', 'details': ['SQL query plan visualiser built with React and Go.']},
+            {'name': 'TinyKV', 'details': ['Raft-based key value store.']},
+        ],
+        'educations': [{'degree': 'B.Tech in Computer Science', 'institution': 'IIT Roorkee', 'year': '2020'}],
+        'certifications': ['AWS Certified Developer - Associate'],
+    },
+    {
+        'name': 'Arjun Mehta',
+        'email': 'arjun.mehta@example.org',
+        'phone': '9123456780',
+        'position': 'ML Engineer',
+        'github': 'github.com/arjunm',
+        'skills': ['Python', 'PyTorch', 'TensorFlow', 'OpenCV', 'CUDA', 'ONNX', 'Docker'],
+        'experiences': [
+            {'company': 'VisionWorks Labs', 'duration': 'Jun 2021 - Present', 'responsibilities': [
+                'Trained object detection models for aerial imagery, improving mAP by 12%.',
+                'Deployed quantised models to Jetson edge devices with TensorRT.']},
+            {'company': 'IISc Bangalore', 'duration': 'Jan 2021 - May 2021', 'responsibilities': [
+                'Studied domain adaptation for synthetic-to-real satellite images.']},
+        ],
+        'projects': [{'name': 'Crop health monitoring', 'details': ['Drone-based multispectral imaging.']}],
+        'educations': [
+            {'degree': 'M.Tech in Artificial Intelligence', 'institution': 'IIIT Hyderabad', 'year': '2021'},
+            {'degree': 'B.E. in Electronics', 'institution': 'Pune University', 'year': '2019'},
+        ],
+        'certifications': [],
+    },
+    {
+        'name': 'Neha Verma',
+        'email': 'neha.verma@example.net',
+        'phone': '(022) 555-0199',
+        'position': 'UX Designer',
+        'skills': ['Figma', 'Sketch', 'Adobe XD', 'User Research', 'Usability Testing', 'Design Systems'],
+        'experiences': [
+            {'company': 'GovTech Studio', 'duration': '2022 - Present', 'responsibilities': [
+                'Redesigned a citizen grievance portal, reducing task completion time by 35%.',
+                'Built and maintained a shared design system used by 6 product teams.']},
+            {'company': 'PixelCraft', 'duration': '2021 - 2022', 'responsibilities': [
+                'Produced wireframes and prototypes for e-commerce clients.']},
+        ],
+        'projects': [],
+        'educations': [{'degree': 'B.Des in Interaction Design', 'institution': 'NID Ahmedabad', 'year': '2021'}],
+        'certifications': ['Google UX Design Professional Certificate'],
+    },
+]
+
+EXPERT_PROFILES = [
+    {
+        'name': 'Dr. R. Iyer',
+        'email': 'r.iyer@drdo.example',
+        'phone': '0000000000',
+        'position': 'Scientist F, Software Systems',
+        'skills': ['Distributed Systems', 'Python', 'Java', 'Real-time Systems', 'Kafka'],
+        'experiences': [{'company': 'DRDO', 'duration': '2008 - Present', 'responsibilities': [
+            'Leads the command and control software group.']}],
+        'projects': [{'name': 'C2 Platform', 'details': ['Message bus for sensor fusion.']}],
+        'educations': [{'degree': 'PhD in Computer Science', 'institution': 'IIT Delhi', 'year': '2007'}],
+        'certifications': [],
+    },
+    {
+        'name': 'S. Kulkarni',
+        'email': 's.kulkarni@drdo.example',
+        'phone': '0000000000',
+        'position': 'Scientist D, Computer Vision',
+        'skills': ['Computer Vision', 'Deep Learning', 'PyTorch', 'Remote Sensing'],
+        'experiences': [{'company': 'DRDO', 'duration': '2014 - Present', 'responsibilities': [
+            'Develops target recognition models for UAV imagery.']}],
+        'projects': [],
+        'educations': [{'degree': 'M.Tech in Signal Processing', 'institution': 'IISc', 'year': '2013'}],
+        'certifications': [],
+    },
+]
+
+JOB_DESCRIPTION = (
+    "As a Software Engineer at DRDO, you will be responsible for designing, developing, and "
+    "maintaining advanced software systems for defense applications. You will work on challenging "
+    "projects that push the boundaries of technology, including distributed data pipelines, "
+    "real-time messaging and ML model serving."
+)
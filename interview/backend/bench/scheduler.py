@@ -0,0 +1,152 @@
+"""
+Offline rate-limit benchmark: bulk expert scoring saturates the fake
+provider's per-minute quotas while interactive resume parses keep arriving,
+and the report shows how each priority fared and how many 429s the provider
+sent back. No database or Flask app is involved; calls go straight through
+the LLM gateway and scheduler.
+
+Usage (from the backend directory):
+    python -m bench.scheduler                          # scheduler on, default quotas
+    python -m bench.scheduler --no-scheduler           # same load with calls sent unscheduled
+    python -m bench.scheduler --rpm 30 --tpm 20000 --bulk 80 --out run.json
+
+The scheduler is configured with the same quotas the fake provider enforces.
+It reserves tokens from an estimate of the response length, so the provider
+may still answer 429 now and then; those should be absorbed by backoff
+rather than surface as errors. With --no-scheduler every 429 is an error.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+MODELS = ('llama-3.1-70b-versatile', 'llama-3.1-8b-instant', 'mixtral-8x7b-32768')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rpm', type=int, default=60, help='requests per minute per model')
+    parser.add_argument('--tpm', type=int, default=60000, help='tokens per minute per model')
+    parser.add_argument('--bulk', type=int, default=100, help='bulk summary_match calls')
+    parser.add_argument('--bulk-concurrency', type=int, default=8)
+    parser.add_argument('--interactive', type=int, default=15, help='interactive resume parses')
+    parser.add_argument('--interactive-interval', type=float, default=3.0, help='seconds between parses')
+    parser.add_argument('--llm-latency', type=float, default=0.5, help='mean fake LLM latency in seconds')
+    parser.add_argument('--llm-jitter', type=float, default=0.2, help='uniform +/- jitter in seconds')
+    parser.add_argument('--no-scheduler', action='store_true', help='send calls without the scheduler')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='write the report JSON here as well as to stdout')
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    # Must run before config is imported: it reads the environment at import time
+    os.environ['LLM_RATE_LIMITS'] = json.dumps({model: {'rpm': args.rpm, 'tpm': args.tpm} for model in MODELS})
+    os.environ['LLM_SCHEDULER_ENABLED'] = '0' if args.no_scheduler else '1'
+    os.environ['LLM_CACHE_ENABLED'] = '0'
+    os.environ['LLM_VERBOSE'] = '0'
+
+
+def timed(priority, fn, *args):
+    start = time.perf_counter()
+    try:
+        fn(*args)
+        ok = True
+    except Exception as e:
+        print(f"{priority} call failed: {e}", file=sys.stderr)
+        ok = False
+    return priority, ok, time.perf_counter() - start
+
+
+def run(args, rng):
+    from bench.load import make_profile
+    from bench.samples import RESUME_TEXTS
+    from llm_scheduler import run_with_priority
+    from parse import parse_resume_with_llm
+    from score import summary_match
+
+    job_description = "Backend engineer for high-volume Python services using Flask, MongoDB and Kafka."
+    candidates = [make_profile(rng, i, 'example.com') for i in range(args.bulk)]
+    experts = [make_profile(rng, i, 'drdo.gov.in') for i in range(args.bulk)]
+    resumes = [RESUME_TEXTS[i % len(RESUME_TEXTS)] + f"\nReference: bench-{i}" for i in range(args.interactive)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.bulk_concurrency, thread_name_prefix="bench-bulk") as bulk, \
+            ThreadPoolExecutor(max_workers=args.interactive, thread_name_prefix="bench-interactive") as interactive:
+        futures = [
+            bulk.submit(timed, 'bulk', run_with_priority, 'bulk', summary_match, candidate, job_description, expert)
+            for candidate, expert in zip(candidates, experts)
+        ]
+        for text in resumes:
+            futures.append(interactive.submit(timed, 'interactive', parse_resume_with_llm, text))
+            time.sleep(args.interactive_interval)
+        results = [future.result() for future in futures]
+    return results, time.perf_counter() - start
+
+
+def summarize(results, wall_seconds, quotas, gateway, scheduler):
+    from bench.load import percentile
+
+    report = {}
+    for priority in ('interactive', 'bulk'):
+        latencies = sorted(1000 * seconds for name, _, seconds in results if name == priority)
+        if not latencies:
+            continue
+        report[priority] = {
+            'calls': len(latencies),
+            'errors': sum(1 for name, ok, _ in results if name == priority and not ok),
+            'p50Ms': round(percentile(latencies, 50), 1),
+            'p95Ms': round(percentile(latencies, 95), 1),
+            'maxMs': round(latencies[-1], 1),
+            'throughput': round(len(latencies) / wall_seconds, 2)
+        }
+    chains = gateway.stats()['chains']
+    report['total'] = {
+        'calls': len(results),
+        'errors': sum(1 for _, ok, _ in results if not ok),
+        'provider429s': sum(quota.rejected for quota in quotas.values()),
+        'providerAccepted': sum(quota.accepted for quota in quotas.values()),
+        'retries': sum(stats['retries'] for stats in chains.values()),
+        'wallSeconds': round(wall_seconds, 2)
+    }
+    report['scheduler'] = scheduler.stats()
+    return report
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+    rng = random.Random(args.seed)
+
+    from bench.fake_llm import FakeChatModel
+    from llm_gateway import gateway
+    from llm_scheduler import scheduler
+
+    models = {}
+
+    def make_llm(model):
+        models[model] = FakeChatModel(
+            model_name=model, latency=args.llm_latency, jitter=args.llm_jitter, seed=args.seed,
+            rpm=args.rpm, tpm=args.tpm
+        )
+        return models[model]
+
+    gateway.set_llm_factory(make_llm)
+
+    mode = 'off' if args.no_scheduler else 'on'
+    print(f"Sending {args.bulk} bulk and {args.interactive} interactive calls, scheduler {mode}...", file=sys.stderr)
+    results, wall_seconds = run(args, rng)
+    report = summarize(results, wall_seconds, {model: llm.quota for model, llm in models.items()}, gateway, scheduler)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -5,11 +6,136 @@ load_dotenv()
 
 class Config:
     MONGO_URI = os.environ.get('MONGO_URI')
-    DB_NAME = "SIH"
+    DB_NAME = os.environ.get('DB_NAME', "SIH")
     COLLECTION_NAME = "UserResume"
     UPLOAD_FOLDER = 'uploads'
     GROQ_AI_KEY = os.environ.get('GROQ_AI_KEY')
 
+    # Expert matching fan-out: how many summary_match calls may run at once,
+    # and how long a single scoring request may wait for all of them.
+    EXPERT_MATCH_CONCURRENCY = int(os.environ.get('EXPERT_MATCH_CONCURRENCY', 8))
+    SCORE_DEADLINE_SECONDS = float(os.environ.get('SCORE_DEADLINE_SECONDS', 60))
+    # Only the top-k experts from the local profile index reach the LLM (0 = all)
+    EXPERT_PREFILTER_TOP_K = int(os.environ.get('EXPERT_PREFILTER_TOP_K', 10))
+    # Candidates scored at once by the bulk scoring endpoint; each of them
+    # fans out up to EXPERT_MATCH_CONCURRENCY expert calls
+    BULK_SCORE_CONCURRENCY = int(os.environ.get('BULK_SCORE_CONCURRENCY', 4))
+
+    # On-disk cache of LLM responses, keyed by model + rendered prompt
+    LLM_CACHE_ENABLED = os.environ.get('LLM_CACHE_ENABLED', '1') == '1'
+    LLM_CACHE_PATH = os.environ.get('LLM_CACHE_PATH', 'llm_cache.sqlite3')
+    LLM_CACHE_TTL_SECONDS = int(os.environ.get('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.environ.get('LLM_CACHE_MAX_ENTRIES', 10000))
+
+    # Shared LLM clients: keep-alive pool size and per-request HTTP timeout
+    LLM_MAX_CONNECTIONS = int(os.environ.get('LLM_MAX_CONNECTIONS', 20))
+    LLM_TIMEOUT_SECONDS = float(os.environ.get('LLM_TIMEOUT_SECONDS', 60))
+    # Connection pool for async LLM calls (async_app.py); bounds how many can be in flight
+    LLM_ASYNC_MAX_CONNECTIONS = int(os.environ.get('LLM_ASYNC_MAX_CONNECTIONS', 200))
+    LLM_VERBOSE = os.environ.get('LLM_VERBOSE', '1') == '1'
+
+    # Rate-limit-aware scheduling of provider calls (see llm_scheduler.py).
+    # Off by default: the per-model requests/min and tokens/min below are
+    # Groq's free tier and would throttle a paid account. Enable it with the
+    # account's limits in LLM_RATE_LIMITS as JSON, e.g.
+    # {"llama-3.1-70b-versatile": {"rpm": 100, "tpm": 100000}}
+    LLM_SCHEDULER_ENABLED = os.environ.get('LLM_SCHEDULER_ENABLED', '0') == '1'
+    LLM_DEFAULT_RATE_LIMITS = {'rpm': 30, 'tpm': 6000}
+    LLM_RATE_LIMITS = {
+        'llama-3.1-70b-versatile': {'rpm': 30, 'tpm': 6000},
+        'llama-3.1-8b-instant': {'rpm': 30, 'tpm': 20000},
+        'mixtral-8x7b-32768': {'rpm': 30, 'tpm': 5000},
+        **json.loads(os.environ.get('LLM_RATE_LIMITS', '{}'))
+    }
+    # Tokens reserved for a response until its actual length is known
+    LLM_EXPECTED_OUTPUT_TOKENS = int(os.environ.get('LLM_EXPECTED_OUTPUT_TOKENS', 400))
+    # Priority per call site: "interactive" goes ahead of "standard", then "bulk".
+    # Bulk scoring runs its calls at "bulk" whatever the call site.
+    LLM_CALL_PRIORITIES = {
+        'parse_resume': 'interactive',
+        'summary_match': 'standard',
+        'generate_summary': 'standard',
+    }
+    # Fraction of each model's request and token buckets a priority may not
+    # use, kept free for the priorities above it
+    LLM_PRIORITY_RESERVE = {'interactive': 0.0, 'standard': 0.1, 'bulk': 0.3}
+    # A call waiting longer than this for capacity fails instead; kept below
+    # SCORE_DEADLINE_SECONDS so scoring reports the wait rather than timing out
+    LLM_SCHEDULER_MAX_WAIT_SECONDS = min(
+        float(os.environ.get('LLM_SCHEDULER_MAX_WAIT_SECONDS', 30)), 0.75 * SCORE_DEADLINE_SECONDS
+    )
+    LLM_SCHEDULER_POLL_SECONDS = 0.05
+    # Retries of rate-limited, 5xx and connection failures, with exponential backoff
+    LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))
+    LLM_BACKOFF_BASE_SECONDS = float(os.environ.get('LLM_BACKOFF_BASE_SECONDS', 1))
+    LLM_BACKOFF_MAX_SECONDS = float(os.environ.get('LLM_BACKOFF_MAX_SECONDS', 60))
+
+    # Prompt mode per LLM call site: "full" or "compact" (see prompts.py)
+    PROMPT_MODES = {
+        'parse_resume': os.environ.get('PARSE_PROMPT_MODE', 'full'),
+        'summary_match': os.environ.get('MATCH_PROMPT_MODE', 'full'),
+        'generate_summary': os.environ.get('SUMMARY_PROMPT_MODE', 'full'),
+    }
+
+    # Background resume parsing (POST /api/parse-resume?async=1)
+    PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', 4))
+    PARSE_QUEUE_MAX = int(os.environ.get('PARSE_QUEUE_MAX', 100))
+    PARSE_JOB_RETENTION_SECONDS = int(os.environ.get('PARSE_JOB_RETENTION_SECONDS', 3600))
+
+    # Oversized PDFs are truncated to this many pages / characters of text
+    PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', 20))
+    PDF_MAX_CHARS = int(os.environ.get('PDF_MAX_CHARS', 50000))
+
+    # Default resume parse mode: "full", "focused" or "fast" (see parse.parse_resume)
+    RESUME_PARSE_MODE = os.environ.get('RESUME_PARSE_MODE', 'focused')
+
+    # Page size (and maximum) for GET /api/user-applications/<user_id>
+    APPLICATIONS_PAGE_SIZE = int(os.environ.get('APPLICATIONS_PAGE_SIZE', 100))
+    # Largest ?limit= and ?page= accepted by GET /api/job-openings
+    JOB_OPENINGS_MAX_LIMIT = int(os.environ.get('JOB_OPENINGS_MAX_LIMIT', 100))
+    JOB_OPENINGS_MAX_PAGE = int(os.environ.get('JOB_OPENINGS_MAX_PAGE', 1000))
+
+    # Create and verify the indexes declared in db_indexes.py at startup
+    ENSURE_INDEXES = os.environ.get('ENSURE_INDEXES', '1') == '1'
+
+    # In-process read-through cache for job openings and the expert roster
+    JOB_CACHE_SIZE = int(os.environ.get('JOB_CACHE_SIZE', 1000))
+    READ_CACHE_TTL_SECONDS = int(os.environ.get('READ_CACHE_TTL_SECONDS', 300))
+
+    # Largest request body accepted (resume uploads), for both the Flask app and
+    # the async app's pass-through to it
+    MAX_UPLOAD_BYTES = int(os.environ.get('MAX_UPLOAD_BYTES', 16 * 1024 * 1024))
+
+    # Compression of buffered JSON responses (see serialization.py): Brotli
+    # when the client accepts it and the brotli package is installed, else gzip
+    COMPRESS_RESPONSES = os.environ.get('COMPRESS_RESPONSES', '1') == '1'
+    COMPRESS_MIN_BYTES = int(os.environ.get('COMPRESS_MIN_BYTES', 1024))
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5
+
+    # Admission control per route class (see admission.py): requests running
+    # at once, requests allowed to wait for a slot, and how long they may wait
+    # before getting a 429. "llm" covers the scoring and inline parse routes,
+    # "bulk" the bulk scoring stream and "llm-async" the same LLM routes when
+    # served by async_app.py, where waiting requests cost no threads.
+    ADMISSION_LIMITS = {
+        'llm': {
+            'concurrency': int(os.environ.get('LLM_ROUTE_CONCURRENCY', 8)),
+            'queue': int(os.environ.get('LLM_ROUTE_QUEUE', 16)),
+            'timeout': float(os.environ.get('LLM_ROUTE_QUEUE_TIMEOUT', 10)),
+        },
+        'bulk': {
+            'concurrency': int(os.environ.get('BULK_ROUTE_CONCURRENCY', 1)),
+            'queue': int(os.environ.get('BULK_ROUTE_QUEUE', 2)),
+            'timeout': float(os.environ.get('BULK_ROUTE_QUEUE_TIMEOUT', 5)),
+        },
+        'llm-async': {
+            'concurrency': int(os.environ.get('ASYNC_LLM_ROUTE_CONCURRENCY', 200)),
+            'queue': int(os.environ.get('ASYNC_LLM_ROUTE_QUEUE', 400)),
+            'timeout': float(os.environ.get('ASYNC_LLM_ROUTE_QUEUE_TIMEOUT', 10)),
+        },
+    }
+
     TABLE_SCHEMA = {
         "_id": "ObjectId",
         "name": "string",
@@ -0,0 +1,139 @@
+"""
+Declared MongoDB indexes for the backend, plus tooling to create, verify and
+report on them.
+
+Usage:
+    python db_indexes.py create   # create any missing indexes
+    python db_indexes.py verify   # list declared indexes that are missing
+    python db_indexes.py report   # explain each query shape, flag collection scans
+"""
+import sys
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import OperationFailure, PyMongoError
+from config import Config
+
+# collection -> list of (keys, options)
+INDEXES = {
+    'User': [
+        ([('email', ASCENDING)], {'name': 'email_1'}),
+        ([('emp_code', ASCENDING)], {'name': 'emp_code_1'}),
+    ],
+    'UserResume': [
+        ([('email', ASCENDING)], {'name': 'email_1'}),
+    ],
+    'application': [
+        # One application per user and job; also serves lookups by userId alone.
+        ([('userId', ASCENDING), ('jobId', ASCENDING)], {'name': 'userId_1_jobId_1', 'unique': True}),
+        # Lookups by jobId, and by (jobId, email) when selecting/rejecting.
+        ([('jobId', ASCENDING), ('email', ASCENDING)], {'name': 'jobId_1_email_1'}),
+    ],
+    'MatchScore': [
+        ([('jobId', ASCENDING), ('candidateEmail', ASCENDING), ('expertId', ASCENDING)],
+         {'name': 'jobId_1_candidateEmail_1_expertId_1', 'unique': True}),
+    ],
+}
+
+# Query shapes the app issues: (collection, filter, sort). Values are samples
+# used only to get an explain plan.
+QUERY_SHAPES = [
+    ('User', {'email': 'x'}, None),
+    ('User', {'emp_code': 'x'}, None),
+    ('UserResume', {'email': 'x'}, None),
+    ('UserResume', {'email': {'$in': ['x']}}, None),
+    ('application', {'jobId': 'x'}, None),
+    ('application', {'jobId': {'$in': ['x']}}, None),
+    ('application', {'userId': 'x'}, [('_id', ASCENDING)]),
+    ('application', {'userId': 'x', 'jobId': 'x'}, None),
+    ('application', {'jobId': 'x', 'email': 'x'}, None),
+    ('MatchScore', {'jobId': 'x', 'candidateEmail': 'x'}, None),
+]
+
+
+def ensure_indexes(db):
+    """
+    Creates any missing declared indexes. Failures are reported, not raised;
+    returns False if the server could not be reached at all.
+    """
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        for keys, options in indexes:
+            try:
+                collection.create_index(keys, **options)
+            except OperationFailure as e:
+                print(f"Could not create index {options['name']} on {collection_name}: {e}")
+            except PyMongoError as e:
+                # Unreachable server: every other index would time out the same way
+                print(f"Could not create indexes on {db.name}: {e}")
+                return False
+    return True
+
+
+def verify_indexes(db):
+    """Returns a list of (collection, index name) for declared indexes that do not exist."""
+    missing = []
+    for collection_name, indexes in INDEXES.items():
+        existing = {
+            tuple(info['key']): info
+            for info in db[collection_name].index_information().values()
+        }
+        for keys, options in indexes:
+            info = existing.get(tuple(keys))
+            if info is None or info.get('unique', False) != options.get('unique', False):
+                missing.append((collection_name, options['name']))
+    return missing
+
+
+def _stages(plan):
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            yield plan['stage']
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _stages(item)
+
+
+def collection_scan_report(db):
+    """Explains every query shape and returns the ones whose winning plan scans a collection."""
+    scans = []
+    for collection_name, query, sort in QUERY_SHAPES:
+        cursor = db[collection_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        winning_plan = cursor.explain().get('queryPlanner', {}).get('winningPlan', {})
+        if 'COLLSCAN' in set(_stages(winning_plan)):
+            scans.append((collection_name, query, sort))
+    return scans
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] not in ('create', 'verify', 'report'):
+        print("Usage: python db_indexes.py <create|verify|report>")
+        sys.exit(1)
+
+    client = MongoClient(Config.MONGO_URI)
+    db = client[Config.DB_NAME]
+    command = sys.argv[1]
+
+    if command == 'create':
+        ensure_indexes(db)
+        command = 'verify'
+
+    if command == 'verify':
+        missing = verify_indexes(db)
+        for collection_name, name in missing:
+            print(f"Missing index {name} on {collection_name}")
+        if not missing:
+            print("All declared indexes are present.")
+        sys.exit(1 if missing else 0)
+
+    scans = collection_scan_report(db)
+    for collection_name, query, sort in scans:
+        print(f"COLLSCAN on {collection_name}: filter={query} sort={sort}")
+    if not scans:
+        print("No query shape scans a collection.")
+
+
+if __name__ == "__main__":
+    main()
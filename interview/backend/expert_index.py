@@ -0,0 +1,120 @@
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+from config import Config
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is",
+    "it", "of", "on", "or", "our", "the", "to", "we", "will", "with", "you", "your",
+}
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+
+def tokenize(text):
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip('.')
+        if token and token not in STOP_WORDS:
+            tokens.append(token)
+    return tokens
+
+
+def profile_text(profile):
+    """Text used to index a profile: the skills, position and experiences that format_profile sends to the LLM."""
+    parts = [profile.get('position') or '']
+    parts.extend(profile.get('skills') or [])
+    for exp in profile.get('experiences') or []:
+        parts.append(exp.get('company') or '')
+        parts.extend(exp.get('responsibilities') or [])
+    return '\n'.join(str(part) for part in parts)
+
+
+class ExpertIndex:
+    """
+    In-memory BM25 index over expert profiles, used to pick the experts worth
+    sending to the LLM. Runs fully offline.
+
+    Call `refresh` with the current roster before querying; only experts that
+    were added or whose profile changed are re-tokenized, and removed experts
+    are dropped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs = {}  # expert id -> (fingerprint, term counts, length)
+        self._doc_freq = Counter()
+        self._total_length = 0
+
+    def refresh(self, experts):
+        seen = set()
+        with self._lock:
+            for expert in experts:
+                expert_id = str(expert['_id'])
+                seen.add(expert_id)
+                text = profile_text(expert)
+                fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()
+                current = self._docs.get(expert_id)
+                if current and current[0] == fingerprint:
+                    continue
+                if current:
+                    self._remove(expert_id)
+                terms = Counter(tokenize(text))
+                length = sum(terms.values())
+                self._docs[expert_id] = (fingerprint, terms, length)
+                self._doc_freq.update(terms.keys())
+                self._total_length += length
+
+            for expert_id in [i for i in self._docs if i not in seen]:
+                self._remove(expert_id)
+
+    def _remove(self, expert_id):
+        _, terms, length = self._docs.pop(expert_id)
+        self._doc_freq.subtract(terms.keys())
+        self._total_length -= length
+
+    def search(self, query, k):
+        """Returns up to k (expert id, score) pairs, best match first."""
+        query_terms = set(tokenize(query))
+        with self._lock:
+            n = len(self._docs)
+            if not n:
+                return []
+            avg_length = (self._total_length / n) or 1
+            results = []
+            for expert_id, (_, terms, length) in self._docs.items():
+                score = 0.0
+                for term in query_terms:
+                    tf = terms.get(term)
+                    if not tf:
+                        continue
+                    df = self._doc_freq[term]
+                    idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                    score += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+                results.append((expert_id, score))
+        results.sort(key=lambda r: r[1], reverse=True)
+        return results[:k]
+
+
+expert_index = ExpertIndex()
+
+
+def prefilter_experts(experts, candidate_profile, job_description, k=None):
+    """
+    Returns the top-k experts for a candidate and job description, so only
+    those go through summary_match. k <= 0 disables the prefilter.
+    """
+    k = Config.EXPERT_PREFILTER_TOP_K if k is None else k
+    if k <= 0 or len(experts) <= k:
+        return experts
+
+    expert_index.refresh(experts)
+    query = f"{job_description}\n{profile_text(candidate_profile)}"
+    by_id = {str(expert['_id']): expert for expert in experts}
+    return [by_id[expert_id] for expert_id, _ in expert_index.search(query, k)]
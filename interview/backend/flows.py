@@ -0,0 +1,173 @@
+"""
+Control flow shared by the Flask app (app.py) and the async app (async_app.py).
+
+Each flow is a generator that yields the I/O it needs as `(step, *args)`
+tuples and is sent each result back. `run_flow` performs the steps with
+blocking calls and `arun_flow` awaits them, each with its app's table of step
+functions, so both apps apply the same reuse and storage rules. Steps:
+
+    load_resume(sha256)                 stored text/parses for an upload
+    extract_text(pdf_bytes)             PyMuPDF text extraction
+    save_text(sha256, text)
+    parse_resume(text, mode)            LLM-backed parse (see parse.py)
+    save_parsed(sha256, mode, parsed)
+    load_scores(job_id, email)          stored match scores by expert key
+    match_experts(candidate, job_description, experts)
+    save_score(job_id, email, expert, input_hash, scores)
+
+The save steps only spare later requests work, so a failed save is logged
+and the flow carries on with the result it already has.
+"""
+import inspect
+import time
+from heapq import nlargest
+from expert_index import prefilter_experts
+from prompts import resolve_prompt_mode
+from score import SCORE_VERSION
+from score_store import expert_key, match_input_hash
+
+BEST_EFFORT_STEPS = ('save_text', 'save_parsed', 'save_score')
+
+
+def run_flow(flow, steps):
+    """Runs `flow` to completion with blocking step functions; returns its result."""
+    result, error = None, None
+    while True:
+        try:
+            request = flow.throw(error) if error is not None else flow.send(result)
+        except StopIteration as done:
+            return done.value
+        name, *args = request
+        try:
+            result, error = steps[name](*args), None
+        except Exception as e:
+            result, error = None, _unless_best_effort(name, e)
+
+
+async def arun_flow(flow, steps):
+    """Like `run_flow`; step functions may return awaitables, which are awaited."""
+    result, error = None, None
+    while True:
+        try:
+            request = flow.throw(error) if error is not None else flow.send(result)
+        except StopIteration as done:
+            return done.value
+        name, *args = request
+        try:
+            result, error = steps[name](*args), None
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as e:
+            result, error = None, _unless_best_effort(name, e)
+
+
+def _unless_best_effort(name, error):
+    # The error to throw back into the flow, or None for a failed save
+    if name in BEST_EFFORT_STEPS:
+        print(f"Flow step {name} failed, continuing without it: {error}")
+        return None
+    return error
+
+
+def resume_parse_flow(pdf_bytes, sha256, mode, timings):
+    # Parses an upload, reusing the stored text and parsed JSON when the same
+    # file has been seen before
+    known = yield ('load_resume', sha256)
+    timings['cached'] = bool(known.get('parsed', {}).get(mode))
+    if timings['cached']:
+        return known['parsed'][mode]
+
+    text = known.get('text')
+    if not text:
+        start = time.perf_counter()
+        text = yield ('extract_text', pdf_bytes)
+        timings['extractMs'] = round(1000 * (time.perf_counter() - start), 1)
+        if not text:
+            raise ValueError("No text extracted from the document")
+        yield ('save_text', sha256, text)
+
+    start = time.perf_counter()
+    parsed_data = yield ('parse_resume', text, mode)
+    timings['parseMs'] = round(1000 * (time.perf_counter() - start), 1)
+    # Heuristic-only fallbacks after an LLM failure are served but not stored
+    if parsed_data and not parsed_data.get('fallback'):
+        yield ('save_parsed', sha256, mode, parsed_data)
+    return parsed_data
+
+
+def match_scores_flow(job_id, job_description, candidate_resume, experts):
+    # Returns (expert, scores) pairs. Scores stored for the same job, candidate
+    # and expert are reused while their inputs hash the same; only the changed
+    # or missing pairs are sent to the LLM, and their results are stored.
+    candidate_email = candidate_resume['email']
+    stored = yield ('load_scores', job_id, candidate_email)
+    results, pending, input_hashes = reuse_stored_scores(stored, job_description, candidate_resume, experts)
+    matches = yield ('match_experts', candidate_resume, job_description, pending)
+    for expert, scores in matches:
+        # Scores with fields that could not be repaired are served but not
+        # stored, so the pair is scored again on the next request
+        if 'missing' not in scores:
+            yield ('save_score', job_id, candidate_email, expert, input_hashes[expert_key(expert)], scores)
+        results.append((expert, scores))
+    return results
+
+
+def reuse_stored_scores(stored, job_description, candidate_resume, experts):
+    # Splits experts into (expert, scores) pairs whose stored scores are still
+    # valid and the pending ones, with the input hash to store each under
+    score_version = f"{SCORE_VERSION}:{resolve_prompt_mode('summary_match')}"
+    results = []
+    pending = []
+    input_hashes = {}
+    for expert in experts:
+        input_hash = match_input_hash(job_description, candidate_resume, expert, score_version)
+        doc = stored.get(expert_key(expert))
+        if doc and doc['inputHash'] == input_hash:
+            results.append((expert, doc['scores']))
+        else:
+            input_hashes[expert_key(expert)] = input_hash
+            pending.append(expert)
+    if pending:
+        print(f"Scoring {len(pending)} changed pairs, reusing {len(results)} stored scores")
+    return results, pending, input_hashes
+
+
+def candidate_score_flow(job_id, job, candidate_resume, experts):
+    # Scores one candidate for a job: the overall match plus the top experts
+    job_description = job['fullDescription']
+
+    # Only the best-matching experts from the local index go to the LLM
+    experts = prefilter_experts(experts, candidate_resume, job_description)
+    print(f"Scoring {candidate_resume['email']} against {len(experts)} shortlisted experts")
+
+    # Score the candidate against every expert, plus once with no expert
+    # for the overall match
+    matches = yield from match_scores_flow(job_id, job_description, candidate_resume, [None] + experts)
+    return candidate_score_response(job, candidate_resume, matches)
+
+
+def top_experts_flow(job_id, job, candidate_resume, experts):
+    # Shortlist experts with the local index, then score them
+    experts = prefilter_experts(experts, candidate_resume, job['fullDescription'])
+    matches = yield from match_scores_flow(job_id, job['fullDescription'], candidate_resume, experts)
+    return top_expert_scores(matches)
+
+
+def candidate_score_response(job, candidate_resume, matches):
+    # The overall match (expert None) plus the five best-scoring experts
+    final_scores = next((scores for expert, scores in matches if expert is None), {})
+    return {
+        'matchResult': final_scores,
+        'candidateName': candidate_resume['name'],
+        'jobTitle': job['title'],
+        'topExperts': top_expert_scores(matches)
+    }
+
+
+def top_expert_scores(matches, n=5):
+    expert_scores = [{
+        'name': expert['name'],
+        'position': expert['position'],
+        'score': scores.get('Overall Score', 0)
+    } for expert, scores in matches if expert is not None]
+    return nlargest(n, expert_scores, key=lambda x: x['score'])
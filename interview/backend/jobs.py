@@ -0,0 +1,120 @@
+import math
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class JobQueue:
+    """
+    Bounded pool of background workers with in-memory job tracking.
+
+    At most `max_workers` jobs run at once and at most `max_pending` may be
+    queued or running; `submit` raises QueueFullError beyond that. Finished
+    jobs are kept for `retention_seconds` so clients can poll for the result.
+    Task functions are called with a `timings` dict they can record per-stage
+    durations (in milliseconds) into.
+    """
+
+    def __init__(self, name, max_workers, max_pending, retention_seconds):
+        self.name = name
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        # Moving average of how long a job runs, for Retry-After
+        self._avg_run_seconds = 1.0
+
+    def submit(self, fn, *args):
+        now = time.time()
+        with self._lock:
+            self._purge(now)
+            if self._queued + self._running >= self.max_pending:
+                raise QueueFullError(f"{self.name} queue is full")
+            job_id = uuid.uuid4().hex
+            job = {
+                'id': job_id,
+                'status': 'queued',
+                'submittedAt': now,
+                'startedAt': None,
+                'finishedAt': None,
+                'timings': {},
+                'result': None,
+                'error': None
+            }
+            self._jobs[job_id] = job
+            self._queued += 1
+        self._executor.submit(self._run, job, fn, args)
+        return job_id
+
+    def _run(self, job, fn, args):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            job['status'] = 'running'
+            job['startedAt'] = time.time()
+            job['timings']['queueMs'] = round(1000 * (job['startedAt'] - job['submittedAt']), 1)
+
+        start = time.perf_counter()
+        try:
+            result, error = fn(*args, timings=job['timings']), None
+        except Exception as e:
+            print(f"Error in {self.name} job {job['id']}: {str(e)}")
+            print(traceback.format_exc())
+            result, error = None, str(e)
+        run_ms = round(1000 * (time.perf_counter() - start), 1)
+
+        with self._lock:
+            self._running -= 1
+            self._avg_run_seconds = 0.8 * self._avg_run_seconds + 0.2 * run_ms / 1000
+            job['timings']['runMs'] = run_ms
+            job['finishedAt'] = time.time()
+            job['result'] = result
+            job['error'] = error
+            if error is None:
+                job['status'] = 'done'
+                self._completed += 1
+            else:
+                job['status'] = 'failed'
+                self._failed += 1
+
+    def _purge(self, now):
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['finishedAt'] and now - job['finishedAt'] > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job, timings=dict(job['timings'])) if job else None
+
+    def retry_after(self):
+        """Seconds a client turned away by a full queue should wait: the time to drain it, at least 1."""
+        with self._lock:
+            seconds = self._avg_run_seconds * (self._queued + self._running) / max(self._max_workers, 1)
+        return max(1, math.ceil(seconds))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self._max_workers,
+                'maxPending': self.max_pending,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self._completed,
+                'failed': self._failed
+            }
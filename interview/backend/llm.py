@@ -1,25 +1,14 @@
-from langchain.chains.llm import LLMChain
 from langchain.prompts import PromptTemplate
 import json
 import re
 import pymongo
-import os
 import sys
-from bson import ObjectId
 from config import Config
-from langchain_groq import ChatGroq
+from llm_gateway import gateway
+from prompts import chain_name, normalize_whitespace, resolve_prompt_mode
+from serialization import dumps_text
 
 
-def initialize_llm():
-    os.environ["GROQ_API_KEY"] = Config.GROQ_AI_KEY
-    return ChatGroq(
-        model="mixtral-8x7b-32768",
-        temperature=0,
-        max_tokens=None,
-        timeout=None,
-        max_retries=2,
-    )
-
 def create_prompt_template():
     prompt_template = """
     You are a hiring expert and your task is to create a concise technical summary of the candidate based on the following schema.
@@ -58,41 +47,61 @@ def create_prompt_template():
     )
 
 
-def initialize_llm_chain(llm, prompt_template):
-    return LLMChain(llm=llm, prompt=prompt_template, verbose=True)
+def create_compact_prompt_template():
+    # Same task with a minified schema and a single, whitespace-normalized example
+    prompt_template = normalize_whitespace("""
+    You are a hiring expert. Create a concise technical summary of the candidate.
 
+    Candidate record schema: {table_schema}
 
-def make_serializable(data):
-    if isinstance(data, dict):
-        return {key: make_serializable(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [make_serializable(item) for item in data]
-    elif isinstance(data, ObjectId):
-        return str(data)
-    else:
-        return data
+    Example input:
+    {example_input}
+    Example output:
+    {example_output}
 
-def generate_summary(candidate_data):
-    llm = initialize_llm()
-    prompt_template = create_prompt_template()
-    llmchain = initialize_llm_chain(llm, prompt_template)
+    Candidate data:
+    {candidate_data}
 
-    # Convert the candidate data to a JSON-serializable format
-    serializable_data = make_serializable(candidate_data)
+    Highlight relevant skills, experience (including total years), certifications and education, formatted like the example. Return only the technical summary.
+    """)
+    return PromptTemplate(
+        template=prompt_template,
+        input_variables=["candidate_data", "table_schema", "example_input", "example_output"]
+    )
 
-    response = llmchain.invoke({
-        "candidate_data": json.dumps(serializable_data, indent=2),
+
+gateway.register_chain("generate_summary", "mixtral-8x7b-32768", create_prompt_template)
+gateway.register_chain("generate_summary:compact", "mixtral-8x7b-32768", create_compact_prompt_template)
+
+
+def summary_inputs(candidate_data, prompt_mode):
+    # The candidate document goes into the prompt as JSON, ObjectIds and dates included
+    if prompt_mode == "compact":
+        return {
+            "candidate_data": dumps_text(candidate_data),
+            "table_schema": json.dumps(Config.TABLE_SCHEMA, separators=(',', ':')),
+            "example_input": normalize_whitespace(Config.FEW_SHOT_EXAMPLE_1["input"]),
+            "example_output": normalize_whitespace(Config.FEW_SHOT_EXAMPLE_1["output"])
+        }
+    return {
+        "candidate_data": dumps_text(candidate_data, indent=True),
         "table_schema": json.dumps(Config.TABLE_SCHEMA, indent=2),
         "schema_description": Config.SCHEMA_DESCRIPTION,
         "example_1_input": Config.FEW_SHOT_EXAMPLE_1["input"],
         "example_1_output": Config.FEW_SHOT_EXAMPLE_1["output"],
         "example_2_input": Config.FEW_SHOT_EXAMPLE_2["input"],
         "example_2_output": Config.FEW_SHOT_EXAMPLE_2["output"]
-    })
+    }
+
+def generate_summary(candidate_data, prompt_mode=None):
+    prompt_mode = resolve_prompt_mode("generate_summary", prompt_mode)
+    response_text = gateway.invoke(
+        chain_name("generate_summary", prompt_mode),
+        summary_inputs(candidate_data, prompt_mode)
+    )
 
     # Clean up and return the response
-    response_text = response['text'].replace("Output: ", "")
-    return response_text.strip()
+    return response_text.replace("Output: ", "").strip()
 
 # Retrieve the candidate collection from MongoDB
 def get_collection():
@@ -0,0 +1,108 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from config import Config
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache of LLM responses stored in SQLite.
+
+    Entries are keyed by the model name plus a hash of the rendered prompt, so
+    it is only meaningful for deterministic (temperature=0) calls. Entries
+    older than `ttl_seconds` are treated as misses, and once the cache holds
+    more than `max_entries` the least recently used ones are evicted.
+    """
+
+    def __init__(self, path, ttl_seconds, max_entries):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model, prompt):
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return f"{model}:{digest}"
+
+    def get(self, model, prompt):
+        key = self.make_key(model, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, model, prompt, response):
+        key = self.make_key(model, prompt)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def delete(self, model, prompt):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (self.make_key(model, prompt),))
+            self._conn.commit()
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute("""
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'maxEntries': self.max_entries,
+                'ttlSeconds': self.ttl_seconds
+            }
+
+
+llm_cache = LLMResponseCache(
+    Config.LLM_CACHE_PATH,
+    ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+    max_entries=Config.LLM_CACHE_MAX_ENTRIES
+)
+
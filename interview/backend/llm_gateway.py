@@ -0,0 +1,280 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+import httpx
+from langchain.chains.llm import LLMChain
+from langchain_groq import ChatGroq
+from config import Config
+from llm_cache import llm_cache
+from llm_scheduler import resolve_priority, scheduler
+from metrics import llm_cache_hits, llm_call_seconds, llm_input_tokens, llm_output_tokens
+from tokens import count_tokens, prompt_sections
+
+
+class LLMGateway:
+    """
+    Process-wide access point for LLM calls.
+
+    Each model's ChatGroq client is created once and shares a keep-alive HTTP
+    connection pool; each named chain is built once from its prompt factory on
+    first use. `invoke` serves responses from the on-disk cache when possible
+    and records, per chain, how much time went to the provider and how much
+    to the gateway itself (chain lookup, prompt rendering, cache access),
+    along with input tokens broken down by prompt section and output tokens.
+
+    Provider calls go through the rate-limit scheduler (llm_scheduler.py),
+    which also owns retries, so the clients' own retries are turned off.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._async_http_client = None
+        self._llms = {}
+        self._chains = {}
+        self._chain_specs = {}
+        self._llm_factory = None
+        self._stats = defaultdict(lambda: {
+            'calls': 0,
+            'cacheHits': 0,
+            'llmSeconds': 0.0,
+            'overheadSeconds': 0.0,
+            'schedulerWaitSeconds': 0.0,
+            'retries': 0,
+            'inputTokens': 0,
+            'outputTokens': 0,
+            'sectionTokens': defaultdict(int)
+        })
+
+    def register_chain(self, name, model, prompt_factory):
+        """Declares a chain; it is built lazily on first use."""
+        with self._lock:
+            self._chain_specs[name] = (model, prompt_factory)
+
+    def set_llm_factory(self, factory):
+        """
+        Replaces how chat models are built: `factory(model)` returns the model
+        used for every chain on that model name. Pass None to restore ChatGroq.
+        Built clients and chains are dropped so the change applies right away.
+        Used by the offline benchmarks to swap in a fake provider.
+        """
+        with self._lock:
+            self._llm_factory = factory
+            self._llms.clear()
+            self._chains.clear()
+
+    def _get_http_client(self):
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=Config.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.LLM_MAX_CONNECTIONS
+                ),
+                timeout=Config.LLM_TIMEOUT_SECONDS
+            )
+        return self._http_client
+
+    def _get_async_http_client(self):
+        # Used by ainvoke; sized separately since async callers can keep many
+        # more requests in flight than there are threads
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=Config.LLM_ASYNC_MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.LLM_ASYNC_MAX_CONNECTIONS
+                ),
+                timeout=Config.LLM_TIMEOUT_SECONDS
+            )
+        return self._async_http_client
+
+    def get_llm(self, model):
+        with self._lock:
+            llm = self._llms.get(model)
+            if llm is None and self._llm_factory is not None:
+                llm = self._llms[model] = self._llm_factory(model)
+            elif llm is None:
+                llm = ChatGroq(
+                    model=model,
+                    temperature=0,
+                    max_tokens=None,
+                    timeout=None,
+                    max_retries=0 if Config.LLM_SCHEDULER_ENABLED else 2,
+                    api_key=Config.GROQ_AI_KEY,
+                    http_client=self._get_http_client(),
+                    http_async_client=self._get_async_http_client()
+                )
+                self._llms[model] = llm
+            return llm
+
+    def get_prompt(self, name):
+        """The named chain's prompt template, without building a client."""
+        chain = self._chains.get(name)
+        if chain is not None:
+            return chain.prompt
+        return self._chain_specs[name][1]()
+
+    def get_chain(self, name):
+        chain = self._chains.get(name)
+        if chain is not None:
+            return chain
+        model, prompt_factory = self._chain_specs[name]
+        llm = self.get_llm(model)
+        with self._lock:
+            chain = self._chains.get(name)
+            if chain is None:
+                chain = LLMChain(llm=llm, prompt=prompt_factory(), verbose=Config.LLM_VERBOSE)
+                self._chains[name] = chain
+            return chain
+
+    def invoke(self, name, inputs, validate=None):
+        """
+        Runs the named chain and returns its response text. `validate(text)`,
+        when given, says whether the caller can use a response: one it rejects
+        is still returned but not cached, so the next identical call reaches
+        the LLM again, and a cached response it rejects is dropped and asked
+        for again.
+        """
+        start = time.perf_counter()
+        chain, model, prompt, cached = self._begin(name, inputs, validate)
+        if cached is not None:
+            self._finish(name, model, start, cached=True)
+            return cached
+
+        sections = prompt_sections(chain.prompt.template, inputs)
+        reservation = None
+        attempt = 0
+        while True:
+            wait_start = time.perf_counter()
+            if Config.LLM_SCHEDULER_ENABLED:
+                reservation = scheduler.acquire(model, self._estimate(sections), resolve_priority(name))
+            llm_start = time.perf_counter()
+            try:
+                response_text = chain.invoke(inputs).get('text', '')
+                break
+            except Exception as e:
+                delay = scheduler.failed(reservation, e, attempt) if reservation else None
+                if delay is None:
+                    raise
+                print(f"LLM call {name} on {model} failed ({e}), retrying")
+                self._count_retry(name, llm_start - wait_start)
+                time.sleep(delay)
+                attempt += 1
+        llm_seconds = time.perf_counter() - llm_start
+
+        if prompt is not None and response_text and (validate is None or validate(response_text)):
+            llm_cache.set(model, prompt, response_text)
+        self._finish(name, model, start, llm_seconds=llm_seconds, wait_seconds=llm_start - wait_start,
+                     sections=sections, response_text=response_text, reservation=reservation)
+        return response_text
+
+    async def ainvoke(self, name, inputs, validate=None):
+        """
+        Async counterpart of `invoke` for the async serving path: the provider
+        call is awaited instead of holding a thread, and cache access runs in
+        a worker thread.
+        """
+        start = time.perf_counter()
+        chain, model, prompt, cached = await asyncio.to_thread(self._begin, name, inputs, validate)
+        if cached is not None:
+            self._finish(name, model, start, cached=True)
+            return cached
+
+        sections = prompt_sections(chain.prompt.template, inputs)
+        reservation = None
+        attempt = 0
+        while True:
+            wait_start = time.perf_counter()
+            if Config.LLM_SCHEDULER_ENABLED:
+                reservation = await scheduler.acquire_async(model, self._estimate(sections), resolve_priority(name))
+            llm_start = time.perf_counter()
+            try:
+                response_text = (await chain.ainvoke(inputs)).get('text', '')
+                break
+            except Exception as e:
+                delay = scheduler.failed(reservation, e, attempt) if reservation else None
+                if delay is None:
+                    raise
+                print(f"LLM call {name} on {model} failed ({e}), retrying")
+                self._count_retry(name, llm_start - wait_start)
+                await asyncio.sleep(delay)
+                attempt += 1
+        llm_seconds = time.perf_counter() - llm_start
+
+        if prompt is not None and response_text and (validate is None or validate(response_text)):
+            await asyncio.to_thread(llm_cache.set, model, prompt, response_text)
+        self._finish(name, model, start, llm_seconds=llm_seconds, wait_seconds=llm_start - wait_start,
+                     sections=sections, response_text=response_text, reservation=reservation)
+        return response_text
+
+    def _estimate(self, sections):
+        # Tokens to reserve before the call: the prompt plus a typical response
+        return sum(sections.values()) + Config.LLM_EXPECTED_OUTPUT_TOKENS
+
+    def _count_retry(self, name, wait_seconds):
+        with self._lock:
+            self._stats[name]['retries'] += 1
+            self._stats[name]['schedulerWaitSeconds'] += wait_seconds
+
+    def _begin(self, name, inputs, validate=None):
+        # Returns (chain, model, rendered prompt or None, cached response or None)
+        chain = self.get_chain(name)
+        model = chain.llm.model_name
+        if not Config.LLM_CACHE_ENABLED:
+            return chain, model, None, None
+        prompt = chain.prompt.format(**inputs)
+        cached = llm_cache.get(model, prompt)
+        if cached is not None and validate is not None and not validate(cached):
+            # Stored before responses were validated; ask again
+            llm_cache.delete(model, prompt)
+            cached = None
+        return chain, model, prompt, cached
+
+    def _finish(self, name, model, start, cached=False, llm_seconds=0.0, wait_seconds=0.0,
+                sections=None, response_text='', reservation=None):
+        total_seconds = time.perf_counter() - start
+        if cached:
+            llm_cache_hits.inc(model=model, call_site=name)
+            self._record(name, cache_hit=True, llm_seconds=0.0, total_seconds=total_seconds)
+            return
+        output_tokens = count_tokens(response_text)
+        if reservation is not None:
+            scheduler.complete(reservation, sum(sections.values()) + output_tokens)
+        llm_call_seconds.observe(llm_seconds, model=model, call_site=name)
+        llm_input_tokens.observe(sum(sections.values()), model=model, call_site=name)
+        llm_output_tokens.observe(output_tokens, model=model, call_site=name)
+        self._record(
+            name, cache_hit=False, llm_seconds=llm_seconds, total_seconds=total_seconds,
+            wait_seconds=wait_seconds, sections=sections, output_tokens=output_tokens
+        )
+
+    def _record(self, name, cache_hit, llm_seconds, total_seconds, wait_seconds=0.0, sections=None, output_tokens=0):
+        with self._lock:
+            stats = self._stats[name]
+            stats['calls'] += 1
+            stats['cacheHits'] += int(cache_hit)
+            stats['llmSeconds'] += llm_seconds
+            stats['overheadSeconds'] += total_seconds - llm_seconds - wait_seconds
+            stats['schedulerWaitSeconds'] += wait_seconds
+            stats['outputTokens'] += output_tokens
+            for section, tokens in (sections or {}).items():
+                stats['inputTokens'] += tokens
+                stats['sectionTokens'][section] += tokens
+
+    def stats(self):
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                calls = stats['calls']
+                result[name] = {
+                    **stats,
+                    'sectionTokens': dict(stats['sectionTokens']),
+                    'avgOverheadMs': 1000 * stats['overheadSeconds'] / calls if calls else 0.0
+                }
+            return {
+                'models': sorted(self._llms),
+                'chains': result
+            }
+
+
+gateway = LLMGateway()
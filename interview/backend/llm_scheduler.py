@@ -0,0 +1,275 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+import groq
+from config import Config
+from metrics import llm_rate_limited, llm_scheduler_wait_seconds
+
+# Lower rank goes first
+PRIORITIES = {'interactive': 0, 'standard': 1, 'bulk': 2}
+
+# Set by a request (e.g. bulk scoring) to override the call-site priority for
+# every LLM call it makes; copied into worker threads with contextvars.copy_context()
+_priority = contextvars.ContextVar('llm_priority', default=None)
+
+
+class SchedulerTimeoutError(Exception):
+    pass
+
+
+@contextmanager
+def llm_priority(priority):
+    """Runs the enclosed LLM calls at `priority` instead of their call-site default."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def run_with_priority(priority, fn, *args, **kwargs):
+    # For executor.submit: contextvars set in the caller do not reach pool threads
+    with llm_priority(priority):
+        return fn(*args, **kwargs)
+
+
+def resolve_priority(call_site):
+    """The request's priority override, else the call site's configured priority."""
+    return _priority.get() or Config.LLM_CALL_PRIORITIES.get(call_site.split(':')[0], 'standard')
+
+
+class TokenBucket:
+    """Refills continuously at `per_minute`; may go negative when actual usage exceeds a reservation."""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount):
+        # Requests larger than the whole bucket only wait for a full bucket
+        needed = min(amount, self.capacity) - self.level
+        return 0.0 if needed <= 0 else needed / self.rate
+
+
+class _ModelState:
+    def __init__(self, limits):
+        self.requests = TokenBucket(limits['rpm'])
+        self.tokens = TokenBucket(limits['tpm'])
+        self.waiters = []
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+        self.rate_limited = 0
+        self.granted = {priority: 0 for priority in PRIORITIES}
+        self.wait_seconds = {priority: 0.0 for priority in PRIORITIES}
+
+
+class Reservation:
+    def __init__(self, model, tokens, priority):
+        self.model = model
+        self.tokens = tokens
+        self.priority = priority
+
+
+class LLMScheduler:
+    """
+    Central gate for provider calls, shared by all models on one account.
+
+    Each model has token buckets for requests/min and tokens/min. A call
+    reserves one request and its estimated tokens; once it finishes the
+    estimate is corrected to the tokens actually used. Waiting calls are
+    served strictly by priority, then arrival, per model, and lower
+    priorities may not draw the buckets below their reserve
+    (Config.LLM_PRIORITY_RESERVE), so a burst of bulk work leaves headroom
+    for interactive calls that arrive later.
+
+    A rate-limit response blocks the model for the provider's Retry-After, or
+    an exponential backoff when there is none; the backoff resets on the next
+    success. Connection errors and 5xx responses are retried with the same
+    backoff without blocking the model.
+    """
+
+    def __init__(self, limits, default_limits):
+        self.limits = limits
+        self.default_limits = default_limits
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._models = {}
+        self._sequence = itertools.count()
+
+    def _state(self, model):
+        state = self._models.get(model)
+        if state is None:
+            state = self._models[model] = _ModelState(self.limits.get(model, self.default_limits))
+        return state
+
+    def _try_reserve(self, state, entry, reservation):
+        # Under the lock. Returns 0 when the reservation was granted, else how
+        # long to wait before trying again.
+        now = time.monotonic()
+        if now < state.blocked_until:
+            return state.blocked_until - now
+        if state.waiters[0] is not entry:
+            # Someone with higher priority or an earlier arrival goes first
+            return Config.LLM_SCHEDULER_POLL_SECONDS
+        state.requests.refill(now)
+        state.tokens.refill(now)
+        reserve = Config.LLM_PRIORITY_RESERVE.get(reservation.priority, 0.0)
+        wait = max(
+            state.requests.wait_time(1 + reserve * state.requests.capacity),
+            state.tokens.wait_time(reservation.tokens + reserve * state.tokens.capacity)
+        )
+        if wait > 0:
+            return wait
+        state.requests.level -= 1
+        state.tokens.level -= reservation.tokens
+        heapq.heappop(state.waiters)
+        return 0.0
+
+    def _enqueue(self, model, tokens, priority):
+        reservation = Reservation(model, tokens, priority)
+        entry = (PRIORITIES[priority], next(self._sequence), reservation)
+        with self._lock:
+            state = self._state(model)
+            heapq.heappush(state.waiters, entry)
+        return state, entry, reservation, time.monotonic()
+
+    def _granted(self, state, reservation, started):
+        waited = time.monotonic() - started
+        state.granted[reservation.priority] += 1
+        state.wait_seconds[reservation.priority] += waited
+        llm_scheduler_wait_seconds.observe(waited, model=reservation.model, priority=reservation.priority)
+        return reservation
+
+    def _abandon(self, state, entry, reservation, started):
+        state.waiters.remove(entry)
+        heapq.heapify(state.waiters)
+        self._changed.notify_all()
+        raise SchedulerTimeoutError(
+            f"Waited {time.monotonic() - started:.0f}s for {reservation.model} rate limit capacity"
+        )
+
+    def acquire(self, model, tokens, priority):
+        """Blocks until `model` has capacity for one request of `tokens` tokens."""
+        state, entry, reservation, started = self._enqueue(model, tokens, priority)
+        deadline = started + Config.LLM_SCHEDULER_MAX_WAIT_SECONDS
+        with self._lock:
+            while True:
+                wait = self._try_reserve(state, entry, reservation)
+                if wait == 0:
+                    self._changed.notify_all()
+                    return self._granted(state, reservation, started)
+                if time.monotonic() + wait > deadline:
+                    self._abandon(state, entry, reservation, started)
+                self._changed.wait(wait)
+
+    async def acquire_async(self, model, tokens, priority):
+        """Async counterpart of `acquire`; waiting holds no thread."""
+        state, entry, reservation, started = self._enqueue(model, tokens, priority)
+        deadline = started + Config.LLM_SCHEDULER_MAX_WAIT_SECONDS
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_reserve(state, entry, reservation)
+                    if wait == 0:
+                        self._changed.notify_all()
+                        return self._granted(state, reservation, started)
+                    if time.monotonic() + wait > deadline:
+                        self._abandon(state, entry, reservation, started)
+                # Not woken by the condition, so re-check at least every poll interval
+                await asyncio.sleep(min(wait, Config.LLM_SCHEDULER_POLL_SECONDS))
+        except asyncio.CancelledError:
+            with self._lock:
+                if entry in state.waiters:
+                    state.waiters.remove(entry)
+                    heapq.heapify(state.waiters)
+                    self._changed.notify_all()
+            raise
+
+    def complete(self, reservation, actual_tokens):
+        """Records a successful call and settles its token estimate against actual usage."""
+        with self._lock:
+            state = self._state(reservation.model)
+            state.tokens.level = min(state.tokens.capacity, state.tokens.level + reservation.tokens - actual_tokens)
+            state.backoff = 0.0
+            self._changed.notify_all()
+
+    def failed(self, reservation, error, attempt):
+        """
+        Records a failed call (`attempt` counts from 0) and refunds its token
+        estimate; a retry reserves again. Returns how long to sleep before
+        retrying, or None when the error is not retryable or retries are used
+        up. The request slot is not refunded: the provider counted it.
+        """
+        status = getattr(error, 'status_code', None)
+        rate_limited = status == 429
+        transient = isinstance(error, groq.APIConnectionError) or (status is not None and status >= 500)
+        retry = (rate_limited or transient) and attempt < Config.LLM_MAX_RETRIES
+
+        with self._lock:
+            state = self._state(reservation.model)
+            state.tokens.level = min(state.tokens.capacity, state.tokens.level + reservation.tokens)
+            self._changed.notify_all()
+            if not retry:
+                return None
+            state.backoff = min(
+                max(state.backoff * 2, Config.LLM_BACKOFF_BASE_SECONDS), Config.LLM_BACKOFF_MAX_SECONDS
+            )
+            delay = state.backoff
+            if rate_limited:
+                delay = max(delay, _retry_after(error))
+                state.rate_limited += 1
+                # Everyone on this model waits, not just this caller
+                state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+                llm_rate_limited.inc(model=reservation.model)
+        # Rate-limited retries wait in acquire; transient ones sleep in the caller
+        return 0.0 if rate_limited else delay
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            result = {}
+            for model, state in self._models.items():
+                state.requests.refill(now)
+                state.tokens.refill(now)
+                waiting = {priority: 0 for priority in PRIORITIES}
+                for rank, _, reservation in state.waiters:
+                    waiting[reservation.priority] += 1
+                result[model] = {
+                    'rpm': state.requests.capacity,
+                    'tpm': state.tokens.capacity,
+                    'availableRequests': round(state.requests.level, 2),
+                    'availableTokens': round(state.tokens.level),
+                    'waiting': waiting,
+                    'granted': dict(state.granted),
+                    'avgWaitMs': {
+                        priority: round(1000 * state.wait_seconds[priority] / count, 1) if count else 0.0
+                        for priority, count in state.granted.items()
+                    },
+                    'rateLimited': state.rate_limited,
+                    'blockedForSeconds': round(max(0.0, state.blocked_until - now), 2),
+                    'backoffSeconds': state.backoff
+                }
+            return result
+
+
+def _retry_after(error):
+    response = getattr(error, 'response', None)
+    try:
+        return float(response.headers.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+scheduler = LLMScheduler(Config.LLM_RATE_LIMITS, Config.LLM_DEFAULT_RATE_LIMITS)
@@ -0,0 +1,198 @@
+import threading
+from bisect import bisect_left
+from pymongo import monitoring
+
+# Bucket upper bounds; +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+TOKEN_BUCKETS = (16, 64, 256, 512, 1024, 2048, 4096, 8192, 16384)
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    def _render_samples(self, items):
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """
+    Cumulative histogram per label set. Each observation is one bisect and
+    one list update under a lock, so it is cheap enough for every request.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # Per-bucket counts (last slot is +Inf), then sum
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def _render_samples(self, items):
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                le = bound if bound == '+Inf' else _format_value(bound)
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', le)])} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+http_request_seconds = registry.register(Histogram(
+    'http_request_duration_seconds', 'Request latency by route.', ('method', 'route', 'status')))
+http_requests_in_flight = registry.register(Gauge(
+    'http_requests_in_flight', 'Requests currently being handled, by route.', ('method', 'route')))
+
+admission_in_flight = registry.register(Gauge(
+    'admission_in_flight', 'Requests holding an admission slot, by route class.', ('route_class',)))
+admission_queue_depth = registry.register(Gauge(
+    'admission_queue_depth', 'Requests waiting for an admission slot, by route class.', ('route_class',)))
+admission_rejected = registry.register(Counter(
+    'admission_rejected_total', 'Requests answered 429, by route class and reason.', ('route_class', 'reason')))
+
+llm_call_seconds = registry.register(Histogram(
+    'llm_call_duration_seconds', 'Provider latency of LLM calls that missed the cache.', ('model', 'call_site')))
+llm_input_tokens = registry.register(Histogram(
+    'llm_input_tokens', 'Approximate prompt tokens per LLM call.', ('model', 'call_site'), TOKEN_BUCKETS))
+llm_output_tokens = registry.register(Histogram(
+    'llm_output_tokens', 'Approximate response tokens per LLM call.', ('model', 'call_site'), TOKEN_BUCKETS))
+singleflight_calls = registry.register(Counter(
+    'singleflight_calls_total', 'Coalesced computations, by flight and whether the caller ran or shared it.',
+    ('flight', 'role')))
+llm_cache_hits = registry.register(Counter(
+    'llm_cache_hits_total', 'LLM calls served from the response cache.', ('model', 'call_site')))
+
+llm_scheduler_wait_seconds = registry.register(Histogram(
+    'llm_scheduler_wait_seconds', 'Time LLM calls waited for rate limit capacity.', ('model', 'priority')))
+llm_rate_limited = registry.register(Counter(
+    'llm_rate_limited_total', 'Rate-limit responses from the LLM provider.', ('model',)))
+
+mongo_command_seconds = registry.register(Histogram(
+    'mongo_command_duration_seconds', 'MongoDB command latency.', ('collection', 'command', 'outcome')))
+
+pdf_extract_seconds = registry.register(Histogram(
+    'pdf_extract_duration_seconds', 'Time to extract the text of an uploaded PDF.'))
+pdf_pages = registry.register(Histogram(
+    'pdf_extract_pages', 'Pages read per extracted PDF.', buckets=PAGE_BUCKETS))
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    Records the latency of every MongoDB command per collection and command.
+    Pass an instance to MongoClient(event_listeners=[...]).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._collections = {}
+
+    def started(self, event):
+        # The collection name is only on the started event; getMore carries
+        # the cursor id under its command name and the collection separately
+        collection = event.command.get('collection' if event.command_name == 'getMore' else event.command_name)
+        if not isinstance(collection, str):
+            collection = ''
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def _finish(self, event, outcome):
+        with self._lock:
+            collection = self._collections.pop((event.connection_id, event.request_id), '')
+        mongo_command_seconds.observe(
+            event.duration_micros / 1e6,
+            collection=collection, command=event.command_name, outcome=outcome
+        )
+
+    def succeeded(self, event):
+        self._finish(event, 'ok')
+
+    def failed(self, event):
+        self._finish(event, 'error')
+
@@ -1,29 +1,51 @@
 import fitz
 import re
-import os
 import json
-from langchain.chains.llm import LLMChain
+import time
 from langchain.prompts import PromptTemplate
-from langchain_groq import ChatGroq
 from config import Config
+from llm_gateway import gateway
+from metrics import pdf_extract_seconds, pdf_pages
+from prompts import chain_name, normalize_whitespace, resolve_prompt_mode
+from resume_heuristics import extract_fields, focus_text, merge_fields
 
-def extract_text_from_pdf(pdf_path):
-    """Extracts all the text from a given PDF."""
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
-
-def initialize_llm():
-    os.environ["GROQ_API_KEY"] = Config.GROQ_AI_KEY
-    return ChatGroq(
-        model="llama-3.1-70b-versatile",
-        temperature=0,
-        max_tokens=None,
-        timeout=None,
-        max_retries=2,
-    )
+RESUME_PARSE_MODES = ("full", "focused", "fast")
+
+def iter_pdf_pages(pdf, max_pages=None, max_chars=None):
+    """
+    Yields the text of a PDF page by page. `pdf` is either a file path or the
+    raw bytes of the document, which are read in memory without a temp file.
+    Stops after `max_pages` pages or `max_chars` characters.
+    """
+    if isinstance(pdf, (bytes, bytearray)):
+        doc = fitz.open(stream=pdf, filetype="pdf")
+    else:
+        doc = fitz.open(pdf)
+
+    with doc:
+        remaining = max_chars
+        for page_number, page in enumerate(doc):
+            if max_pages is not None and page_number >= max_pages:
+                break
+            text = page.get_text()
+            if remaining is not None:
+                if len(text) >= remaining:
+                    yield text[:remaining]
+                    break
+                remaining -= len(text)
+            yield text
+
+def extract_text_from_pdf(pdf, max_pages=None, max_chars=None):
+    """Extracts the text from a PDF (path or bytes), capped at the configured page and character limits."""
+    if max_pages is None:
+        max_pages = Config.PDF_MAX_PAGES
+    if max_chars is None:
+        max_chars = Config.PDF_MAX_CHARS
+    start = time.perf_counter()
+    pages = list(iter_pdf_pages(pdf, max_pages=max_pages, max_chars=max_chars))
+    pdf_extract_seconds.observe(time.perf_counter() - start)
+    pdf_pages.observe(len(pages))
+    return "".join(pages)
 
 def create_prompt_template():
     prompt_template = """
@@ -67,37 +89,126 @@ def create_prompt_template():
         input_variables=["resume_text"]
     )
 
-def initialize_llm_chain(llm, prompt_template):
-    return LLMChain(llm=llm, prompt=prompt_template, verbose=True)
+def create_compact_prompt_template():
+    # Same instructions with the indentation and blank-line padding removed
+    prompt = create_prompt_template()
+    return PromptTemplate(
+        template=normalize_whitespace(prompt.template),
+        input_variables=prompt.input_variables
+    )
+
+gateway.register_chain("parse_resume", "llama-3.1-70b-versatile", create_prompt_template)
+gateway.register_chain("parse_resume:compact", "llama-3.1-70b-versatile", create_compact_prompt_template)
+
+
+def parse_inputs(text, prompt_mode):
+    return {"resume_text": normalize_whitespace(text) if prompt_mode == "compact" else text}
+
 
+def parse_resume(text, mode=None, prompt_mode=None):
+    """
+    Parses resume text into the structured fields the interview form expects.
+
+    Modes:
+    - "full": the whole text goes to the LLM.
+    - "focused": contact details, skills and certifications are extracted
+      locally and the LLM only sees the sections that need understanding.
+      If the LLM call fails the local fields are returned on their own,
+      marked "fallback" so callers serve them without storing them.
+    - "fast": local extraction only, no LLM call.
+    Defaults to Config.RESUME_PARSE_MODE. `prompt_mode` picks the full or
+    compact prompt (see prompts.py).
+    """
+    mode = mode or Config.RESUME_PARSE_MODE
+    if mode == "full":
+        return parse_resume_with_llm(text, prompt_mode)
+
+    heuristic_data = extract_fields(text)
+    if mode == "fast":
+        return heuristic_data
+
+    try:
+        parsed_data = parse_resume_with_llm(focus_text(text), prompt_mode)
+    except Exception as e:
+        print(f"LLM resume parsing failed, using locally extracted fields: {e}")
+        parsed_data = {}
+    return merge_or_fallback(heuristic_data, parsed_data)
+
+
+async def aparse_resume(text, mode=None, prompt_mode=None):
+    """Async counterpart of parse_resume; the LLM call is awaited instead of blocking a thread."""
+    mode = mode or Config.RESUME_PARSE_MODE
+    if mode == "full":
+        return await aparse_resume_with_llm(text, prompt_mode)
+
+    heuristic_data = extract_fields(text)
+    if mode == "fast":
+        return heuristic_data
+
+    try:
+        parsed_data = await aparse_resume_with_llm(focus_text(text), prompt_mode)
+    except Exception as e:
+        print(f"LLM resume parsing failed, using locally extracted fields: {e}")
+        parsed_data = {}
+    return merge_or_fallback(heuristic_data, parsed_data)
 
 
-def parse_resume(text):
-    llm = initialize_llm()
-    prompt_template = create_prompt_template()
-    llm_chain = initialize_llm_chain(llm, prompt_template)
-    response = llm_chain.invoke({"resume_text": text})
-    raw_response = response.get('text', '')
+def merge_or_fallback(heuristic_data, parsed_data):
+    # No usable LLM output: the local fields alone, marked so the parse is
+    # tried again on the next upload instead of being stored
+    if not parsed_data:
+        return {**heuristic_data, "fallback": True}
+    return merge_fields(heuristic_data, parsed_data)
+
+
+def parse_resume_with_llm(text, prompt_mode=None):
+    prompt_mode = resolve_prompt_mode("parse_resume", prompt_mode)
+    raw_response = gateway.invoke(
+        chain_name("parse_resume", prompt_mode), parse_inputs(text, prompt_mode), validate=has_json_object
+    )
+    return read_parse_response(raw_response)
+
+
+async def aparse_resume_with_llm(text, prompt_mode=None):
+    prompt_mode = resolve_prompt_mode("parse_resume", prompt_mode)
+    raw_response = await gateway.ainvoke(
+        chain_name("parse_resume", prompt_mode), parse_inputs(text, prompt_mode), validate=has_json_object
+    )
+    return read_parse_response(raw_response)
+
+
+def read_parse_response(raw_response):
+    """Pulls the JSON object out of the LLM's response; {} when there is none."""
     if not raw_response:
         print("Error: LLM did not return any text.")
         return {}
-    clean_response = re.sub(r'```(?:json)?', '', raw_response).strip()
     try:
-        json_start = clean_response.find('{')
-        json_end = clean_response.rfind('}') + 1
-
-        if json_start == -1 or json_end == -1:
-            raise ValueError("No valid JSON found in the response.")
-
-        json_content = clean_response[json_start:json_end]
-        parsed_data = json.loads(json_content)
-        return parsed_data
+        return _json_object(raw_response)
     except (json.JSONDecodeError, ValueError) as e:
         print(f"JSON parsing failed: {e}")
     print("Unable to parse the response.")
     return {}
 
 
+def _json_object(raw_response):
+    clean_response = re.sub(r'```(?:json)?', '', raw_response).strip()
+    json_start = clean_response.find('{')
+    json_end = clean_response.rfind('}') + 1
+
+    if json_start == -1 or json_end == 0:
+        raise ValueError("No valid JSON found in the response.")
+
+    return json.loads(clean_response[json_start:json_end])
+
+
+def has_json_object(raw_response):
+    # Gateway validator: only responses read_parse_response can use are cached
+    try:
+        return bool(_json_object(raw_response))
+    except ValueError:
+        return False
+
+
 def save_parsed_resume(parsed_data):
     """Saves the parsed resume data to a JSON file."""
     name = parsed_data.get("name", "Unknown")
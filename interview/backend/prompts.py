@@ -0,0 +1,25 @@
+import re
+from config import Config
+
+PROMPT_MODES = ("full", "compact")
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+_SPACES = re.compile(r"[ \t]+")
+
+
+def normalize_whitespace(text):
+    """Strips indentation and trailing spaces, collapses runs of spaces and blank lines."""
+    lines = (_SPACES.sub(' ', line).strip() for line in str(text).splitlines())
+    return _BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
+
+
+def resolve_prompt_mode(call_site, mode=None):
+    """Resolves the prompt mode for a call site: an explicit mode, else Config.PROMPT_MODES, else "full"."""
+    mode = mode or Config.PROMPT_MODES.get(call_site, "full")
+    if mode not in PROMPT_MODES:
+        raise ValueError(f"Unknown prompt mode: {mode}")
+    return mode
+
+
+def chain_name(call_site, mode):
+    return call_site if mode == "full" else f"{call_site}:{mode}"
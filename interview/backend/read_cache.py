@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ReadThroughCache:
+    """
+    Small in-process read-through cache with LRU eviction and a TTL.
+
+    `get(key, loader)` returns the cached value when it is fresh and otherwise
+    calls `loader()` and caches the result (None results are not cached).
+    Writers must call `invalidate` after changing the underlying data. Cached
+    values are shared between requests, so callers must not mutate them.
+    """
+
+    def __init__(self, name, maxsize, ttl_seconds):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Bumped on every invalidation so a load that raced with a write is not cached
+        self._generation = 0
+
+    def get(self, key, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+        if value is not None:
+            self._store(key, value, now, generation)
+        return value
+
+    async def aget(self, key, loader):
+        """Like `get`, for an async loader: `loader()` returns an awaitable."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = await loader()
+        if value is not None:
+            self._store(key, value, now, generation)
+        return value
+
+    def _store(self, key, value, now, generation):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """Drops one key, or everything when no key is given."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'maxSize': self.maxsize,
+                'ttlSeconds': self.ttl_seconds
+            }
@@ -0,0 +1,140 @@
+import re
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"(?:\+\d{1,3}[\s-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b|\+\d[\d\s-]{8,14}\d")
+LINKEDIN_PATTERN = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/[^\s|,;()]+", re.IGNORECASE)
+GITHUB_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[^\s|,;()]+", re.IGNORECASE)
+BULLET_PATTERN = re.compile(r"^[\s\-•*●▪◦·–]+")
+
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me', 'career objective'],
+    'skills': ['skills', 'technical skills', 'key skills', 'core competencies', 'technologies', 'tech stack'],
+    'experience': ['experience', 'work experience', 'professional experience', 'work history',
+                   'employment', 'employment history', 'internships'],
+    'education': ['education', 'academic background', 'academics', 'qualifications'],
+    'projects': ['projects', 'personal projects', 'academic projects', 'key projects'],
+    'certifications': ['certifications', 'certificates', 'courses', 'licenses & certifications',
+                       'licenses and certifications'],
+}
+HEADING_TO_SECTION = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+# Fields found by an exact pattern; these override the LLM's values. The
+# others (Name, Skills, Certifications) are guesses that only fill gaps.
+REGEX_FIELDS = ('Email', 'Phone', 'LinkedIn URL', 'GitHub URL')
+
+# Sections that need the LLM to turn into structured data; contact details,
+# skills and certifications are filled in locally.
+LLM_SECTIONS = ('summary', 'experience', 'education', 'projects')
+
+
+def _heading(line):
+    cleaned = BULLET_PATTERN.sub('', line).strip().rstrip(':').strip().lower()
+    if not cleaned or len(cleaned) > 40:
+        return None
+    return HEADING_TO_SECTION.get(cleaned)
+
+
+def split_sections(text):
+    """
+    Splits resume text on recognised section headings.
+    Returns (header, sections): the text before the first heading and a dict
+    of section name to text. Repeated headings are appended together.
+    """
+    header = []
+    sections = {}
+    current = header
+    for line in text.splitlines():
+        section = _heading(line)
+        if section:
+            current = sections.setdefault(section, [])
+            continue
+        current.append(line)
+    return '\n'.join(header).strip(), {name: '\n'.join(lines).strip() for name, lines in sections.items()}
+
+
+def _first(pattern, text):
+    match = pattern.search(text)
+    return match.group(0).strip() if match else ''
+
+
+def _guess_name(header):
+    for line in header.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if '@' in line or any(ch.isdigit() for ch in line) or '/' in line:
+            return ''
+        words = line.split()
+        return line if 1 < len(words) <= 4 else ''
+    return ''
+
+
+def _skill_items(section_text):
+    skills = []
+    for line in section_text.splitlines():
+        line = BULLET_PATTERN.sub('', line).strip()
+        if ':' in line:
+            # "Languages: Python, SQL" -> drop the category label
+            line = line.split(':', 1)[1]
+        for item in re.split(r"[,|;•]", line):
+            item = item.strip()
+            if item and item not in skills:
+                skills.append(item)
+    return skills
+
+
+def _lines(section_text):
+    return [BULLET_PATTERN.sub('', line).strip() for line in section_text.splitlines() if line.strip()]
+
+
+def extract_fields(text):
+    """
+    Fills the fields a regex can find, in the same shape as the LLM parser's
+    output. Fields that need real understanding are left empty.
+    """
+    header, sections = split_sections(text)
+    return {
+        'Name': _guess_name(header or text),
+        'Email': _first(EMAIL_PATTERN, text),
+        'Phone': _first(PHONE_PATTERN, text),
+        'Position': '',
+        'LinkedIn URL': _first(LINKEDIN_PATTERN, text),
+        'GitHub URL': _first(GITHUB_PATTERN, text),
+        'Skills': _skill_items(sections.get('skills', '')),
+        'Experiences': [],
+        'Education': [],
+        'Projects': [],
+        'Certifications': '\n'.join(_lines(sections.get('certifications', ''))),
+        'Cover Letter': ''
+    }
+
+
+def focus_text(text):
+    """
+    Returns only the parts of the resume the LLM needs: the header (name and
+    position) plus the sections in LLM_SECTIONS. If no headings are found the
+    full text is returned unchanged.
+    """
+    header, sections = split_sections(text)
+    if not sections:
+        return text
+    parts = [header]
+    for name in LLM_SECTIONS:
+        if sections.get(name):
+            parts.append(f"{name.title()}:\n{sections[name]}")
+    return '\n\n'.join(parts)
+
+
+def merge_fields(heuristic, parsed):
+    """
+    Combines the locally extracted fields with the LLM output: REGEX_FIELDS
+    override it wherever they were found, every other field is only filled
+    in where the LLM left it empty.
+    """
+    merged = dict(parsed)
+    for key, value in heuristic.items():
+        if (value and key in REGEX_FIELDS) or not merged.get(key):
+            merged[key] = value
+    return merged
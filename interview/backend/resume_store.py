@@ -0,0 +1,74 @@
+import hashlib
+import os
+from datetime import datetime
+
+
+def fingerprint(pdf_bytes):
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+def _set(fields):
+    return {'$set': fields, '$setOnInsert': {'createdAt': datetime.utcnow()}}
+
+
+class ResumeStore:
+    """
+    Content-addressed store for uploaded resumes.
+
+    Uploads are fingerprinted by the SHA-256 of their bytes. The PDF itself is
+    written to `folder` once as `<sha256>.pdf`, however many submissions point
+    at it, and the extracted text and parsed JSON (per parse mode) are kept in
+    `collection` under the same fingerprint so repeat uploads skip PyMuPDF and
+    the LLM.
+    """
+
+    def __init__(self, collection, folder):
+        self.collection = collection
+        self.folder = folder
+
+    fingerprint = staticmethod(fingerprint)
+
+    def get(self, sha256):
+        return self.collection.find_one({'_id': sha256}) or {}
+
+    def save_text(self, sha256, text):
+        self.collection.update_one({'_id': sha256}, _set({'text': text}), upsert=True)
+
+    def save_parsed(self, sha256, mode, parsed_data):
+        self.collection.update_one({'_id': sha256}, _set({f'parsed.{mode}': parsed_data}), upsert=True)
+
+    def save_blob(self, pdf_bytes):
+        """Stores the PDF if it is not already present and returns its filename."""
+        sha256 = self.fingerprint(pdf_bytes)
+        filename = f"{sha256}.pdf"
+        path = os.path.join(self.folder, filename)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.urandom(8).hex()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, path)
+        self.collection.update_one(
+            {'_id': sha256}, _set({'filename': filename, 'size': len(pdf_bytes)}), upsert=True
+        )
+        return filename
+
+
+class AsyncResumeStore:
+    """
+    The text and parse records of ResumeStore over an AsyncMongoClient
+    collection, for the async serving path. Blobs are only written by the
+    synchronous app, which owns the upload folder.
+    """
+
+    fingerprint = staticmethod(fingerprint)
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def get(self, sha256):
+        return await self.collection.find_one({'_id': sha256}) or {}
+
+    async def save_text(self, sha256, text):
+        await self.collection.update_one({'_id': sha256}, _set({'text': text}), upsert=True)
+
+    async def save_parsed(self, sha256, mode, parsed_data):
+        await self.collection.update_one({'_id': sha256}, _set({f'parsed.{mode}': parsed_data}), upsert=True)
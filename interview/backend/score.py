@@ -1,20 +1,23 @@
-from langchain.chains.llm import LLMChain
 from langchain.prompts import PromptTemplate
-import json
-import os
-from langchain_groq import ChatGroq
 from config import Config
+from llm_gateway import gateway
+from prompts import chain_name, normalize_whitespace, resolve_prompt_mode
+import asyncio
+import contextvars
+import json
+import re
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 
-def initialize_llm():
-    os.environ["GROQ_API_KEY"] = Config.GROQ_AI_KEY
-    return ChatGroq(
-        model="llama-3.1-70b-versatile",
-        temperature=0,
-        max_tokens=None,
-        timeout=None,
-        max_retries=2,
-    )
+# Bump when the scoring prompt or score format changes so stored scores are recomputed
+SCORE_VERSION = 2
+
+# Fields summary_match returns; scores are numbers in 0-100, the rest non-empty text
+SCORE_FIELDS = ("Matching Similarity Score", "Relevancy Score", "Profile Score", "Overall Score")
+TEXT_FIELDS = ("Recommendation", "Summary")
+MATCH_FIELDS = SCORE_FIELDS + TEXT_FIELDS
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
 
 def summary_and_scores():
     prompt_template = """
@@ -36,25 +39,44 @@ def summary_and_scores():
     3. Profile Score (0-100): Determine the overall strength of the candidate's profile for the job.
     4. Overall Score (0-100): Combine the above scores to give an overall assessment.
 
-    Provide these scores as follows:
-    Matching Similarity Score: X/100
-    Relevancy Score: Y/100
-    Profile Score: Z/100
-    Overall Score: O/100
-
-    Additionally, provide a brief explanation (2-3 sentences) detailing why the candidate is a good fit for the job, emphasizing the alignment of technical and soft skills with both the job description and the expert's domain.
+    Additionally, write a brief explanation (2-3 sentences) detailing why the candidate is a good fit for the job, emphasizing the alignment of technical and soft skills with both the job description and the expert's domain.
     Finally, recommend which expert interview should be scheduled based on the candidate's profile and the expert's expertise.
-    Return only the Matching Similarity Score, Relevancy Score, Profile Score, Overall Score, the recommendation, and the overall brief summary of why the candidate is good for the job.
+
+    Return only a JSON object with exactly these keys and no other text:
+    {{"Matching Similarity Score": <0-100>, "Relevancy Score": <0-100>, "Profile Score": <0-100>, "Overall Score": <0-100>, "Recommendation": "<recommendation>", "Summary": "<brief explanation>"}}
     """
     return PromptTemplate(
         template=prompt_template,
         input_variables=["job_description", "candidate_profile", "expert_profile"]
     )
 
-def initialize_llm_chain(llm, prompt_template):
-    return LLMChain(llm=llm, prompt=prompt_template, verbose=True)
+def summary_and_scores_compact():
+    # Same instructions with the indentation and blank-line padding removed
+    prompt = summary_and_scores()
+    return PromptTemplate(
+        template=normalize_whitespace(prompt.template),
+        input_variables=prompt.input_variables
+    )
+
+def repair_fields():
+    prompt_template = """Below is an assessment of a candidate. Extract the following fields from it: {missing_fields}.
+Scores are numbers from 0 to 100. If a field is not stated, infer it from the assessment.
+Return only a JSON object with exactly those keys and no other text.
+
+Assessment:
+{response}
+"""
+    return PromptTemplate(
+        template=prompt_template,
+        input_variables=["missing_fields", "response"]
+    )
+
+gateway.register_chain("summary_match", "llama-3.1-70b-versatile", summary_and_scores)
+gateway.register_chain("summary_match:compact", "llama-3.1-70b-versatile", summary_and_scores_compact)
+# Repair only sees the previous answer and the missing keys, so a small model will do
+gateway.register_chain("summary_match:repair", "llama-3.1-8b-instant", repair_fields)
 
-def format_profile(profile):
+def format_profile(profile, compact=False):
     try:
         formatted = f"""
         Name: {profile['name']}
@@ -72,7 +94,7 @@ def format_profile(profile):
         {format_education(profile['educations'])}
         Certifications: {', '.join(profile.get('certifications', []))}
         """
-        return formatted.strip()
+        return normalize_whitespace(formatted) if compact else formatted.strip()
     except Exception as e:
         print(f"Error in format_profile: {str(e)}")
         print(f"Profile data: {profile}")
@@ -87,35 +109,250 @@ def format_projects(projects):
 def format_education(educations):
     return '\n'.join([f"- {edu['degree']} from {edu['institution']} ({edu['year']})" for edu in educations])
 
-def summary_match(candidate_profile, job_description, expert_profile):
+def match_inputs(candidate_profile, job_description, expert_profile, prompt_mode):
+    compact = prompt_mode == "compact"
+    formatted_candidate_profile = format_profile(candidate_profile, compact)
+    formatted_expert_profile = format_profile(expert_profile, compact) if expert_profile else "No expert profile provided"
+    return {
+        "candidate_profile": formatted_candidate_profile,
+        "job_description": normalize_whitespace(job_description) if compact else job_description,
+        "expert_profile": formatted_expert_profile
+    }
+
+def _score_value(value):
+    # Accepts 85, "85", "85/100" or "85%"; anything else or out of range is invalid
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        match = re.match(r"\s*(\d+(?:\.\d+)?)", value)
+        value = match.group(1) if match else None
     try:
-        llm = initialize_llm()
-        prompt_template = summary_and_scores()
-        llmchain = initialize_llm_chain(llm, prompt_template)
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if 0 <= value <= 100 else None
+
+def _lenient_fields(text):
+    # Free-text fallback: "Overall Score: 85/100", "Recommendation: ..." lines
+    fields = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(':')
+        key = key.strip(' \t*#-"')
+        if sep and key in MATCH_FIELDS:
+            fields[key] = value.strip(' \t*",')
+    return fields
+
+def validate_match_output(text):
+    """
+    Reads the fields of a summary_match response.
+
+    The JSON object in the response is used when there is one, otherwise
+    "Field: value" lines. Returns (fields, missing): the valid fields, and
+    the names of the ones that were absent or malformed.
+    """
+    raw = {}
+    match = _JSON_OBJECT.search(text or '')
+    if match:
+        try:
+            parsed = json.loads(match.group(0))
+            if isinstance(parsed, dict):
+                raw = parsed
+        except ValueError:
+            pass
+    if not raw:
+        raw = _lenient_fields(text or '')
 
-        formatted_candidate_profile = format_profile(candidate_profile)
-        formatted_expert_profile = format_profile(expert_profile) if expert_profile else "No expert profile provided"
+    fields = {}
+    for key in SCORE_FIELDS:
+        value = _score_value(raw.get(key))
+        if value is not None:
+            fields[key] = value
+    for key in TEXT_FIELDS:
+        value = raw.get(key)
+        if isinstance(value, str) and value.strip():
+            fields[key] = value.strip()
+    missing = [key for key in MATCH_FIELDS if key not in fields]
+    return fields, missing
 
-        response = llmchain.invoke({
-            "candidate_profile": formatted_candidate_profile,
-            "job_description": job_description,
-            "expert_profile": formatted_expert_profile
-        })
+def _fill_overall(fields, missing):
+    # A missing Overall Score is the mean of the other three scores
+    fields = dict(fields)
+    component_scores = [fields[key] for key in SCORE_FIELDS[:3] if key in fields]
+    if "Overall Score" in missing and len(component_scores) == 3:
+        fields["Overall Score"] = round(sum(component_scores) / 3, 1)
+    return fields, [key for key in missing if key not in fields]
 
-        response_text = response['text']
-        return response_text.strip()
+def _repair_inputs(response_text, missing):
+    return {
+        "missing_fields": ', '.join(f'"{key}"' for key in missing),
+        "response": response_text
+    }
+
+def _complete(response_text):
+    # Gateway validator: only responses with every field are cached, so an
+    # incomplete one is asked for again next time rather than replayed
+    return not validate_match_output(response_text)[1]
+
+def _repairs(missing):
+    # Gateway validator for a repair call: it must recover every field asked for
+    def validate(repair_text):
+        repaired, _ = validate_match_output(repair_text)
+        return all(key in repaired for key in missing)
+    return validate
+
+def _merge_repaired(fields, missing, repair_text):
+    repaired, _ = validate_match_output(repair_text)
+    for key in missing:
+        if key in repaired:
+            fields[key] = repaired[key]
+    return fields, [key for key in missing if key not in fields]
+
+def repair_match_output(response_text, fields, missing):
+    """
+    Fills in missing fields without re-running the full prompt.
+
+    A missing Overall Score is the mean of the other three scores. Anything
+    still missing is asked for in one small call that sees only the previous
+    answer and the missing keys.
+    """
+    fields, missing = _fill_overall(fields, missing)
+    if not missing:
+        return fields, missing
+    repair_text = gateway.invoke(
+        "summary_match:repair", _repair_inputs(response_text, missing), validate=_repairs(missing)
+    )
+    return _merge_repaired(fields, missing, repair_text)
+
+async def arepair_match_output(response_text, fields, missing):
+    """Async counterpart of repair_match_output."""
+    fields, missing = _fill_overall(fields, missing)
+    if not missing:
+        return fields, missing
+    repair_text = await gateway.ainvoke(
+        "summary_match:repair", _repair_inputs(response_text, missing), validate=_repairs(missing)
+    )
+    return _merge_repaired(fields, missing, repair_text)
+
+def summary_match(candidate_profile, job_description, expert_profile, prompt_mode=None):
+    """
+    Scores a candidate against the job and an expert profile.
+
+    Returns a dict with every key in MATCH_FIELDS when the response could be
+    read or repaired, or with a "missing" list naming the fields that could
+    not be recovered.
+    """
+    try:
+        prompt_mode = resolve_prompt_mode("summary_match", prompt_mode)
+        response_text = gateway.invoke(
+            chain_name("summary_match", prompt_mode),
+            match_inputs(candidate_profile, job_description, expert_profile, prompt_mode),
+            validate=_complete
+        )
+        fields, missing = validate_match_output(response_text)
+        if missing:
+            print(f"summary_match response missing {missing}, repairing")
+            try:
+                fields, missing = repair_match_output(response_text, fields, missing)
+            except Exception as e:
+                print(f"Error repairing summary_match response: {str(e)}")
+        if missing:
+            fields["missing"] = missing
+        return fields
     except Exception as e:
         print(f"Error in summary_match: {str(e)}")
         print(traceback.format_exc())
         raise
 
-def parse_scores(match_result):
-    scores = {}
-    for line in match_result.split('\n'):
-        if ':' in line:
-            key, value = line.split(':')
+async def asummary_match(candidate_profile, job_description, expert_profile, prompt_mode=None):
+    """Async counterpart of summary_match, for the async serving path."""
+    try:
+        prompt_mode = resolve_prompt_mode("summary_match", prompt_mode)
+        response_text = await gateway.ainvoke(
+            chain_name("summary_match", prompt_mode),
+            match_inputs(candidate_profile, job_description, expert_profile, prompt_mode),
+            validate=_complete
+        )
+        fields, missing = validate_match_output(response_text)
+        if missing:
+            print(f"summary_match response missing {missing}, repairing")
             try:
-                scores[key.strip()] = float(value.strip().split('/')[0])
-            except ValueError:
-                print(f"Error parsing score: {line}")
-    return scores
\ No newline at end of file
+                fields, missing = await arepair_match_output(response_text, fields, missing)
+            except Exception as e:
+                print(f"Error repairing summary_match response: {str(e)}")
+        if missing:
+            fields["missing"] = missing
+        return fields
+    except Exception as e:
+        print(f"Error in asummary_match: {str(e)}")
+        print(traceback.format_exc())
+        raise
+
+def match_experts(candidate_profile, job_description, experts, max_workers=None, deadline=None):
+    """
+    Runs summary_match for every expert at the same time.
+
+    At most `max_workers` calls are in flight and the whole batch is given
+    `deadline` seconds. A `None` entry in `experts` is the overall match with no
+    expert profile. Returns (expert, scores) pairs in input order; experts
+    whose call failed or did not finish in time are skipped.
+    """
+    max_workers = max_workers or Config.EXPERT_MATCH_CONCURRENCY
+    deadline = deadline or Config.SCORE_DEADLINE_SECONDS
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="summary-match")
+    try:
+        futures = [
+            # Each call keeps the caller's LLM priority (e.g. bulk scoring)
+            executor.submit(contextvars.copy_context().run, summary_match, candidate_profile, job_description, expert)
+            for expert in experts
+        ]
+        done, not_done = wait(futures, timeout=deadline)
+        if not_done:
+            print(f"Skipping {len(not_done)} expert matches that missed the {deadline}s deadline")
+
+        results = []
+        for expert, future in zip(experts, futures):
+            if future not in done:
+                continue
+            try:
+                results.append((expert, future.result()))
+            except Exception as e:
+                name = expert['name'] if expert else 'overall'
+                print(f"Error calculating match for expert {name}: {str(e)}")
+        return results
+    finally:
+        # Don't hold the request open for stragglers; queued calls are dropped.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+async def amatch_experts(candidate_profile, job_description, experts, max_concurrency=None, deadline=None):
+    """
+    Async counterpart of match_experts: the same concurrency limit, deadline
+    and result order, but waiting calls hold no threads. Calls still running
+    at the deadline are cancelled.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or Config.EXPERT_MATCH_CONCURRENCY)
+    deadline = deadline or Config.SCORE_DEADLINE_SECONDS
+
+    async def run(expert):
+        async with semaphore:
+            return await asummary_match(candidate_profile, job_description, expert)
+
+    tasks = [asyncio.ensure_future(run(expert)) for expert in experts]
+    if not tasks:
+        return []
+    done, not_done = await asyncio.wait(tasks, timeout=deadline)
+    if not_done:
+        print(f"Skipping {len(not_done)} expert matches that missed the {deadline}s deadline")
+        for task in not_done:
+            task.cancel()
+
+    results = []
+    for expert, task in zip(experts, tasks):
+        if task not in done:
+            continue
+        try:
+            results.append((expert, task.result()))
+        except Exception as e:
+            name = expert['name'] if expert else 'overall'
+            print(f"Error calculating match for expert {name}: {str(e)}")
+    return results
\ No newline at end of file
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from datetime import datetime
+
+# Key used for the overall match, which is scored without an expert profile
+OVERALL = 'overall'
+
+
+def expert_key(expert):
+    return str(expert['_id']) if expert else OVERALL
+
+
+def _fingerprint(document):
+    if document is None:
+        return ''
+    payload = {key: value for key, value in document.items() if key != '_id'}
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def match_input_hash(job_description, candidate_profile, expert_profile, version):
+    """Hash of everything a stored score depends on: the job description, both profiles and the scoring version."""
+    digest = hashlib.sha256()
+    for part in (str(version), job_description or '', _fingerprint(candidate_profile), _fingerprint(expert_profile)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class MatchScoreStore:
+    """
+    Persisted match scores, one document per (job, candidate, expert).
+
+    Each document carries the hash of the inputs it was computed from, so a
+    stored score is reused only while the job description, resume and expert
+    profile are unchanged.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def load(self, job_id, candidate_email):
+        """Returns the stored scores for a job and candidate, keyed by expert key."""
+        return {
+            doc['expertId']: doc
+            for doc in self.collection.find({'jobId': job_id, 'candidateEmail': candidate_email})
+        }
+
+    def save(self, job_id, candidate_email, expert, input_hash, scores):
+        self.collection.update_one(*self._upsert(job_id, candidate_email, expert, input_hash, scores), upsert=True)
+
+    def delete_job(self, job_id):
+        self.collection.delete_many({'jobId': job_id})
+
+    @staticmethod
+    def _upsert(job_id, candidate_email, expert, input_hash, scores):
+        return (
+            {'jobId': job_id, 'candidateEmail': candidate_email, 'expertId': expert_key(expert)},
+            {'$set': {
+                'inputHash': input_hash,
+                'scores': scores,
+                'updatedAt': datetime.utcnow()
+            }}
+        )
+
+
+class AsyncMatchScoreStore(MatchScoreStore):
+    """MatchScoreStore over an AsyncMongoClient collection; the same methods, awaited."""
+
+    async def load(self, job_id, candidate_email):
+        cursor = self.collection.find({'jobId': job_id, 'candidateEmail': candidate_email})
+        return {doc['expertId']: doc async for doc in cursor}
+
+    async def save(self, job_id, candidate_email, expert, input_hash, scores):
+        await self.collection.update_one(*self._upsert(job_id, candidate_email, expert, input_hash, scores), upsert=True)
+
+    async def delete_job(self, job_id):
+        await self.collection.delete_many({'jobId': job_id})
@@ -0,0 +1,107 @@
+"""
+One JSON layer for API responses and LLM prompt inputs.
+
+`dumps` serializes MongoDB documents as they come from the driver: ObjectId
+becomes its hex string and datetimes become ISO 8601 (naive ones are UTC, as
+stored by PyMongo), at any depth and in the same pass as the rest of the
+document, so handlers no longer copy or patch documents before responding.
+orjson is used when installed, otherwise the standard library encoder.
+
+`compress_response` gzip- or Brotli-encodes large JSON responses for clients
+that accept it; Brotli needs the optional `brotli` package.
+"""
+import gzip
+import json
+from datetime import date, datetime, timezone
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from flask.json.provider import JSONProvider
+from config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _default(value):
+    # BSON types neither encoder handles on its own
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent=False):
+    """Serializes `obj` to UTF-8 JSON bytes; compact unless `indent` (two spaces)."""
+    if orjson is not None:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        return json.dumps(obj, default=_default, ensure_ascii=False, indent=2).encode()
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def dumps_text(obj, indent=False):
+    """Like `dumps`, as a str (for prompts and NDJSON lines)."""
+    return dumps(obj, indent).decode()
+
+
+def loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class BSONJSONProvider(JSONProvider):
+    """Flask/Quart JSON provider: `jsonify` and `request.json` go through this module."""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return dumps_text(obj)
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skips the bytes -> str -> bytes round trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def compress_response(response, accept_encodings):
+    """
+    Compresses a buffered JSON response in place when it is at least
+    Config.COMPRESS_MIN_BYTES and the client accepts br or gzip
+    (`accept_encodings` is the request's parsed Accept-Encoding). Streamed,
+    empty and already-encoded responses are left alone.
+    """
+    if (not Config.COMPRESS_RESPONSES or response.is_streamed or response.direct_passthrough
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers or response.mimetype != 'application/json'):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < Config.COMPRESS_MIN_BYTES:
+        return response
+
+    if brotli is not None and accept_encodings.quality('br') > 0:
+        response.set_data(brotli.compress(body, quality=Config.BROTLI_QUALITY))
+        response.headers['Content-Encoding'] = 'br'
+    elif accept_encodings.quality('gzip') > 0:
+        response.set_data(gzip.compress(body, compresslevel=Config.GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from metrics import singleflight_calls
+
+
+class SingleFlight:
+    """
+    De-duplicates identical computations that are in progress at the same time.
+
+    The first caller for a key runs the computation; callers arriving with the
+    same key while it runs wait for it and get the same result, or the same
+    exception. Nothing is kept once the computation finishes, so later callers
+    start a new one. Threads (`do`) and coroutines (`do_async`) share flights,
+    so a request on the async app can join one started by the Flask app and
+    vice versa. Shared results must not be mutated by callers.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.leaders = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._flights = {}
+        # Async leaders' tasks, referenced until done so they are not collected
+        self._tasks = set()
+
+    def _join(self, key):
+        # Returns the key's flight and whether this caller has to run it
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.shared += 1
+                singleflight_calls.inc(flight=self.name, role='shared')
+                return future, False
+            future = self._flights[key] = Future()
+            self.leaders += 1
+            singleflight_calls.inc(flight=self.name, role='leader')
+            return future, True
+
+    def _land(self, key, future, result=None, error=None):
+        with self._lock:
+            del self._flights[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key, fn, *args, **kwargs):
+        """Returns (fn(*args, **kwargs), shared), joining an identical call already in flight."""
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(), True
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._land(key, future, error=e)
+            raise
+        self._land(key, future, result=result)
+        return result, False
+
+    async def do_async(self, key, fn, *args, **kwargs):
+        """
+        Like `do`, for a coroutine function. The computation runs as its own
+        task, so it carries on for the other callers if the one that started
+        it is cancelled.
+        """
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(self._run(key, future, fn, *args, **kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await asyncio.shield(asyncio.wrap_future(future)), not leader
+
+    async def _run(self, key, future, fn, *args, **kwargs):
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            self._land(key, future, error=e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        self._land(key, future, result=result)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'inFlight': len(self._flights),
+                'leaders': self.leaders,
+                'shared': self.shared
+            }
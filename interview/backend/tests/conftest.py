@@ -0,0 +1,92 @@
+"""
+Tests run from the backend directory against an in-memory MongoDB (mongomock)
+and the fake chat model from bench/, so they need neither a mongod nor a Groq
+key. The environment is set before config.py is imported.
+"""
+import os
+import sys
+
+import mongomock
+import pymongo
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+os.chdir(BACKEND)
+
+os.environ.setdefault('DB_NAME', 'SIH_test')
+os.environ['LLM_CACHE_ENABLED'] = '0'
+os.environ['LLM_VERBOSE'] = '0'
+pymongo.MongoClient = mongomock.MongoClient
+
+
+@pytest.fixture(scope='session')
+def appmod():
+    import app
+    return app
+
+
+@pytest.fixture
+def client(appmod):
+    return appmod.app.test_client()
+
+
+@pytest.fixture
+def fake_llm(appmod):
+    """Installs the fake chat model; the returned list of models records every one built."""
+    from bench.fake_llm import FakeChatModel
+    built = []
+
+    def factory(model, **kwargs):
+        llm = FakeChatModel(model_name=model, latency=0.0, jitter=0.0, seed=1)
+        built.append(llm)
+        return llm
+
+    appmod.gateway.set_llm_factory(factory)
+    yield built
+    appmod.gateway.set_llm_factory(None)
+
+
+@pytest.fixture(autouse=True)
+def upload_folder(appmod, tmp_path, monkeypatch):
+    # Uploaded blobs go to a temporary folder, not the app's uploads/
+    monkeypatch.setattr(appmod.resume_store, 'folder', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def llm_cache(appmod, tmp_path, monkeypatch):
+    """Turns the LLM response cache on, backed by a fresh SQLite file."""
+    import llm_gateway
+    from config import Config
+    from llm_cache import LLMResponseCache
+    cache = LLMResponseCache(str(tmp_path / 'llm_cache.sqlite3'), ttl_seconds=3600, max_entries=100)
+    monkeypatch.setattr(Config, 'LLM_CACHE_ENABLED', True)
+    monkeypatch.setattr(llm_gateway, 'llm_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def scripted_llm(appmod):
+    """
+    Installs a chat model that answers with the given replies in order;
+    `scripted_llm(*replies)` returns it, and its `calls` counts provider calls.
+    """
+    from typing import Any
+    from bench.fake_llm import FakeChatModel
+
+    class ScriptedChatModel(FakeChatModel):
+        replies: Any = None
+        calls: int = 0
+
+        def respond(self, prompt):
+            self.calls += 1
+            return self.replies.pop(0)
+
+    def install(*replies):
+        llm = ScriptedChatModel(model_name='scripted', latency=0.0, jitter=0.0, replies=list(replies))
+        appmod.gateway.set_llm_factory(lambda model, **kwargs: llm)
+        return llm
+
+    yield install
+    appmod.gateway.set_llm_factory(None)
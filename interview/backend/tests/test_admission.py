@@ -0,0 +1,46 @@
+import io
+import random
+import time
+
+from bench.fake_llm import FakeChatModel
+from bench.load import make_profile
+
+
+def test_bulk_slot_held_until_scoring_finishes_after_disconnect(appmod, client, monkeypatch):
+    rng = random.Random(7)
+    job_id = str(appmod.job_openings_collection.insert_one(
+        {'title': 'Backend Engineer', 'fullDescription': 'Python services on MongoDB'}
+    ).inserted_id)
+    for i in range(3):
+        candidate = make_profile(rng, i, 'bulk.example.com')
+        appmod.resume_collection.insert_one(candidate)
+        appmod.application_collection.insert_one({'userId': f'bulk-{i}', 'jobId': job_id, 'email': candidate['email']})
+    bulk = appmod.admissions['bulk']
+    # One candidate at a time, so scoring outlasts the first streamed line
+    monkeypatch.setattr(appmod.Config, 'BULK_SCORE_CONCURRENCY', 1)
+    appmod.gateway.set_llm_factory(lambda model, **kwargs: FakeChatModel(model_name=model, latency=0.3, jitter=0.0))
+    try:
+        response = client.post(f'/api/job-openings/{job_id}/score-candidates', buffered=False)
+        # The client goes away after the first line
+        response.close()
+        assert bulk.stats()['inFlight'] == 1
+
+        deadline = time.monotonic() + 10
+        while bulk.stats()['inFlight'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert bulk.stats()['inFlight'] == 0
+        assert appmod.match_score_collection.count_documents({'jobId': job_id}) > 0
+    finally:
+        appmod.gateway.set_llm_factory(None)
+
+
+def test_full_parse_queue_answers_like_admission_control(appmod, client, monkeypatch):
+    monkeypatch.setattr(appmod.parse_jobs, 'max_pending', 0)
+    response = client.post(
+        '/api/parse-resume?async=1',
+        data={'resume': (io.BytesIO(b'%PDF-1.4\n'), 'resume.pdf')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 429
+    assert response.json['success'] is False
+    assert int(response.headers['Retry-After']) == response.json['retryAfter'] >= 1
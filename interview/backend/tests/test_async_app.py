@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip('hypercorn')
+pytest.importorskip('quart')
+
+
+def post_through_asgi(path, data, files):
+    import async_app
+
+    async def send():
+        transport = httpx.ASGITransport(app=async_app.application)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await client.post(path, data=data, files=files)
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize('size', [1024, 100 * 1024])
+def test_flask_routes_accept_bodies_over_64k(appmod, size):
+    # Routes passed through to Flask must take ordinary uploads, not just small bodies
+    pdf = b'%PDF-1.4\n' + b'0' * size
+    response = post_through_asgi(
+        '/api/submit-interview',
+        data={'name': 'Asha Rao', 'email': f'asha.{size}@example.com'},
+        files={'resume': ('resume.pdf', pdf, 'application/pdf')}
+    )
+    assert response.status_code == 200
+    assert response.json()['success'] is True
+
+
+def test_full_parse_queue_answers_like_admission_control(appmod, monkeypatch):
+    monkeypatch.setattr(appmod.parse_jobs, 'max_pending', 0)
+    response = post_through_asgi(
+        '/api/parse-resume?async=1', data={},
+        files={'resume': ('resume.pdf', b'%PDF-1.4\n', 'application/pdf')}
+    )
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) == response.json()['retryAfter'] >= 1
@@ -0,0 +1,64 @@
+import json
+import random
+import time
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+
+from bench.fake_llm import FakeChatModel
+from bench.load import build_plan, parse_mix, percentile, seed, summarize
+
+
+def test_nearest_rank_percentiles():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) is None
+
+
+def test_seeded_database_and_plan_follow_the_arguments():
+    rng = random.Random(3)
+    args = SimpleNamespace(jobs=6, resumes=8, applications=20, employees=4, requests=200,
+                           mix='job-openings=1,score-candidate=1', parse_mode='focused')
+    db = mongomock.MongoClient()['bench_test']
+
+    ids = seed(db, args, rng)
+    assert len(ids['jobIds']) == db['JobOpening'].count_documents({}) == 6
+    assert db['Employee'].count_documents({}) == 4
+    assert len(set(ids['applications'])) == db['application'].count_documents({}) == 20
+
+    plan = build_plan(args, ids, rng)
+    assert len(plan) == 200
+    assert {name for name, *_ in plan} == {'job-openings', 'score-candidate'}
+    for name, method, path, pdf in plan:
+        if name == 'score-candidate':
+            job_id, email = path.split('/')[-2:]
+            assert (job_id, email) in ids['applications']
+
+    with pytest.raises(SystemExit):
+        parse_mix('job-openings=1,unknown=2')
+
+
+def test_report_counts_errors_per_endpoint():
+    results = [('job-openings', 200, 0.010), ('job-openings', 200, 0.030), ('score-candidate', 500, 0.100)]
+    report = summarize(results, wall_seconds=2.0)
+
+    assert report['job-openings']['requests'] == 2 and report['job-openings']['errors'] == 0
+    assert report['job-openings']['p50Ms'] == 10.0 and report['job-openings']['p99Ms'] == 30.0
+    assert report['score-candidate']['errors'] == 1
+    assert 'parse-resume' not in report
+    assert report['total'] == {'requests': 3, 'errors': 1, 'wallSeconds': 2.0, 'throughput': 1.5}
+
+
+def test_fake_model_answers_by_prompt_after_its_latency():
+    llm = FakeChatModel(model_name='fake', latency=0.05, jitter=0.0, seed=1)
+
+    start = time.perf_counter()
+    parsed = json.loads(llm.invoke("You are an expert resume parser.").content)
+    assert time.perf_counter() - start >= 0.05
+    assert parsed['Email'] == 'priya.sharma@example.com'
+    scores = json.loads(llm.invoke("Give a matching score for this candidate.").content)
+    assert 40 <= scores['Overall Score'] <= 95
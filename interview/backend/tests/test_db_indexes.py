@@ -0,0 +1,42 @@
+from pymongo.mongo_client import MongoClient as PyMongoClient
+
+from db_indexes import ensure_indexes
+
+
+def test_ensure_indexes_survives_unreachable_server():
+    # The real driver (conftest swaps pymongo.MongoClient for mongomock), pointed at a closed port
+    client = PyMongoClient('mongodb://127.0.0.1:1', serverSelectionTimeoutMS=100, connect=False)
+    try:
+        assert ensure_indexes(client['SIH_test']) is False
+    finally:
+        client.close()
+
+
+def test_repeat_application_rejected_without_unique_index(appmod, client, monkeypatch):
+    collection = appmod.application_collection
+    collection.drop_index('userId_1_jobId_1')
+    monkeypatch.setattr(appmod, 'unique_applications', False)
+    try:
+        body = {'userId': 'u-dup', 'email': 'dup@example.com'}
+        assert client.post('/api/job-openings/job-dup/apply', json=body).status_code == 200
+        assert client.post('/api/job-openings/job-dup/apply', json=body).status_code == 400
+        assert collection.count_documents({'userId': 'u-dup'}) == 1
+    finally:
+        collection.delete_many({'userId': 'u-dup'})
+        ensure_indexes(appmod.db)
+
+
+def test_apply_does_not_recheck_indexes(appmod, client, monkeypatch):
+    # The index check happens once at startup; a later Mongo error there must not fail applies
+    assert appmod.unique_applications is True
+
+    def unreachable(db):
+        raise AssertionError("verify_indexes called per request")
+
+    monkeypatch.setattr(appmod, 'verify_indexes', unreachable)
+    monkeypatch.setattr(appmod, 'unique_applications', False)
+    try:
+        body = {'userId': 'u-once', 'email': 'once@example.com'}
+        assert client.post('/api/job-openings/job-once/apply', json=body).status_code == 200
+    finally:
+        appmod.application_collection.delete_many({'userId': 'u-once'})
@@ -0,0 +1,39 @@
+from bson import ObjectId
+
+from expert_index import ExpertIndex, prefilter_experts
+
+
+def expert(name, position, skills):
+    return {'_id': ObjectId(), 'name': name, 'position': position, 'skills': skills, 'experiences': []}
+
+
+EXPERTS = [
+    expert('Radar', 'Radar Signal Processing Scientist', ['MATLAB', 'DSP', 'Radar']),
+    expert('Backend', 'Backend Engineer', ['Python', 'Flask', 'MongoDB']),
+    expert('Data', 'Data Engineer', ['Python', 'Spark', 'SQL']),
+    expert('Chemist', 'Propellant Chemist', ['Chemistry', 'Combustion']),
+]
+CANDIDATE = {'position': 'Software Engineer', 'skills': ['Python', 'Flask'], 'experiences': []}
+
+
+def test_prefilter_keeps_the_top_k_best_matches():
+    shortlist = prefilter_experts(EXPERTS, CANDIDATE, "Backend developer for Python Flask APIs on MongoDB", k=2)
+
+    assert [e['name'] for e in shortlist] == ['Backend', 'Data']
+
+
+def test_prefilter_is_off_for_small_rosters_and_k_zero():
+    assert prefilter_experts(EXPERTS, CANDIDATE, "Python", k=4) == EXPERTS
+    assert prefilter_experts(EXPERTS, CANDIDATE, "Python", k=0) == EXPERTS
+
+
+def test_refresh_reindexes_changed_and_drops_removed_experts():
+    index = ExpertIndex()
+    roster = [dict(e) for e in EXPERTS]
+    index.refresh(roster)
+    assert index.search("combustion", 1)[0][0] == str(roster[3]['_id'])
+
+    roster[0]['skills'] = ['Combustion', 'Combustion', 'Propulsion']
+    index.refresh(roster[:1])
+
+    assert [expert_id for expert_id, _ in index.search("combustion", 5)] == [str(roster[0]['_id'])]
@@ -0,0 +1,62 @@
+import random
+
+from pymongo.errors import DuplicateKeyError
+
+from bench.load import make_profile
+
+
+def test_failed_score_save_still_returns_scores(appmod, client, fake_llm, monkeypatch):
+    rng = random.Random(5)
+    job_id = str(appmod.job_openings_collection.insert_one(
+        {'title': 'Backend Engineer', 'fullDescription': 'Python services on MongoDB'}
+    ).inserted_id)
+    candidate = make_profile(rng, 0, 'flows.example.com')
+    appmod.resume_collection.insert_one(candidate)
+
+    def save_score(*args):
+        raise DuplicateKeyError("E11000 duplicate key error")
+
+    monkeypatch.setitem(appmod.flow_steps, 'save_score', save_score)
+    response = client.get(f"/api/score-candidate/{job_id}/{candidate['email']}")
+
+    assert response.status_code == 200
+    assert response.json['matchResult']['Overall Score'] >= 0
+
+
+def test_stored_scores_are_reused_until_inputs_change(appmod, client, fake_llm, monkeypatch):
+    rng = random.Random(9)
+    job_id = str(appmod.job_openings_collection.insert_one(
+        {'title': 'Data Engineer', 'fullDescription': 'Spark pipelines in Python'}
+    ).inserted_id)
+    candidate = make_profile(rng, 0, 'reuse.example.com')
+    appmod.resume_collection.insert_one(candidate)
+
+    scored = []
+    match_experts = appmod.flow_steps['match_experts']
+
+    def recording(candidate_resume, job_description, experts):
+        scored.append(len(experts))
+        return match_experts(candidate_resume, job_description, experts)
+
+    monkeypatch.setitem(appmod.flow_steps, 'match_experts', recording)
+
+    def score():
+        response = client.get(f"/api/score-candidate/{job_id}/{candidate['email']}")
+        assert response.status_code == 200
+        return response.json
+
+    first = score()
+    assert scored[-1] >= 1
+    # Unchanged inputs: every pair comes from the store
+    assert score() == first
+    assert scored[-1] == 0
+
+    client.put(f'/api/job-openings/{job_id}', json={'fullDescription': 'Kafka streaming in Go'})
+    score()
+    assert scored[-1] == scored[0]
+
+    appmod.resume_collection.update_one({'email': candidate['email']}, {'$set': {'skills': ['Go']}})
+    score()
+    assert scored[-1] == scored[0]
+    score()
+    assert scored[-1] == 0
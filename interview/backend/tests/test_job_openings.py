@@ -0,0 +1,87 @@
+import pytest
+
+
+@pytest.fixture
+def jobs(appmod):
+    appmod.job_openings_collection.delete_many({})
+    appmod.application_collection.delete_many({'userId': {'$regex': '^listing-'}})
+    ids = [str(appmod.job_openings_collection.insert_one(
+        {'title': f'Job {i}', 'company': 'DRDO', 'pay': 1000 * i}
+    ).inserted_id) for i in range(5)]
+    for i, job_id in enumerate(ids):
+        for n in range(i % 3):
+            appmod.application_collection.insert_one(
+                {'userId': f'listing-{i}-{n}', 'jobId': job_id, 'email': f'a{n}@example.com'}
+            )
+    yield ids
+    appmod.job_openings_collection.delete_many({})
+    appmod.application_collection.delete_many({'userId': {'$regex': '^listing-'}})
+
+
+def test_applicant_counts_match_per_job_count(appmod, client, jobs):
+    listing = client.get('/api/job-openings').json
+
+    assert [job['_id'] for job in listing] == jobs
+    for job in listing:
+        assert job['applicantCount'] == appmod.application_collection.count_documents({'jobId': job['_id']})
+        assert job['title'] and job['company'] == 'DRDO'
+
+
+def test_paging_and_projection(client, jobs):
+    page = client.get('/api/job-openings?page=2&limit=2&fields=title').json
+
+    assert [job['_id'] for job in page] == jobs[2:4]
+    assert set(page[0]) == {'_id', 'title', 'applicantCount'}
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('limit=-5', slice(0, 1)),
+    ('limit=0', slice(0, 1)),
+    ('limit=2&page=0', slice(0, 2)),
+    ('limit=1000', slice(0, 5)),
+    ('limit=2&page=999999999999', slice(5, 5)),
+])
+def test_limit_and_page_are_clamped(client, jobs, query, expected):
+    response = client.get(f'/api/job-openings?{query}')
+
+    assert response.status_code == 200
+    assert [job['_id'] for job in response.json] == jobs[expected]
+
+
+def test_candidates_are_joined_with_batched_lookups(appmod, client, monkeypatch):
+    job_id = str(appmod.job_openings_collection.insert_one({'title': 'Analyst'}).inserted_id)
+    for n in range(3):
+        user_id = str(appmod.users_collection.insert_one({'name': f'Applicant {n}'}).inserted_id)
+        email = f'joined{n}@example.com'
+        appmod.resume_collection.insert_one({'email': email, 'phone': f'98{n}', 'skills': ['Python']})
+        appmod.application_collection.insert_one({'userId': user_id, 'jobId': job_id, 'email': email})
+    # A malformed userId must not fail the listing
+    appmod.application_collection.insert_one({'userId': 'not-an-id', 'jobId': job_id, 'email': 'joined0@example.com'})
+
+    queries = []
+
+    def counted(name):
+        find = getattr(appmod, name).find
+
+        def wrapper(*args, **kwargs):
+            queries.append(name)
+            return find(*args, **kwargs)
+        return wrapper
+
+    for name in ('users_collection', 'resume_collection'):
+        monkeypatch.setattr(getattr(appmod, name), 'find', counted(name))
+
+    candidates = client.get(f'/api/job-openings/{job_id}/candidates').json
+
+    assert sorted(queries) == ['resume_collection', 'users_collection']
+    assert len(candidates) == 4
+    named = [c for c in candidates if c['userId'] != 'not-an-id']
+    assert sorted(c['name'] for c in named) == ['Applicant 0', 'Applicant 1', 'Applicant 2']
+    for candidate in candidates:
+        resume = candidate['resumeData']
+        assert resume['email'] == candidate['email'] and resume['phone']
+        # Only the card's fields unless the full resume is asked for
+        assert 'skills' not in resume
+
+    full = client.get(f'/api/job-openings/{job_id}/candidates?include=resume').json
+    assert all(c['resumeData']['skills'] == ['Python'] for c in full)
@@ -0,0 +1,62 @@
+import io
+import threading
+import time
+
+import pytest
+
+from jobs import JobQueue, QueueFullError
+from test_parse import RESUME, make_pdf
+
+
+def wait_for(queue, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job['status'] in ('done', 'failed'):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_async_parse_is_polled_to_completion(appmod, client, fake_llm):
+    response = client.post(
+        '/api/parse-resume?async=1&mode=focused',
+        data={'resume': (io.BytesIO(make_pdf(RESUME + "\nReference: async")), 'resume.pdf')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 202
+    job_id = response.json['jobId']
+    wait_for(appmod.parse_jobs, job_id)
+
+    polled = client.get(response.json['statusUrl'])
+    assert polled.status_code == 200
+    assert polled.json['status'] == 'done'
+    assert polled.json['parsed_data']['Email'] == 'asha.verma@example.com'
+    assert {'queueMs', 'runMs'} <= set(polled.json['timings'])
+    assert client.get('/api/parse-resume/jobs/unknown').status_code == 404
+
+
+def test_queue_bounds_pending_jobs_and_reports_failures():
+    queue = JobQueue('test', max_workers=1, max_pending=2, retention_seconds=60)
+    release = threading.Event()
+
+    def blocked(timings):
+        release.wait(5)
+        return 'ok'
+
+    def broken(timings):
+        raise ValueError("bad input")
+
+    first = queue.submit(blocked)
+    second = queue.submit(broken)
+    with pytest.raises(QueueFullError):
+        queue.submit(blocked)
+    release.set()
+
+    assert wait_for(queue, first)['result'] == 'ok'
+    failed = wait_for(queue, second)
+    assert failed['status'] == 'failed' and failed['error'] == 'bad input'
+    stats = queue.stats()
+    assert (stats['completed'], stats['failed'], stats['queued'], stats['running']) == (1, 1, 0, 0)
+    # Room again once the queue has drained
+    wait_for(queue, queue.submit(blocked))
@@ -0,0 +1,70 @@
+import asyncio
+
+from bench.fake_llm import PARSE_RESPONSE
+from parse import aparse_resume_with_llm, parse_resume_with_llm
+
+
+def test_unusable_response_is_not_cached(llm_cache, scripted_llm):
+    llm = scripted_llm("Sorry, I could not read that resume.", PARSE_RESPONSE)
+
+    assert parse_resume_with_llm("Priya Sharma\nPython") == {}
+    # The retry reaches the LLM instead of replaying the unusable answer
+    assert parse_resume_with_llm("Priya Sharma\nPython")['Name'] == 'Priya Sharma'
+    assert llm.calls == 2
+
+    # The usable answer is cached
+    assert parse_resume_with_llm("Priya Sharma\nPython")['Name'] == 'Priya Sharma'
+    assert llm.calls == 2
+    assert llm_cache.stats()['entries'] == 1
+
+
+def test_cached_unusable_response_is_dropped(llm_cache, scripted_llm, appmod):
+    llm = scripted_llm(PARSE_RESPONSE)
+    prompt = appmod.gateway.get_prompt('parse_resume').format(resume_text="Priya Sharma\nPython")
+    llm_cache.set('scripted', prompt, "no JSON here")
+
+    assert parse_resume_with_llm("Priya Sharma\nPython")['Name'] == 'Priya Sharma'
+    assert llm.calls == 1
+    assert llm_cache.get('scripted', prompt) == PARSE_RESPONSE
+
+
+def test_unusable_response_is_not_cached_async(llm_cache, scripted_llm):
+    llm = scripted_llm("Sorry, I could not read that resume.", PARSE_RESPONSE)
+
+    assert asyncio.run(aparse_resume_with_llm("Priya Sharma\nPython")) == {}
+    assert asyncio.run(aparse_resume_with_llm("Priya Sharma\nPython"))['Name'] == 'Priya Sharma'
+    assert llm.calls == 2
+
+
+def test_repeat_prompt_is_served_from_the_cache(llm_cache, scripted_llm, appmod):
+    llm = scripted_llm(PARSE_RESPONSE)
+
+    first = parse_resume_with_llm("Priya Sharma\nPython")
+    second = parse_resume_with_llm("Priya Sharma\nPython")
+
+    assert first == second
+    assert llm.calls == 1
+    assert llm_cache.stats()['hits'] == 1
+    assert appmod.gateway.stats()['chains']['parse_resume']['cacheHits'] >= 1
+
+
+def test_expired_and_least_recently_used_entries_are_dropped(tmp_path, monkeypatch):
+    import llm_cache as llm_cache_module
+    from llm_cache import LLMResponseCache
+
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache_module.time, 'time', lambda: now[0])
+    cache = LLMResponseCache(str(tmp_path / 'cache.sqlite3'), ttl_seconds=60, max_entries=2)
+
+    cache.set('m', 'a', 'A')
+    now[0] += 1
+    cache.set('m', 'b', 'B')
+    now[0] += 1
+    assert cache.get('m', 'a') == 'A'  # a is now more recently used than b
+    now[0] += 1
+    cache.set('m', 'c', 'C')
+
+    assert cache.get('m', 'b') is None
+    assert cache.get('m', 'a') == 'A'
+    now[0] += 61
+    assert cache.get('m', 'c') is None
@@ -0,0 +1,35 @@
+from config import Config
+from llm_gateway import LLMGateway
+
+
+def test_chains_and_clients_are_built_once(appmod):
+    from bench.fake_llm import FakeChatModel
+    built = []
+
+    def factory(model, **kwargs):
+        built.append(model)
+        return FakeChatModel(model_name=model, latency=0.0, jitter=0.0)
+
+    gateway = appmod.gateway
+    gateway.set_llm_factory(factory)
+    try:
+        chain = gateway.get_chain('parse_resume')
+        assert gateway.get_chain('parse_resume') is chain
+        # Chains on the same model share one client
+        assert gateway.get_chain('summary_match').llm is chain.llm
+        gateway.invoke('parse_resume', {'resume_text': 'Priya Sharma'})
+        gateway.invoke('parse_resume', {'resume_text': 'Rohan Das'})
+        assert built == ['llama-3.1-70b-versatile']
+    finally:
+        gateway.set_llm_factory(None)
+
+
+def test_groq_clients_share_one_connection_pool(monkeypatch):
+    monkeypatch.setattr(Config, 'GROQ_AI_KEY', 'test-key')
+    gateway = LLMGateway()
+
+    large, small = gateway.get_llm('llama-3.1-70b-versatile'), gateway.get_llm('llama-3.1-8b-instant')
+
+    assert gateway.get_llm('llama-3.1-70b-versatile') is large
+    assert large is not small
+    assert large.http_client is small.http_client is gateway._get_http_client()
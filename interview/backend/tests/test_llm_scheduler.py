@@ -0,0 +1,29 @@
+import pytest
+
+import llm_gateway
+from bench.fake_llm import FakeChatModel
+from config import Config
+from llm_scheduler import LLMScheduler
+
+
+class BrokenChatModel(FakeChatModel):
+    def respond(self, prompt):
+        raise ValueError("malformed request")
+
+
+def test_bucket_recovers_after_non_retryable_error(appmod, monkeypatch):
+    scheduler = LLMScheduler({}, {'rpm': 1000, 'tpm': 100000})
+    monkeypatch.setattr(Config, 'LLM_SCHEDULER_ENABLED', True)
+    monkeypatch.setattr(llm_gateway, 'scheduler', scheduler)
+    appmod.gateway.set_llm_factory(lambda model, **kwargs: BrokenChatModel(model_name=model, latency=0.0, jitter=0.0))
+    try:
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                appmod.gateway.invoke('parse_resume', {'resume_text': 'Asha Verma\nPython'})
+        model = appmod.gateway.get_chain('parse_resume').llm.model_name
+    finally:
+        appmod.gateway.set_llm_factory(None)
+
+    stats = scheduler.stats()[model]
+    assert stats['availableTokens'] == stats['tpm']
+    assert stats['availableRequests'] < stats['rpm']
@@ -0,0 +1,57 @@
+import random
+from types import SimpleNamespace
+
+from bson.int64 import Int64
+
+from bench.fake_llm import FakeChatModel
+from bench.load import make_profile
+from metrics import MongoCommandMetrics, http_request_seconds, mongo_command_seconds
+
+
+def observed(histogram, **labels):
+    # (count, sum) recorded so far for one label set
+    counts, total = histogram._values.get(histogram._key(labels), [[0], 0.0])
+    return sum(counts), total
+
+
+def test_get_more_is_labelled_with_its_collection():
+    listener = MongoCommandMetrics()
+    before, _ = observed(mongo_command_seconds, collection='application', command='getMore', outcome='ok')
+
+    listener.started(SimpleNamespace(
+        command_name='getMore', command={'getMore': Int64(42), 'collection': 'application'},
+        connection_id=('localhost', 27017), request_id=7
+    ))
+    listener.succeeded(SimpleNamespace(
+        command_name='getMore', duration_micros=1500, connection_id=('localhost', 27017), request_id=7
+    ))
+
+    after, _ = observed(mongo_command_seconds, collection='application', command='getMore', outcome='ok')
+    assert after == before + 1
+
+
+def test_streamed_bulk_scoring_is_timed_to_the_end_of_the_stream(appmod, client, monkeypatch):
+    rng = random.Random(11)
+    job_id = str(appmod.job_openings_collection.insert_one(
+        {'title': 'Backend Engineer', 'fullDescription': 'Python services on MongoDB'}
+    ).inserted_id)
+    for i in range(2):
+        candidate = make_profile(rng, i, 'metrics.example.com')
+        appmod.resume_collection.insert_one(candidate)
+        appmod.application_collection.insert_one({'userId': f'metrics-{i}', 'jobId': job_id, 'email': candidate['email']})
+    monkeypatch.setattr(appmod.Config, 'BULK_SCORE_CONCURRENCY', 1)
+    appmod.gateway.set_llm_factory(lambda model, **kwargs: FakeChatModel(model_name=model, latency=0.3, jitter=0.0))
+    labels = dict(method='POST', route='/api/job-openings/<job_id>/score-candidates', status=200)
+    count_before, sum_before = observed(http_request_seconds, **labels)
+    try:
+        response = client.post(f'/api/job-openings/{job_id}/score-candidates', buffered=False)
+        lines = list(response.response)
+        response.close()
+    finally:
+        appmod.gateway.set_llm_factory(None)
+
+    assert len(lines) == 3
+    count_after, sum_after = observed(http_request_seconds, **labels)
+    assert count_after == count_before + 1
+    # Two candidates scored one after the other, 0.3 s each
+    assert sum_after - sum_before >= 0.55
@@ -0,0 +1,76 @@
+import io
+
+import fitz
+
+RESUME = "Asha Verma\nasha.verma@example.com\n+91 98765 43210\nSkills\nPython, Flask\nExperience\nBackend engineer at Acme"
+
+
+def make_pdf(text):
+    document = fitz.open()
+    document.new_page().insert_text((72, 72), text)
+    return document.tobytes()
+
+
+def parse(client, pdf_bytes, mode):
+    return client.post(
+        f'/api/parse-resume?mode={mode}',
+        data={'resume': (io.BytesIO(pdf_bytes), 'resume.pdf')},
+        content_type='multipart/form-data'
+    )
+
+
+def test_fallback_parse_is_served_but_not_stored(appmod, client):
+    def unavailable(model, **kwargs):
+        raise ConnectionError("provider unavailable")
+
+    pdf_bytes = make_pdf(RESUME)
+    appmod.gateway.set_llm_factory(unavailable)
+    try:
+        response = parse(client, pdf_bytes, 'focused')
+    finally:
+        appmod.gateway.set_llm_factory(None)
+
+    assert response.status_code == 200
+    parsed_data = response.json['parsed_data']
+    assert parsed_data['fallback'] is True
+    assert parsed_data['Email'] == 'asha.verma@example.com'
+    stored = appmod.resume_store.get(appmod.resume_store.fingerprint(pdf_bytes))
+    assert 'focused' not in stored.get('parsed', {})
+
+
+def test_llm_parse_is_stored(appmod, client, fake_llm):
+    pdf_bytes = make_pdf(RESUME + "\nReference: stored")
+    response = parse(client, pdf_bytes, 'focused')
+
+    assert response.status_code == 200
+    assert 'fallback' not in response.json['parsed_data']
+    stored = appmod.resume_store.get(appmod.resume_store.fingerprint(pdf_bytes))
+    assert stored['parsed']['focused'] == response.json['parsed_data']
+
+
+def make_multipage_pdf(*pages):
+    document = fitz.open()
+    for text in pages:
+        document.new_page().insert_text((72, 72), text)
+    return document.tobytes()
+
+
+def test_pdf_text_is_read_from_bytes_or_path(tmp_path):
+    from parse import extract_text_from_pdf
+    pdf_bytes = make_pdf(RESUME)
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(pdf_bytes)
+
+    text = extract_text_from_pdf(pdf_bytes)
+    assert 'asha.verma@example.com' in text
+    assert extract_text_from_pdf(str(path)) == text
+
+
+def test_pdf_extraction_stops_at_page_and_character_limits():
+    from parse import extract_text_from_pdf
+    pdf_bytes = make_multipage_pdf("first page", "second page", "third page")
+
+    assert 'third' in extract_text_from_pdf(pdf_bytes, max_pages=3, max_chars=1000)
+    two_pages = extract_text_from_pdf(pdf_bytes, max_pages=2, max_chars=1000)
+    assert 'second page' in two_pages and 'third' not in two_pages
+    assert extract_text_from_pdf(pdf_bytes, max_pages=3, max_chars=5) == 'first'
@@ -0,0 +1,40 @@
+import pytest
+
+from prompts import normalize_whitespace, resolve_prompt_mode
+from tokens import count_tokens, prompt_sections
+
+
+def test_whitespace_is_normalized():
+    text = "    Skills:\t Python,   Flask  \n\n\n\n        Experience\n"
+    assert normalize_whitespace(text) == "Skills: Python, Flask\n\nExperience"
+
+
+def test_sections_count_each_input_and_the_template_text():
+    template = "Resume:\n{resume_text}\nJob:\n{job_description}"
+    sections = prompt_sections(template, {'resume_text': 'Asha Verma, Python', 'job_description': ''})
+
+    assert set(sections) == {'template', 'resume_text', 'job_description'}
+    assert sections['template'] == count_tokens("Resume:\n\nJob:\n")
+    assert sections['resume_text'] > 0 and sections['job_description'] == 0
+
+
+@pytest.mark.parametrize('call_site', ['parse_resume', 'summary_match', 'generate_summary'])
+def test_compact_prompts_are_smaller(appmod, call_site):
+    from bench.prompt_tokens import measure
+    full, compact = measure(call_site, 'full', live=False), measure(call_site, 'compact', live=False)
+    assert compact['tokens'] < full['tokens']
+
+
+def test_gateway_records_tokens_per_section(appmod, fake_llm):
+    before = appmod.gateway.stats()['chains'].get('parse_resume:compact', {}).get('sectionTokens', {})
+    appmod.gateway.invoke('parse_resume:compact', {'resume_text': 'Rohan Das\nrohan@example.com'})
+
+    after = appmod.gateway.stats()['chains']['parse_resume:compact']['sectionTokens']
+    assert after['resume_text'] > before.get('resume_text', 0)
+    assert after['template'] > before.get('template', 0)
+
+
+def test_unknown_prompt_mode_is_rejected():
+    assert resolve_prompt_mode('parse_resume', 'compact') == 'compact'
+    with pytest.raises(ValueError):
+        resolve_prompt_mode('parse_resume', 'tiny')
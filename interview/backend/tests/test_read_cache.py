@@ -0,0 +1,49 @@
+from read_cache import ReadThroughCache
+
+
+def test_loads_once_until_invalidated():
+    cache = ReadThroughCache('test', maxsize=10, ttl_seconds=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return {'value': len(loads)}
+
+    assert cache.get('a', loader) == {'value': 1}
+    assert cache.get('a', loader) == {'value': 1}
+    cache.invalidate('a')
+    assert cache.get('a', loader) == {'value': 2}
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+    # Missing documents are looked up again
+    assert cache.get('missing', lambda: None) is None
+    assert cache.stats()['entries'] == 1
+
+
+def test_expiry_eviction_and_racing_writes():
+    cache = ReadThroughCache('test', maxsize=2, ttl_seconds=0)
+    cache.get('a', lambda: 1)
+    assert cache.get('a', lambda: 2) == 2
+
+    cache = ReadThroughCache('test', maxsize=2, ttl_seconds=60)
+    for key in ('a', 'b', 'c'):
+        cache.get(key, lambda: key)
+    assert cache.get('a', lambda: 'reloaded') == 'reloaded'
+
+    def stale_loader():
+        # A write lands while this load is in flight
+        cache.invalidate('d')
+        return 'stale'
+
+    assert cache.get('d', stale_loader) == 'stale'
+    assert cache.get('d', lambda: 'fresh') == 'fresh'
+
+
+def test_job_cache_is_invalidated_by_updates(appmod, client):
+    job_id = str(appmod.job_openings_collection.insert_one({'title': 'Cached role'}).inserted_id)
+    assert appmod.load_job(job_id)['title'] == 'Cached role'
+    hits = appmod.job_cache.hits
+    assert appmod.load_job(job_id)['title'] == 'Cached role'
+    assert appmod.job_cache.hits == hits + 1
+
+    assert client.put(f'/api/job-openings/{job_id}', json={'title': 'Renamed role'}).status_code == 200
+    assert appmod.load_job(job_id)['title'] == 'Renamed role'
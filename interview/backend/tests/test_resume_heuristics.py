@@ -0,0 +1,29 @@
+from resume_heuristics import extract_fields, merge_fields
+
+RESUME = """Curriculum Vitae
+asha.verma@example.com | +91 98765 43210 | linkedin.com/in/ashaverma
+Skills
+Python, Flask, MongoDB
+Experience
+Backend engineer at Acme"""
+
+
+def test_llm_name_wins_over_first_line():
+    heuristic = extract_fields(RESUME)
+    assert heuristic['Name'] == 'Curriculum Vitae'
+
+    merged = merge_fields(heuristic, {'Name': 'Asha Verma', 'Email': 'asha@old-mail.com', 'Skills': []})
+
+    assert merged['Name'] == 'Asha Verma'
+    assert merged['Email'] == 'asha.verma@example.com'
+    assert merged['LinkedIn URL'] == 'linkedin.com/in/ashaverma'
+    assert merged['Skills'] == ['Python', 'Flask', 'MongoDB']
+
+
+def test_guessed_fields_fill_only_gaps():
+    heuristic = extract_fields(RESUME)
+    merged = merge_fields(heuristic, {'Name': '', 'Skills': ['Go'], 'Position': 'Backend Engineer'})
+
+    assert merged['Name'] == 'Curriculum Vitae'
+    assert merged['Skills'] == ['Go']
+    assert merged['Position'] == 'Backend Engineer'
@@ -0,0 +1,69 @@
+import json
+import random
+import threading
+import time
+
+import score
+from bench.load import make_profile
+from score import match_experts, summary_match
+
+COMPLETE = json.dumps({
+    "Matching Similarity Score": 70, "Relevancy Score": 80, "Profile Score": 75, "Overall Score": 75,
+    "Recommendation": "Schedule the backend interview", "Summary": "Strong Python background."
+})
+
+
+def test_unrecovered_pair_is_scored_again(llm_cache, scripted_llm):
+    rng = random.Random(3)
+    candidate, expert = make_profile(rng, 0, 'example.com'), make_profile(rng, 1, 'drdo.gov.in')
+    llm = scripted_llm('{"Summary": "Strong Python background."}', "I can't tell.", COMPLETE)
+
+    first = summary_match(candidate, "Backend engineer", expert)
+    assert 'missing' in first
+    assert llm.calls == 2  # the scoring call and one repair call
+
+    # Neither the incomplete answer nor the failed repair is replayed from the cache
+    second = summary_match(candidate, "Backend engineer", expert)
+    assert 'missing' not in second
+    assert second['Overall Score'] == 75
+    assert llm.calls == 3
+
+
+def test_match_experts_runs_calls_concurrently_in_input_order(monkeypatch):
+    experts = [None] + [{'name': f'Expert {i}'} for i in range(5)]
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def fake_summary_match(candidate, job_description, expert):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.2 if expert is None else 0.05 * (5 - int(expert['name'][-1])))
+        with lock:
+            running[0] -= 1
+        return {'Overall Score': 50, 'for': expert and expert['name']}
+
+    monkeypatch.setattr(score, 'summary_match', fake_summary_match)
+    start = time.perf_counter()
+    results = match_experts({}, "Backend engineer", experts, max_workers=3, deadline=5)
+
+    assert time.perf_counter() - start < 0.6  # one at a time would take 0.95 s
+    assert peak[0] == 3
+    assert [expert for expert, _ in results] == experts
+
+
+def test_match_experts_skips_late_and_failed_experts(monkeypatch):
+    experts = [{'name': 'fast'}, {'name': 'slow'}, {'name': 'broken'}]
+
+    def fake_summary_match(candidate, job_description, expert):
+        if expert['name'] == 'slow':
+            time.sleep(1)
+        if expert['name'] == 'broken':
+            raise RuntimeError("provider error")
+        return {'Overall Score': 70}
+
+    monkeypatch.setattr(score, 'summary_match', fake_summary_match)
+    start = time.perf_counter()
+    results = match_experts({}, "Backend engineer", experts, max_workers=3, deadline=0.3)
+
+    assert time.perf_counter() - start < 0.8
+    assert [expert['name'] for expert, _ in results] == ['fast']
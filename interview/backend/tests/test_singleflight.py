@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_concurrent_identical_calls_run_once():
+    flights = SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+    runs = []
+
+    def compute():
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        return {'score': 80}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flights.do, 'key', compute)
+        started.wait(5)
+        followers = [executor.submit(flights.do, 'key', compute) for _ in range(3)]
+        wait_until(lambda: flights.stats()['shared'] == 3)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(runs) == 1
+    assert results[0] == ({'score': 80}, False)
+    assert all(result == ({'score': 80}, True) for result in results[1:])
+    assert flights.stats()['inFlight'] == 0
+    # Finished flights are not remembered
+    assert flights.do('key', lambda: 'again') == ('again', False)
+
+
+def test_errors_reach_every_caller():
+    flights = SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+
+    def broken():
+        started.set()
+        release.wait(5)
+        raise ConnectionError("provider unavailable")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, 'key', broken)
+        started.wait(5)
+        follower = executor.submit(flights.do, 'key', broken)
+        wait_until(lambda: flights.stats()['shared'] == 1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ConnectionError):
+                future.result()
+    assert flights.stats()['inFlight'] == 0
+
+
+def test_async_flight_survives_a_cancelled_leader():
+    flights = SingleFlight('test')
+    runs = []
+
+    async def compute():
+        runs.append(1)
+        await asyncio.sleep(0.1)
+        return 'parsed'
+
+    async def scenario():
+        leader = asyncio.ensure_future(flights.do_async('key', compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flights.do_async('key', compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == ('parsed', True)
+    assert len(runs) == 1
@@ -0,0 +1,47 @@
+import pytest
+from bson import ObjectId
+
+
+@pytest.fixture
+def applications(appmod):
+    appmod.application_collection.delete_many({'userId': 'paging-user'})
+    job_ids = [str(appmod.job_openings_collection.insert_one(
+        {'title': f'Role {i}', 'company': 'ISRO', 'location': 'Bengaluru'}
+    ).inserted_id) for i in range(4)]
+    # The last application points at a job that no longer exists
+    job_ids.append(str(ObjectId()))
+    ids = [str(appmod.application_collection.insert_one(
+        {'userId': 'paging-user', 'jobId': job_id, 'email': 'pager@example.com'}
+    ).inserted_id) for job_id in job_ids]
+    yield ids
+    appmod.application_collection.delete_many({'userId': 'paging-user'})
+
+
+def test_cursor_walks_every_application_once(client, applications):
+    seen, cursor = [], None
+    while True:
+        url = '/api/user-applications/paging-user?limit=2' + (f'&after={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.json
+        assert len(page) <= 2
+        seen.extend(page)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+        assert cursor == page[-1]['_id']
+
+    assert [a['_id'] for a in seen] == applications
+    assert [a['jobDetails']['title'] for a in seen[:4]] == ['Role 0', 'Role 1', 'Role 2', 'Role 3']
+    assert seen[-1]['jobDetails'] is None
+
+
+def test_page_size_is_capped_and_cursor_validated(appmod, client, applications, monkeypatch):
+    monkeypatch.setattr(appmod.Config, 'APPLICATIONS_PAGE_SIZE', 3)
+
+    response = client.get('/api/user-applications/paging-user?limit=50')
+    assert len(response.json) == 3
+    assert response.headers['X-Next-Cursor'] == applications[2]
+
+    assert len(client.get('/api/user-applications/paging-user?limit=0').json) == 1
+    assert client.get('/api/user-applications/paging-user?after=bogus').status_code == 400
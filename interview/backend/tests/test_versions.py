@@ -0,0 +1,17 @@
+from versions import GLOBAL_KEY
+
+
+def test_job_opening_body_matches_new_etag(appmod, client):
+    job_id = str(appmod.job_openings_collection.insert_one({'title': 'Backend Engineer'}).inserted_id)
+    # Scoring routes read jobs through the cache, so it may hold this one
+    assert appmod.load_job(job_id)['title'] == 'Backend Engineer'
+    first = client.get(f'/api/job-openings/{job_id}')
+
+    # A write made outside the API bumps the global version only
+    appmod.job_openings_collection.update_one({'_id': appmod.ObjectId(job_id)}, {'$set': {'title': 'Data Engineer'}})
+    appmod.data_versions.bump(GLOBAL_KEY)
+    second = client.get(f'/api/job-openings/{job_id}', headers={'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert second.json['title'] == 'Data Engineer'
@@ -0,0 +1,33 @@
+import re
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+# Fallback: words (split every 4 characters), numbers, punctuation, newlines
+# and runs of indentation, roughly as a BPE tokenizer would split them
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]{1,4}|\d{1,3}|[^\sA-Za-z\d]|\n|[ \t]{2,}")
+_VARIABLE_PATTERN = re.compile(r"\{[A-Za-z_]\w*\}")
+
+
+def count_tokens(text):
+    """
+    Approximate token count. Uses tiktoken's cl100k_base encoding when it is
+    installed, otherwise a regex estimate. Neither matches the Llama/Mixtral
+    tokenizers exactly; the numbers are for comparing prompts, not billing.
+    """
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+def prompt_sections(template, inputs):
+    """Token counts per prompt section: each input variable plus the template's own text."""
+    sections = {'template': count_tokens(_VARIABLE_PATTERN.sub('', template))}
+    for name, value in inputs.items():
+        sections[name] = count_tokens(str(value))
+    return sections
@@ -0,0 +1,91 @@
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import make_response, request
+from pymongo.errors import PyMongoError
+
+# Included in every validator; bumped for writes made outside the API
+GLOBAL_KEY = 'all'
+
+
+class DataVersions:
+    """
+    Version counters for groups of documents, used as HTTP validators.
+
+    Each key (e.g. "jobs", "job:<id>", "resume:<email>") is one small
+    document holding a counter and the time of the last change. Writers call
+    `bump` with every key their write affects, after the write. A response
+    that depends on some keys gets an ETag derived from their versions and a
+    Last-Modified of the latest change, so a client that already has it can
+    be answered 304 after one indexed `_id` lookup, without reading or
+    serializing the data itself.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def bump(self, *keys):
+        for key in keys:
+            self.collection.update_one(
+                {'_id': key}, {'$inc': {'version': 1}, '$currentDate': {'updatedAt': True}}, upsert=True
+            )
+
+    def validators(self, keys, variant=b''):
+        """
+        (etag, last_modified) for a response built from `keys`. `variant`
+        separates responses that share keys but differ otherwise, e.g. pages
+        of the same list. Keys never bumped count as version 0.
+        """
+        keys = sorted(set(keys) | {GLOBAL_KEY})
+        docs = {doc['_id']: doc for doc in self.collection.find({'_id': {'$in': keys}})}
+        digest = hashlib.sha1(variant)
+        for key in keys:
+            digest.update(f"\0{key}={docs.get(key, {}).get('version', 0)}".encode())
+        changed = [doc['updatedAt'] for doc in docs.values() if doc.get('updatedAt')]
+        last_modified = max(changed).replace(tzinfo=timezone.utc) if changed else None
+        return digest.hexdigest()[:20], last_modified
+
+
+def not_modified(etag, last_modified):
+    # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110)
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def conditional(versions, keys):
+    """
+    Flask view decorator for conditional GETs. `keys(*args, **kwargs)` gets
+    the view's arguments and returns the version keys its response depends
+    on, or None to serve the request unconditionally. A client whose cached
+    copy is current gets a 304 without the view running; otherwise 200
+    responses carry a weak ETag, Last-Modified and `Cache-Control: no-cache`
+    so the client revalidates on every poll.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            response_keys = keys(*args, **kwargs)
+            if response_keys is None:
+                return view(*args, **kwargs)
+            try:
+                etag, last_modified = versions.validators(response_keys, request.query_string)
+            except PyMongoError as e:
+                print(f"Version lookup failed, serving {request.path} unconditionally: {str(e)}")
+                return view(*args, **kwargs)
+
+            if not_modified(etag, last_modified):
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapped
+    return decorator
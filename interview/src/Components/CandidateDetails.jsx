@@ -75,6 +75,19 @@ const CandidateCard = ({ candidate, jobId, onSelect, onReject, onSchedule,darkMo
     const [scoreData, setScoreData] = useState(null);
     const [topExperts, setTopExperts] = useState([]);
     const [isLoading, setIsLoading] = useState(false);
+    const [resumeDetails, setResumeDetails] = useState(null);
+
+    const openDetails = async () => {
+        setIsModalOpen(true);
+        if (resumeDetails) return;
+        try {
+            // The candidate list only carries contact fields; load the full resume on demand
+            const response = await axios.get('http://localhost:5000/api/user-resume', { params: { email: candidate.email } });
+            setResumeDetails(response.data);
+        } catch (error) {
+            console.error('Error fetching resume details:', error);
+        }
+    };
 
     const fetchScoreData = async () => {
         setIsLoading(true);
@@ -151,7 +164,7 @@ const CandidateCard = ({ candidate, jobId, onSelect, onReject, onSchedule,darkMo
 
 
                 <div className="mt-4 flex justify-end space-x-2">
-                    <Button variant="outline" onClick={() => setIsModalOpen(true)}>View Details</Button>
+                    <Button variant="outline" onClick={openDetails}>View Details</Button>
                     {candidate.status === 'applied' ? (
                         <>
                             <Button variant="outline" onClick={() => onReject(candidate)}>
@@ -174,13 +187,13 @@ const CandidateCard = ({ candidate, jobId, onSelect, onReject, onSchedule,darkMo
                 <h2 className="text-2xl font-semibold mb-4 text-gray-900 dark:text-white">{candidate.name}</h2>
                 <ExpandableSection
                     title="Skills"
-                    content={<p className="text-gray-700 dark:text-gray-300">{candidate.resumeData?.skills.join(', ')}</p>}
+                    content={<p className="text-gray-700 dark:text-gray-300">{resumeDetails?.skills?.join(', ')}</p>}
                 />
                 <ExpandableSection
                     title="Experience"
                     content={
                         <div>
-                            {candidate.resumeData?.experiences.map((exp, index) => (
+                            {resumeDetails?.experiences?.map((exp, index) => (
                                 <div key={index} className="mb-4">
                                     <p className="font-medium text-gray-800 dark:text-gray-200">{exp.company}</p>
                                     <p className="text-sm text-gray-500 dark:text-gray-400">{exp.duration}</p>
@@ -200,7 +213,7 @@ const CandidateCard = ({ candidate, jobId, onSelect, onReject, onSchedule,darkMo
                     title="Projects"
                     content={
                         <div>
-                            {candidate.resumeData?.projects.map((project, index) => (
+                            {resumeDetails?.projects?.map((project, index) => (
                                 <div key={index} className="mb-4">
                                     <p className="font-medium text-gray-800 dark:text-gray-200">{project.name}</p>
                                     <ul className="list-disc pl-5 mt-2">
@@ -12,6 +12,20 @@ const Dashboard = () => {
   const [jobs, setJobs] = useState([]);
   const [appliedJobs, setAppliedJobs] = useState([]);
 
+  // Applications are paged; follow the X-Next-Cursor header until the last page
+  const fetchUserApplications = async () => {
+    const applications = [];
+    let after;
+    do {
+      const response = await axios.get(`http://localhost:5000/api/user-applications/${userId}`, {
+        params: after ? { after } : {}
+      });
+      applications.push(...response.data);
+      after = response.headers['x-next-cursor'];
+    } while (after);
+    return { data: applications };
+  };
+
   useEffect(() => {
     const fetchUserData = async () => {
       if (!userId || userId === 'undefined') {
@@ -33,7 +47,7 @@ const Dashboard = () => {
       try {
         const [jobsResponse, userApplicationsResponse] = await Promise.all([
           axios.get('http://localhost:5000/api/job-openings'),
-          axios.get(`http://localhost:5000/api/user-applications/${userId}`)
+          fetchUserApplications()
         ]);
 
         const allJobs = jobsResponse.data;
@@ -73,7 +87,7 @@ const Dashboard = () => {
         // Refetch jobs to update the lists
         const [jobsResponse, userApplicationsResponse] = await Promise.all([
           axios.get('http://localhost:5000/api/job-openings'),
-          axios.get(`http://localhost:5000/api/user-applications/${userId}`)
+          fetchUserApplications()
         ]);
 
         const allJobs = jobsResponse.data;